@@ -42,88 +42,134 @@ class BaseTranslatorAdmin(admin.ModelAdmin):
 
 @admin.register(OpenAITranslator)
 class OpenAITranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
-              "presence_penalty", "max_tokens"]
+    fields = ["name", "api_key", "base_url", "extra_credentials", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
+              "presence_penalty", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout", "hedge_percentile", "hedges_per_minute"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt",  "summary_prompt", "max_tokens", "base_url"]
 
 
 @admin.register(AzureAITranslator)
 class AzureAITranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "version", "model", "translate_prompt", "summary_prompt", "temperature", "top_p",
-              "frequency_penalty", "presence_penalty", "max_tokens"]
+    fields = ["name", "api_key", "base_url", "extra_credentials", "version", "model", "translate_prompt", "summary_prompt", "temperature", "top_p",
+              "frequency_penalty", "presence_penalty", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout", "hedge_percentile", "hedges_per_minute"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "version", "translate_prompt", "summary_prompt", "max_tokens", "base_url"]
 
 
 @admin.register(DeepLTranslator)
 class DeepLTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "server_url", "proxy", "max_characters"]
+    fields = ["name", "api_key", "server_url", "proxy", "max_characters", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
     list_display = ["name", "is_valid", "masked_api_key", "server_url", "proxy", "max_characters"]
 
 
 @admin.register(DeepLXTranslator)
 class DeepLXTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "deeplx_api", "interval", "max_characters"]
-    list_display = ["name", "is_valid", "deeplx_api", "interval", "max_characters"]
+    fields = ["name", "deeplx_api", "requests_per_minute", "units_per_minute", "max_characters", "max_concurrency",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
+    list_display = ["name", "is_valid", "deeplx_api", "requests_per_minute", "max_characters"]
 
 
 # @admin.register(DeepLWebTranslator)
 class DeepLWebTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "interval", "proxy", "max_characters"]
-    list_display = ["name", "is_valid", "interval", "proxy", "max_characters"]
+    fields = ["name", "requests_per_minute", "units_per_minute", "proxy", "max_characters", "max_concurrency",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
+    list_display = ["name", "is_valid", "requests_per_minute", "proxy", "max_characters"]
 
 @admin.register(MicrosoftTranslator)
 class MicrosoftTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "location", "endpoint", "max_characters"]
+    fields = ["name", "api_key", "location", "endpoint", "max_characters", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
     list_display = ["name", "is_valid", "masked_api_key", "location", "endpoint", "max_characters"]
 
 
 @admin.register(CaiYunTranslator)
 class CaiYunTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "token", "url", "max_characters"]
+    fields = ["name", "token", "url", "max_characters", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
     list_display = ["name", "is_valid", "masked_api_key", "url", "max_characters"]
 
 
 @admin.register(GeminiTranslator)
 class GeminiTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "top_k", "max_tokens",  "interval"]
-    list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens",  "interval"]
+    fields = ["name", "api_key", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "top_k", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
+    list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens", "requests_per_minute"]
 
 
 @admin.register(GoogleTranslateWebTranslator)
 class GoogleTranslateWebTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "base_url", "interval", "proxy", "max_characters"]
-    list_display = ["name", "is_valid", "base_url", "proxy", "interval", "max_characters"]
+    fields = ["name", "base_url", "requests_per_minute", "units_per_minute", "proxy", "max_characters", "max_concurrency",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
+    list_display = ["name", "is_valid", "base_url", "proxy", "requests_per_minute", "max_characters"]
 
 @admin.register(ClaudeTranslator)
 class ClaudeTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "top_k", "max_tokens",  "proxy"]
+    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "top_k", "max_tokens",  "proxy", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens", "base_url"]
 
 @admin.register(MoonshotAITranslator)
 class MoonshotAITranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
-              "presence_penalty", "max_tokens"]
+    fields = ["name", "api_key", "base_url", "extra_credentials", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
+              "presence_penalty", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout", "hedge_percentile", "hedges_per_minute"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens", "base_url"]
 
 @admin.register(TogetherAITranslator)
 class TogetherAITranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
-              "presence_penalty", "max_tokens"]
+    fields = ["name", "api_key", "base_url", "extra_credentials", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
+              "presence_penalty", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout", "hedge_percentile", "hedges_per_minute"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens", "base_url"]
 
 @admin.register(OpenRouterAITranslator)
 class OpenRouterAITranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
-              "presence_penalty", "max_tokens"]
+    fields = ["name", "api_key", "base_url", "extra_credentials", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
+              "presence_penalty", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout", "hedge_percentile", "hedges_per_minute"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens", "base_url"]
 
 @admin.register(GroqTranslator)
 class GroqTranslatorAdmin(BaseTranslatorAdmin):
-    fields = ["name", "api_key", "base_url", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
-              "presence_penalty", "max_tokens"]
+    fields = ["name", "api_key", "base_url", "extra_credentials", "model", "translate_prompt", "summary_prompt", "temperature", "top_p", "frequency_penalty",
+              "presence_penalty", "max_tokens", "max_concurrency", "requests_per_minute", "units_per_minute",
+              "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+              "breaker_threshold", "breaker_reset_timeout", "hedge_percentile", "hedges_per_minute"]
     list_display = ["name", "is_valid", "masked_api_key", "model", "translate_prompt", "summary_prompt", "max_tokens", "base_url"]
 
 
+class TranslatorChainStepInline(admin.TabularInline):
+    model = TranslatorChainStep
+    fields = ["order", "content_type", "object_id", "timeout"]
+    extra = 1
+
+
+@admin.register(TranslatorChain)
+class TranslatorChainAdmin(admin.ModelAdmin):
+    fields = ["name"]
+    list_display = ["name", "engines"]
+    inlines = [TranslatorChainStepInline]
+
+    def engines(self, obj):
+        return " > ".join(str(step.engine) for step in obj.chain_steps())
+
+    engines.short_description = 'Engines'
+
+
 if settings.DEBUG:
     @admin.register(Translated_Content)
     class Translated_ContentAdmin(admin.ModelAdmin):
@@ -139,5 +185,7 @@ if settings.DEBUG:
 
     @admin.register(TestTranslator)
     class TestTranslatorAdmin(BaseTranslatorAdmin):
-        fields = ["name", "translated_text", "max_characters", "interval"]
-        list_display = ["name", "is_valid", "translated_text", "max_characters", "interval"]
\ No newline at end of file
+        fields = ["name", "translated_text", "max_characters", "max_concurrency", "requests_per_minute", "units_per_minute",
+                  "max_retries", "retry_backoff", "retry_backoff_max", "adaptive_throttle",
+                  "breaker_threshold", "breaker_reset_timeout"]
+        list_display = ["name", "is_valid", "translated_text", "max_characters", "requests_per_minute"]
\ No newline at end of file
@@ -5,3 +5,7 @@ class TranslatorConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_text_translator"
     label = "translator"
+
+    def ready(self):
+        from . import signals
+        signals.connect(self)
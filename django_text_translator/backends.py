@@ -0,0 +1,210 @@
+import os
+import sqlite3
+import threading
+import time
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from .fields import decompress_text
+
+# Keeps `IN (...)` lookups below the bound-parameter limit of every database (SQLite: 999).
+LOOKUP_BATCH_SIZE = 500
+STORE_BATCH_SIZE = 500
+
+
+class TranslationBackend:
+    """
+    Storage of cached translations. Keys are the 8-byte Translated_Content hashes;
+    get/get_many return {'text', 'tokens', 'characters'} results, and set_many takes
+    {key: {'original', 'language', 'text', 'tokens', 'characters', 'namespace'}} entries.
+    """
+
+    def get(self, key: bytes):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys) -> dict:
+        raise NotImplementedError("subclasses of TranslationBackend must provide a get_many() method")
+
+    def set_many(self, entries: dict, overwrite: bool = False):
+        raise NotImplementedError("subclasses of TranslationBackend must provide a set_many() method")
+
+    def delete(self, key: bytes):
+        self.delete_many([key])
+
+    def delete_many(self, keys):
+        raise NotImplementedError("subclasses of TranslationBackend must provide a delete_many() method")
+
+    def touch_many(self, keys, when):
+        # Record that the keys were served; backends without access tracking ignore it.
+        pass
+
+    def iter_keys(self):
+        raise NotImplementedError("subclasses of TranslationBackend must provide an iter_keys() method")
+
+
+class ORMBackend(TranslationBackend):
+    """The Translated_Content table of the default database."""
+
+    @property
+    def model(self):
+        return apps.get_model("translator", "Translated_Content")
+
+    def get_many(self, keys) -> dict:
+        keys = [bytes(key) for key in keys]
+        found = {}
+        for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            rows = self.model.objects.filter(hash__in=keys[i:i + LOOKUP_BATCH_SIZE]).values_list(
+                "hash", "translated_content", "tokens", "characters")
+            for text_hash, translated_content, tokens, characters in rows:
+                found[bytes(text_hash)] = {
+                    'text': decompress_text(translated_content),
+                    'tokens': tokens,
+                    'characters': characters
+                }
+        return found
+
+    def set_many(self, entries: dict, overwrite: bool = False):
+        model = self.model
+        objs = [
+            model(
+                hash=key,
+                original_content=entry['original'],
+                translated_language=entry['language'],
+                translated_content=entry['text'],
+                tokens=entry.get('tokens') or 0,
+                characters=entry.get('characters') or 0,
+                namespace=entry.get('namespace') or "",
+            )
+            for key, entry in entries.items()
+        ]
+        if not objs:
+            return
+        if overwrite:
+            model.objects.bulk_create(
+                objs, batch_size=STORE_BATCH_SIZE, update_conflicts=True, unique_fields=["hash"],
+                update_fields=["original_content", "translated_language", "translated_content",
+                               "tokens", "characters", "namespace"])
+        else:
+            model.objects.bulk_create(objs, batch_size=STORE_BATCH_SIZE, ignore_conflicts=True)
+
+    def delete_many(self, keys):
+        keys = [bytes(key) for key in keys]
+        for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            self.model.objects.filter(hash__in=keys[i:i + LOOKUP_BATCH_SIZE]).delete()
+
+    def touch_many(self, keys, when):
+        keys = [bytes(key) for key in keys]
+        for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            self.model.objects.filter(hash__in=keys[i:i + LOOKUP_BATCH_SIZE]).update(last_hit=when)
+
+    def iter_keys(self):
+        for key in self.model.objects.values_list("hash", flat=True).iterator(chunk_size=10000):
+            yield bytes(key)
+
+
+class SQLiteBackend(TranslationBackend):
+    """
+    A local SQLite file in WAL mode, separate from the main database, for read-heavy deployments.
+    Every thread gets its own connection.
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self.connection as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "hash BLOB PRIMARY KEY, original TEXT NOT NULL, language TEXT NOT NULL, "
+                "translated TEXT NOT NULL, tokens INTEGER NOT NULL DEFAULT 0, "
+                "characters INTEGER NOT NULL DEFAULT 0, namespace TEXT NOT NULL DEFAULT '', "
+                "created REAL NOT NULL, last_hit REAL) WITHOUT ROWID"
+            )
+
+    @property
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, keys) -> dict:
+        keys = [bytes(key) for key in keys]
+        found = {}
+        for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            chunk = keys[i:i + LOOKUP_BATCH_SIZE]
+            rows = self.connection.execute(
+                f"SELECT hash, translated, tokens, characters FROM translations "
+                f"WHERE hash IN ({','.join('?' * len(chunk))})", chunk)
+            for text_hash, translated, tokens, characters in rows:
+                found[bytes(text_hash)] = {'text': translated, 'tokens': tokens, 'characters': characters}
+        return found
+
+    def set_many(self, entries: dict, overwrite: bool = False):
+        if not entries:
+            return
+        now = time.time()
+        verb = "INSERT OR REPLACE" if overwrite else "INSERT OR IGNORE"
+        with self.connection as conn:
+            conn.executemany(
+                f"{verb} INTO translations (hash, original, language, translated, tokens, characters, namespace, created, "
+                "last_hit) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(bytes(key), entry['original'], entry['language'], entry['text'], entry.get('tokens') or 0,
+                  entry.get('characters') or 0, entry.get('namespace') or "", now, now)
+                 for key, entry in entries.items()])
+
+    def delete_many(self, keys):
+        with self.connection as conn:
+            conn.executemany("DELETE FROM translations WHERE hash = ?", [(bytes(key),) for key in keys])
+
+    def touch_many(self, keys, when):
+        with self.connection as conn:
+            conn.executemany("UPDATE translations SET last_hit = ? WHERE hash = ?",
+                             [(when.timestamp(), bytes(key)) for key in keys])
+
+    def iter_keys(self):
+        for (key,) in self.connection.execute("SELECT hash FROM translations"):
+            yield bytes(key)
+
+
+BACKENDS = {
+    "orm": ORMBackend,
+    "sqlite": SQLiteBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> TranslationBackend:
+    """
+    The storage picked by TEXT_TRANSLATOR_BACKEND: "orm" (default), "sqlite" or the dotted path of a
+    TranslationBackend subclass, built with the keyword arguments of TEXT_TRANSLATOR_BACKEND_OPTIONS
+    (e.g. {"path": "/var/lib/translator/cache.sqlite3"} for "sqlite").
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                name = getattr(settings, "TEXT_TRANSLATOR_BACKEND", None) or "orm"
+                backend_class = BACKENDS[name] if name in BACKENDS else import_string(name)
+                _backend = backend_class(**getattr(settings, "TEXT_TRANSLATOR_BACKEND_OPTIONS", {}))
+    return _backend
+
+
+def uses_orm() -> bool:
+    return isinstance(get_backend(), ORMBackend)
+
+
+@receiver(setting_changed)
+def _reset_backend(setting, **kwargs):
+    global _backend
+    if setting.startswith("TEXT_TRANSLATOR_BACKEND"):
+        _backend = None
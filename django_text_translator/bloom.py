@@ -0,0 +1,274 @@
+import contextlib
+import logging
+import math
+import os
+import struct
+import threading
+import time
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+from .backends import get_backend
+
+MAGIC = b"TTBF1"
+HEADER = struct.Struct("<QIQQd")  # bits, hashes, count, capacity, error_rate
+DEFAULT_ERROR_RATE = 0.01
+DEFAULT_REBUILD_INTERVAL = 600
+# How often workers check whether TEXT_TRANSLATOR_BLOOM_PATH was rewritten.
+RELOAD_CHECK_INTERVAL = 10
+SCAN_CHUNK_SIZE = 10000
+
+
+class BloomFilter:
+    """
+    Bloom filter over 8-byte Translated_Content keys. The keys are already CityHash64 values,
+    so the k probe positions are derived from their two 32-bit halves (double hashing).
+    """
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE, bits: int = None, hashes: int = None):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.bits = bits or max(int(math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)), 8)
+        self.hashes = hashes or max(int(round(self.bits / self.capacity * math.log(2))), 1)
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, key: bytes):
+        h1 = int.from_bytes(key[:4], "little")
+        h2 = int.from_bytes(key[4:8], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, key: bytes):
+        self.add_many([key])
+
+    def add_many(self, keys):
+        with self._lock:
+            for key in keys:
+                for position in self._positions(bytes(key)):
+                    self.array[position >> 3] |= 1 << (position & 7)
+                self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        array = self.array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(bytes(key)))
+
+    def false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def stats(self) -> dict:
+        return {
+            'capacity': self.capacity,
+            'count': self.count,
+            'bits': self.bits,
+            'bytes': len(self.array),
+            'hashes': self.hashes,
+            'target_error_rate': self.error_rate,
+            'false_positive_rate': self.false_positive_rate(),
+        }
+
+    def save(self, path: str):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(self.bits, self.hashes, self.count, self.capacity, self.error_rate))
+            f.write(self.array)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a translation Bloom filter")
+            bits, hashes, count, capacity, error_rate = HEADER.unpack(f.read(HEADER.size))
+            bloom = cls(capacity, error_rate, bits, hashes)
+            bloom.array = bytearray(f.read())
+            bloom.count = count
+        if len(bloom.array) != (bits + 7) // 8:
+            raise ValueError(f"{path} is truncated")
+        return bloom
+
+    @classmethod
+    def from_db(cls, capacity: int, error_rate: float = DEFAULT_ERROR_RATE):
+        bloom = cls(capacity, error_rate)
+        batch = []
+        for key in get_backend().iter_keys():
+            batch.append(key)
+            if len(batch) >= SCAN_CHUNK_SIZE:
+                bloom.add_many(batch)
+                batch = []
+        bloom.add_many(batch)
+        return bloom
+
+
+class BloomTier:
+    """
+    Holds the process-wide filter. With TEXT_TRANSLATOR_BLOOM_PATH, the filter is the file written by
+    `build_translation_bloom` (run it periodically, e.g. from cron), reloaded whenever the file changes, so
+    that one builder scans the table instead of every worker. Without it, every process builds its own filter
+    by a background scan on first use and every TEXT_TRANSLATOR_BLOOM_REBUILD_INTERVAL seconds.
+    Until a filter is ready every key "might" exist, so nothing is skipped.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, path: str = None,
+                 rebuild_interval: float = DEFAULT_REBUILD_INTERVAL):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.path = path
+        self.rebuild_interval = rebuild_interval
+        self.filter = None
+        self.skipped = 0
+        self._built_at = 0
+        self._checked_at = 0
+        self._building = False
+        self._added_during_build = []
+        self._lock = threading.Lock()
+
+    def _maybe_rebuild(self):
+        now = time.time()
+        with self._lock:
+            if self._building:
+                return
+            if self.path:
+                if now - self._checked_at < RELOAD_CHECK_INTERVAL:
+                    return
+                self._checked_at = now
+                try:
+                    stale = os.path.getmtime(self.path) > self._built_at
+                except OSError:
+                    return
+                target = self._load
+            else:
+                stale = self.filter is None or (self.rebuild_interval and now - self._built_at > self.rebuild_interval)
+                target = self._build
+            if not stale:
+                return
+            self._building = True
+            self._added_during_build = []
+        threading.Thread(target=target, name="translator-bloom", daemon=True).start()
+
+    def _swap(self, bloom, built_at: float):
+        with self._lock:
+            bloom.add_many(self._added_during_build)
+            self.filter = bloom
+            self._built_at = built_at
+
+    def _load(self):
+        try:
+            built_at = os.path.getmtime(self.path)
+            self._swap(BloomFilter.load(self.path), built_at)
+            logging.info("Translation Bloom filter loaded from %s", self.path)
+        except (OSError, ValueError, struct.error) as e:
+            logging.error("BloomTier load ->%s", e)
+        finally:
+            with self._lock:
+                self._building = False
+                self._added_during_build = []
+
+    def _build(self):
+        try:
+            bloom = BloomFilter.from_db(self.capacity, self.error_rate)
+            self._swap(bloom, time.time())
+            logging.info("Translation Bloom filter built: %s", bloom.stats())
+        except Exception as e:
+            logging.error("BloomTier build ->%s", e)
+        finally:
+            with self._lock:
+                self._building = False
+                self._added_during_build = []
+            connections.close_all()
+
+    def might_contain(self, key: bytes) -> bool:
+        self._maybe_rebuild()
+        bloom = self.filter
+        if bloom is None or key in bloom:
+            return True
+        self.skipped += 1
+        return False
+
+    def add(self, key: bytes):
+        self.add_many([key])
+
+    def add_many(self, keys):
+        keys = list(keys)
+        with self._lock:
+            if self._building:
+                self._added_during_build.extend(keys)
+            bloom = self.filter
+        if bloom is not None:
+            bloom.add_many(keys)
+
+    def stats(self) -> dict:
+        stats = self.filter.stats() if self.filter is not None else {}
+        stats.update({'ready': self.filter is not None, 'skipped_queries': self.skipped})
+        return stats
+
+
+_tier = None
+_tier_lock = threading.Lock()
+_warned = False
+
+
+def get_bloom():
+    """
+    The Bloom filter tier, or None when TEXT_TRANSLATOR_BLOOM_CAPACITY is unset/0. It also needs the shared
+    cache tier (TEXT_TRANSLATOR_CACHE_ALIAS): a process's filter doesn't know the rows other processes wrote
+    since it was built, and those are only found, before the filter rules them out, in the shared cache.
+    """
+    global _tier, _warned
+    if _tier is None:
+        capacity = getattr(settings, "TEXT_TRANSLATOR_BLOOM_CAPACITY", 0)
+        if not capacity:
+            return None
+        if not getattr(settings, "TEXT_TRANSLATOR_CACHE_ALIAS", None):
+            if not _warned:
+                _warned = True
+                logging.warning("TEXT_TRANSLATOR_BLOOM_CAPACITY is ignored without TEXT_TRANSLATOR_CACHE_ALIAS: "
+                                "the filter would hide translations written by other processes")
+            return None
+        with _tier_lock:
+            if _tier is None:
+                _tier = BloomTier(
+                    capacity,
+                    getattr(settings, "TEXT_TRANSLATOR_BLOOM_ERROR_RATE", DEFAULT_ERROR_RATE),
+                    getattr(settings, "TEXT_TRANSLATOR_BLOOM_PATH", None),
+                    getattr(settings, "TEXT_TRANSLATOR_BLOOM_REBUILD_INTERVAL", DEFAULT_REBUILD_INTERVAL),
+                )
+    return _tier
+
+
+@contextlib.contextmanager
+def publishing():
+    """
+    For commands that write rows directly to the backend: yields a function taking their keys, which are
+    added to the filter file at TEXT_TRANSLATOR_BLOOM_PATH, saved on exit, so that the running processes
+    reload it instead of taking the new rows for misses until the next build_translation_bloom.
+    """
+    tier = get_bloom()
+    published = None
+    if tier is not None and tier.path and os.path.exists(tier.path):
+        try:
+            published = BloomFilter.load(tier.path)
+        except (OSError, ValueError, struct.error) as e:
+            logging.error("Bloom publishing load ->%s", e)
+    added = []
+
+    def publish(keys):
+        keys = list(keys)
+        if published is not None and keys:
+            published.add_many(keys)
+            added.append(len(keys))
+
+    yield publish
+    if added:
+        published.save(tier.path)
+
+
+@receiver(setting_changed)
+def _reset_bloom(setting, **kwargs):
+    global _tier, _warned
+    if setting.startswith("TEXT_TRANSLATOR_BLOOM_") or setting == "TEXT_TRANSLATOR_CACHE_ALIAS":
+        _tier = None
+        _warned = False
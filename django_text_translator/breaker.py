@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+from django.conf import settings
+from django.core.cache import caches
+from . import errors
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Failures that say the provider is down, as opposed to the input or the quota being the problem.
+OUTAGES = {errors.SERVER_ERROR, errors.TIMEOUT, errors.CONNECTION_ERROR}
+FAILURE_WINDOW = 300
+
+
+def is_outage(error) -> bool:
+    return bool(error) and error.get('type') in OUTAGES
+
+
+def open_error(engine, retry_after: float) -> dict:
+    return errors.make_error(errors.CIRCUIT_OPEN, f"{engine.__class__.__name__} {engine.pk} is failing, calls are "
+                             f"suspended for {retry_after:.0f}s", retry_after=retry_after)
+
+
+class CircuitBreaker:
+    """
+    Per-process breaker of one engine: `threshold` consecutive outages open it, calls then fail at once
+    for `reset_timeout` seconds, after which a single probe call is let through (half-open) to close it
+    again or re-open it.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probed_at = 0.0
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        """0 when a call may go through, else the seconds left before the next probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            now = time.monotonic()
+            # While half-open, another probe is allowed only if the last one never reported back.
+            since = self.opened_at if self.state == OPEN else self.probed_at
+            remaining = since + self.reset_timeout - now
+            if remaining > 0:
+                return remaining
+            self.state = HALF_OPEN
+            self.probed_at = now
+            return 0.0
+
+    def record(self, error):
+        with self._lock:
+            if is_outage(error):
+                self.failures += 1
+                if self.state == HALF_OPEN or self.failures >= self.threshold:
+                    self.state = OPEN
+                    self.opened_at = time.monotonic()
+                    logging.warning("CircuitBreaker->Open after %d failures: %s", self.failures, error.get('message'))
+            elif self.state != OPEN:
+                self.state = CLOSED
+                self.failures = 0
+
+    async def aretry_after(self) -> float:
+        return self.retry_after()
+
+    async def arecord(self, error):
+        self.record(error)
+
+    def stats(self) -> dict:
+        return {'state': self.state, 'failures': self.failures, 'threshold': self.threshold,
+                'reset_timeout': self.reset_timeout}
+
+
+class CacheCircuitBreaker:
+    """
+    CircuitBreaker shared by every process through a Django cache (TEXT_TRANSLATOR_BREAKER_CACHE):
+    the open state is a key expiring after reset_timeout, and `add` elects the process that probes.
+    If the cache fails, calls go through.
+    """
+
+    def __init__(self, alias: str, key: str, threshold: int = 5, reset_timeout: float = 30):
+        self.alias = alias
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.open_key = f"{key}:open"
+        self.tripped_key = f"{key}:tripped"
+        self.probe_key = f"{key}:probe"
+        self.failures_key = f"{key}:failures"
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def retry_after(self) -> float:
+        backend = self.backend
+        try:
+            values = backend.get_many([self.open_key, self.tripped_key])
+            if self.open_key in values:
+                return max(values[self.open_key] - time.time(), 0.01)
+            if self.tripped_key in values and not backend.add(self.probe_key, 1, timeout=self.reset_timeout):
+                return self.reset_timeout
+        except Exception as e:
+            logging.error("CacheCircuitBreaker ->%s", e)
+        return 0.0
+
+    async def aretry_after(self) -> float:
+        backend = self.backend
+        try:
+            values = await backend.aget_many([self.open_key, self.tripped_key])
+            if self.open_key in values:
+                return max(values[self.open_key] - time.time(), 0.01)
+            if self.tripped_key in values and not await backend.aadd(self.probe_key, 1, timeout=self.reset_timeout):
+                return self.reset_timeout
+        except Exception as e:
+            logging.error("CacheCircuitBreaker ->%s", e)
+        return 0.0
+
+    def record(self, error):
+        backend = self.backend
+        try:
+            if is_outage(error):
+                backend.add(self.failures_key, 0, timeout=FAILURE_WINDOW)
+                failures = backend.incr(self.failures_key)
+                if failures >= self.threshold or backend.get(self.tripped_key):
+                    self._open(backend, failures, error)
+            else:
+                backend.delete_many([self.failures_key, self.tripped_key, self.probe_key])
+        except Exception as e:
+            logging.error("CacheCircuitBreaker ->%s", e)
+
+    async def arecord(self, error):
+        backend = self.backend
+        try:
+            if is_outage(error):
+                await backend.aadd(self.failures_key, 0, timeout=FAILURE_WINDOW)
+                failures = await backend.aincr(self.failures_key)
+                if failures >= self.threshold or await backend.aget(self.tripped_key):
+                    await backend.aset(self.open_key, time.time() + self.reset_timeout, timeout=self.reset_timeout)
+                    await backend.aset(self.tripped_key, 1, timeout=None)
+                    await backend.adelete_many([self.probe_key, self.failures_key])
+                    logging.warning("CacheCircuitBreaker->Open after %d failures: %s", failures, error.get('message'))
+            else:
+                await backend.adelete_many([self.failures_key, self.tripped_key, self.probe_key])
+        except Exception as e:
+            logging.error("CacheCircuitBreaker ->%s", e)
+
+    def _open(self, backend, failures, error):
+        backend.set(self.open_key, time.time() + self.reset_timeout, timeout=self.reset_timeout)
+        backend.set(self.tripped_key, 1, timeout=None)
+        backend.delete_many([self.probe_key, self.failures_key])
+        logging.warning("CacheCircuitBreaker->Open after %d failures: %s", failures, error.get('message'))
+
+    def stats(self) -> dict:
+        values = self.backend.get_many([self.open_key, self.tripped_key, self.failures_key])
+        state = OPEN if self.open_key in values else HALF_OPEN if self.tripped_key in values else CLOSED
+        return {'state': state, 'failures': values.get(self.failures_key, 0), 'threshold': self.threshold,
+                'reset_timeout': self.reset_timeout}
+
+
+class BreakerRegistry:
+    """One breaker per engine row, shared by every caller of the process; None when the engine disables it."""
+
+    def __init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, engine):
+        if not engine.breaker_threshold:
+            return None
+        alias = getattr(settings, "TEXT_TRANSLATOR_BREAKER_CACHE", None)
+        key = (engine._meta.label, engine.pk, engine.breaker_threshold, engine.breaker_reset_timeout, alias)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                if alias:
+                    breaker = CacheCircuitBreaker(alias, f"translator:breaker:{engine._meta.label}:{engine.pk}",
+                                                  engine.breaker_threshold, engine.breaker_reset_timeout)
+                else:
+                    breaker = CircuitBreaker(engine.breaker_threshold, engine.breaker_reset_timeout)
+                self._breakers[key] = breaker
+        return breaker
+
+
+breakers = BreakerRegistry()
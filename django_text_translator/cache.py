@@ -0,0 +1,482 @@
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+from django.utils import timezone
+from .backends import get_backend
+from .snapshot import get_snapshot_store
+
+KEY_PREFIX = "translator:"
+DEFAULT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+DEFAULT_HIT_FLUSH_SIZE = 500
+DEFAULT_HIT_FLUSH_INTERVAL = 60
+DEFAULT_NEGATIVE_TTL = 300
+NEGATIVE_MAX_ENTRIES = 10000
+
+# Rough per-entry bookkeeping cost (key, dict, OrderedDict node) added to the text size.
+ENTRY_OVERHEAD = 64
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU keyed by the 8-byte Translated_Content hash,
+    bounded by entry count and (optionally) by the total size of the cached texts.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(value: dict) -> int:
+        return len((value.get('text') or '').encode('utf-8')) + ENTRY_OVERHEAD
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return dict(value)
+
+    def get_many(self, keys) -> dict:
+        found = {}
+        with self._lock:
+            for key in keys:
+                value = self._data.get(key)
+                if value is None:
+                    self.misses += 1
+                    continue
+                self._data.move_to_end(key)
+                self.hits += 1
+                found[key] = dict(value)
+        return found
+
+    def set(self, key, value: dict):
+        self.set_many({key: value})
+
+    def set_many(self, mapping: dict):
+        with self._lock:
+            for key, value in mapping.items():
+                size = self._sizeof(value)
+                if self.max_bytes and size > self.max_bytes:
+                    continue
+                if key in self._data:
+                    self._bytes -= self._sizes[key]
+                self._data[key] = dict(value)
+                self._data.move_to_end(key)
+                self._sizes[key] = size
+                self._bytes += size
+            self._evict()
+
+    def _evict(self):
+        while self._data and (len(self._data) > self.max_entries or
+                              (self.max_bytes and self._bytes > self.max_bytes)):
+            key, _ = self._data.popitem(last=False)
+            self._bytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                if self._data.pop(key, None) is not None:
+                    self._bytes -= self._sizes.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+class SharedCache:
+    """
+    Read-through/write-through tier stored in a Django CACHES alias (locmem, file, Redis...),
+    so that every worker process sees the translations any of them fetched or stored.
+    """
+
+    def __init__(self, alias: str, timeout: int = DEFAULT_CACHE_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def make_key(key: bytes) -> str:
+        return f"{KEY_PREFIX}{key.hex()}"
+
+    def get_many(self, keys) -> dict:
+        cache_keys = {self.make_key(key): key for key in keys}
+        if not cache_keys:
+            return {}
+        try:
+            values = self.backend.get_many(list(cache_keys))
+        except Exception as e:
+            logging.error("SharedCache get_many ->%s", e)
+            values = {}
+        found = {cache_keys[cache_key]: value for cache_key, value in values.items()}
+        self.hits += len(found)
+        self.misses += len(cache_keys) - len(found)
+        return found
+
+    def set_many(self, mapping: dict):
+        if not mapping:
+            return
+        try:
+            self.backend.set_many({self.make_key(key): value for key, value in mapping.items()}, timeout=self.timeout)
+        except Exception as e:
+            logging.error("SharedCache set_many ->%s", e)
+
+    def delete_many(self, keys):
+        try:
+            self.backend.delete_many([self.make_key(key) for key in keys])
+        except Exception as e:
+            logging.error("SharedCache delete_many ->%s", e)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'alias': self.alias,
+            'timeout': self.timeout,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class NamespaceStats:
+    """Hit/miss counters of Translated_Content lookups per cache namespace ("" is the default one)."""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def record(self, namespace, hits=0, misses=0):
+        with self._lock:
+            counter = self._counters.setdefault(namespace or "", [0, 0])
+            counter[0] += hits
+            counter[1] += misses
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                namespace: {
+                    'hits': hits,
+                    'misses': misses,
+                    'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+                }
+                for namespace, (hits, misses) in self._counters.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+
+
+namespace_stats = NamespaceStats()
+
+
+class HitTracker:
+    """
+    Collects the keys of cache hits and records them as used (Translated_Content.last_hit) in batches,
+    once TEXT_TRANSLATOR_HIT_FLUSH_SIZE keys are pending or every TEXT_TRANSLATOR_HIT_FLUSH_INTERVAL seconds.
+    The writes happen in a background thread, so that no lookup waits for them, and pending keys are
+    written when the process exits.
+    """
+
+    def __init__(self, flush_size: int = DEFAULT_HIT_FLUSH_SIZE, flush_interval: float = DEFAULT_HIT_FLUSH_INTERVAL):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+
+    def record(self, keys):
+        with self._lock:
+            self._pending.update(keys)
+            full = len(self._pending) >= self.flush_size
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="translator-hits", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+            # This thread's connection isn't closed by Django's request cycle.
+            connections.close_all()
+
+    def flush(self):
+        with self._lock:
+            keys = list(self._pending)
+            self._pending = set()
+        if not keys:
+            return
+        try:
+            get_backend().touch_many(keys, timezone.now())
+        except Exception as e:
+            logging.error("HitTracker flush ->%s", e)
+
+    def close(self):
+        """Stop the background thread and write the pending keys."""
+        self._closed = True
+        self._wake.set()
+        self.flush()
+
+class NegativeCache:
+    """
+    Short-lived memory of deterministic failures (unsupported language, content policy, 4xx), kept in process
+    and, when TEXT_TRANSLATOR_CACHE_ALIAS is set, in the shared cache, so that they are not retried for a while.
+    """
+
+    def __init__(self, ttl: int = DEFAULT_NEGATIVE_TTL):
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(key: bytes) -> str:
+        return f"{KEY_PREFIX}neg:{key.hex()}"
+
+    def _get_local(self, keys):
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._data.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        return dict(entry[1])
+                    del self._data[key]
+        return None
+
+    def get(self, keys):
+        error = self._get_local(keys)
+        shared = get_shared_cache()
+        if error is None and shared is not None:
+            try:
+                values = shared.backend.get_many([self.make_key(key) for key in keys])
+            except Exception as e:
+                logging.error("NegativeCache get ->%s", e)
+                values = {}
+            for value in values.values():
+                return value
+        return error
+
+    async def aget(self, keys):
+        error = self._get_local(keys)
+        shared = get_shared_cache()
+        if error is None and shared is not None:
+            try:
+                values = await shared.backend.aget_many([self.make_key(key) for key in keys])
+            except Exception as e:
+                logging.error("NegativeCache get ->%s", e)
+                values = {}
+            for value in values.values():
+                return value
+        return error
+
+    def _set_local(self, key, error: dict):
+        now = time.monotonic()
+        with self._lock:
+            if len(self._data) >= NEGATIVE_MAX_ENTRIES:
+                self._data = {k: v for k, v in self._data.items() if v[0] > now}
+            self._data[key] = (now + self.ttl, dict(error))
+
+    def set(self, key, error: dict):
+        self._set_local(key, error)
+        shared = get_shared_cache()
+        if shared is not None:
+            try:
+                shared.backend.set(self.make_key(key), error, timeout=self.ttl)
+            except Exception as e:
+                logging.error("NegativeCache set ->%s", e)
+
+    async def aset(self, key, error: dict):
+        self._set_local(key, error)
+        shared = get_shared_cache()
+        if shared is not None:
+            try:
+                await shared.backend.aset(self.make_key(key), error, timeout=self.ttl)
+            except Exception as e:
+                logging.error("NegativeCache set ->%s", e)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_lru = None
+_lru_lock = threading.Lock()
+_negative = None
+_shared = None
+_hit_tracker = None
+
+
+def get_lru():
+    """
+    The process-wide LRU tier, or None when TEXT_TRANSLATOR_LRU_MAX_ENTRIES is unset/0.
+    TEXT_TRANSLATOR_LRU_MAX_BYTES additionally bounds the (approximate) memory used.
+    """
+    global _lru
+    if _lru is None:
+        max_entries = getattr(settings, "TEXT_TRANSLATOR_LRU_MAX_ENTRIES", 0)
+        if not max_entries:
+            return None
+        with _lru_lock:
+            if _lru is None:
+                _lru = LRUCache(max_entries, getattr(settings, "TEXT_TRANSLATOR_LRU_MAX_BYTES", 0))
+    return _lru
+
+
+def get_shared_cache():
+    """
+    The cross-process tier backed by the TEXT_TRANSLATOR_CACHE_ALIAS cache, or None when unset.
+    Entries expire after TEXT_TRANSLATOR_CACHE_TIMEOUT seconds (None keeps them forever).
+    """
+    global _shared
+    if _shared is None:
+        alias = getattr(settings, "TEXT_TRANSLATOR_CACHE_ALIAS", None)
+        if not alias:
+            return None
+        _shared = SharedCache(alias, getattr(settings, "TEXT_TRANSLATOR_CACHE_TIMEOUT", DEFAULT_CACHE_TIMEOUT))
+    return _shared
+
+
+def get_many(keys) -> dict:
+    """
+    Look keys up in the LRU, then in the shared cache, then in the read-only snapshot store;
+    hits of the slower tiers are promoted to the LRU.
+    """
+    found = {}
+    missing = list(keys)
+    lru = get_lru()
+    if lru is not None and missing:
+        found.update(lru.get_many(missing))
+        missing = [key for key in missing if key not in found]
+    shared = get_shared_cache()
+    if shared is not None and missing:
+        from_shared = shared.get_many(missing)
+        if lru is not None and from_shared:
+            lru.set_many(from_shared)
+        found.update(from_shared)
+        missing = [key for key in missing if key not in from_shared]
+    store = get_snapshot_store()
+    if store is not None and missing:
+        from_snapshot = store.get_many(missing)
+        if lru is not None and from_snapshot:
+            lru.set_many(from_snapshot)
+        found.update(from_snapshot)
+    return found
+
+
+def set_many(mapping: dict):
+    if not mapping:
+        return
+    lru = get_lru()
+    if lru is not None:
+        lru.set_many(mapping)
+    shared = get_shared_cache()
+    if shared is not None:
+        shared.set_many(mapping)
+
+
+def delete_many(keys):
+    keys = list(keys)
+    if not keys:
+        return
+    lru = get_lru()
+    if lru is not None:
+        lru.delete_many(keys)
+    shared = get_shared_cache()
+    if shared is not None:
+        shared.delete_many(keys)
+
+
+def delete(key):
+    delete_many([key])
+
+
+def get_hit_tracker():
+    """The last_hit recorder, or None when TEXT_TRANSLATOR_TRACK_HITS is False."""
+    global _hit_tracker
+    if _hit_tracker is None:
+        if not getattr(settings, "TEXT_TRANSLATOR_TRACK_HITS", True):
+            return None
+        _hit_tracker = HitTracker(
+            getattr(settings, "TEXT_TRANSLATOR_HIT_FLUSH_SIZE", DEFAULT_HIT_FLUSH_SIZE),
+            getattr(settings, "TEXT_TRANSLATOR_HIT_FLUSH_INTERVAL", DEFAULT_HIT_FLUSH_INTERVAL),
+        )
+    return _hit_tracker
+
+
+def get_negative_cache():
+    """The failure cache, or None when TEXT_TRANSLATOR_NEGATIVE_CACHE_TTL is 0 (default: 300 seconds)."""
+    global _negative
+    if _negative is None:
+        ttl = getattr(settings, "TEXT_TRANSLATOR_NEGATIVE_CACHE_TTL", DEFAULT_NEGATIVE_TTL)
+        if not ttl:
+            return None
+        _negative = NegativeCache(ttl)
+    return _negative
+
+
+def record_lookup(namespace, hit_keys=(), misses=0):
+    namespace_stats.record(namespace, len(hit_keys), misses)
+    tracker = get_hit_tracker()
+    if tracker is not None and hit_keys:
+        tracker.record(hit_keys)
+
+
+@receiver(setting_changed)
+def _reset_tiers(setting, **kwargs):
+    global _lru, _shared, _hit_tracker, _negative
+    if setting.startswith("TEXT_TRANSLATOR_LRU_"):
+        _lru = None
+    elif setting == "TEXT_TRANSLATOR_NEGATIVE_CACHE_TTL":
+        _negative = None
+    elif setting.startswith("TEXT_TRANSLATOR_CACHE_"):
+        _shared = None
+    elif setting in ("TEXT_TRANSLATOR_TRACK_HITS", "TEXT_TRANSLATOR_HIT_FLUSH_SIZE",
+                     "TEXT_TRANSLATOR_HIT_FLUSH_INTERVAL"):
+        if _hit_tracker is not None:
+            _hit_tracker.close()
+        _hit_tracker = None
@@ -0,0 +1,254 @@
+import asyncio
+import inspect
+import logging
+import threading
+import weakref
+from urllib.parse import urlsplit
+import httpx
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+
+def http_limits() -> httpx.Limits:
+    """Connection pool limits of the HTTP clients, from the TEXT_TRANSLATOR_HTTP_* settings."""
+    return httpx.Limits(
+        max_connections=getattr(settings, "TEXT_TRANSLATOR_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS),
+        max_keepalive_connections=getattr(settings, "TEXT_TRANSLATOR_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                                          DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+        keepalive_expiry=getattr(settings, "TEXT_TRANSLATOR_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY),
+    )
+
+
+def http_timeout() -> httpx.Timeout:
+    """TEXT_TRANSLATOR_HTTP_TIMEOUT (default 10s) for reads/writes, TEXT_TRANSLATOR_HTTP_CONNECT_TIMEOUT (5s) to connect."""
+    return httpx.Timeout(
+        getattr(settings, "TEXT_TRANSLATOR_HTTP_TIMEOUT", DEFAULT_TIMEOUT),
+        connect=getattr(settings, "TEXT_TRANSLATOR_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT),
+    )
+
+
+def _http2_enabled() -> bool:
+    if not getattr(settings, "TEXT_TRANSLATOR_HTTP2", False):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logging.warning("TEXT_TRANSLATOR_HTTP2 is set but the 'h2' package is not installed, using HTTP/1.1")
+        return False
+    return True
+
+
+class SharedHTTP:
+    """
+    Keep-alive httpx clients shared by the plain-HTTP engines: one pooled client per proxy,
+    with an optional cap on concurrent requests per host (TEXT_TRANSLATOR_HTTP_MAX_CONNECTIONS_PER_HOST).
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._host_slots = {}
+        # httpx.AsyncClient and asyncio.Semaphore are bound to the event loop they were first used in.
+        self._loops = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build(client_class, proxy):
+        return client_class(
+            proxy=proxy or None,
+            http2=_http2_enabled(),
+            limits=http_limits(),
+            timeout=http_timeout(),
+            follow_redirects=True,
+        )
+
+    def client(self, proxy: str = None) -> httpx.Client:
+        client = self._clients.get(proxy)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(proxy)
+                if client is None:
+                    client = self._build(httpx.Client, proxy)
+                    self._clients[proxy] = client
+        return client
+
+    def _loop_state(self) -> dict:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None:
+                state = self._loops[loop] = {'clients': {}, 'host_slots': {}}
+        return state
+
+    def aclient(self, proxy: str = None) -> httpx.AsyncClient:
+        clients = self._loop_state()['clients']
+        client = clients.get(proxy)
+        if client is None:
+            client = clients[proxy] = self._build(httpx.AsyncClient, proxy)
+        return client
+
+    @staticmethod
+    def _per_host():
+        return getattr(settings, "TEXT_TRANSLATOR_HTTP_MAX_CONNECTIONS_PER_HOST", None)
+
+    def _host_slot(self, url: str):
+        per_host = self._per_host()
+        if not per_host:
+            return None
+        host = urlsplit(str(url)).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            with self._lock:
+                slot = self._host_slots.setdefault(host, threading.BoundedSemaphore(per_host))
+        return slot
+
+    def _async_host_slot(self, url: str):
+        per_host = self._per_host()
+        if not per_host:
+            return None
+        return self._loop_state()['host_slots'].setdefault(urlsplit(str(url)).netloc, asyncio.Semaphore(per_host))
+
+    def request(self, method: str, url: str, proxy: str = None, **kwargs) -> httpx.Response:
+        slot = self._host_slot(url)
+        if slot is None:
+            return self.client(proxy).request(method, url, **kwargs)
+        with slot:
+            return self.client(proxy).request(method, url, **kwargs)
+
+    async def arequest(self, method: str, url: str, proxy: str = None, **kwargs) -> httpx.Response:
+        slot = self._async_host_slot(url)
+        if slot is None:
+            return await self.aclient(proxy).request(method, url, **kwargs)
+        async with slot:
+            return await self.aclient(proxy).request(method, url, **kwargs)
+
+    def reset(self):
+        with self._lock:
+            self._clients = {}
+            self._host_slots = {}
+            self._loops = weakref.WeakKeyDictionary()
+
+
+shared_http = SharedHTTP()
+
+
+def http_request(method: str, url: str, proxy: str = None, **kwargs) -> httpx.Response:
+    return shared_http.request(method, url, proxy=proxy, **kwargs)
+
+
+async def ahttp_request(method: str, url: str, proxy: str = None, **kwargs) -> httpx.Response:
+    return await shared_http.arequest(method, url, proxy=proxy, **kwargs)
+
+
+def _close(client):
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        logging.error("ClientRegistry close ->%s", e)
+
+
+async def _aclose(client):
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logging.error("ClientRegistry close ->%s", e)
+
+
+class ClientRegistry:
+    """
+    Process-wide cache of SDK/HTTP clients, one set per engine row, so that connection pools and TLS
+    sessions survive between translate() calls. The set is tied to the engine's config_fingerprint():
+    the first call that sees a different one (after the engine was edited, in any process) replaces
+    the set and closes the old clients. Clients of deleted engines are closed too. A request still
+    running on a closed client fails with a connection error and is retried on the new one.
+    Async clients (aget) are kept per event loop, as they can't be shared between loops.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._loops = weakref.WeakKeyDictionary()
+        self._closing = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _engine_key(engine):
+        return engine._meta.label, engine.pk
+
+    @staticmethod
+    def _current(entries: dict, engine):
+        """The clients of `engine` in `entries` for its current configuration, and the ones it replaced."""
+        key = ClientRegistry._engine_key(engine)
+        fingerprint = engine.config_fingerprint()
+        entry = entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1], {}
+        entries[key] = (fingerprint, {})
+        return entries[key][1], entry[1] if entry is not None else {}
+
+    def get(self, engine, factory, name: str = "default"):
+        with self._lock:
+            clients, replaced = self._current(self._clients, engine)
+            client = clients.get(name)
+            if client is None:
+                client = clients[name] = factory()
+        for old in replaced.values():
+            _close(old)
+        return client
+
+    def aget(self, engine, factory, name: str = "default"):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entries = self._loops.get(loop)
+            if entries is None:
+                entries = self._loops[loop] = {}
+        clients, replaced = self._current(entries, engine)
+        client = clients.get(name)
+        if client is None:
+            client = clients[name] = factory()
+        for old in replaced.values():
+            # Kept until closed: the event loop only holds weak references to its tasks.
+            task = loop.create_task(_aclose(old))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return client
+
+    def invalidate(self, engine):
+        """Drop the clients of a deleted engine; the sync ones are closed."""
+        engine_key = self._engine_key(engine)
+        with self._lock:
+            entry = self._clients.pop(engine_key, None)
+            # Async clients can only be closed from their own event loop, which isn't running here.
+            for entries in self._loops.values():
+                entries.pop(engine_key, None)
+        if entry is not None:
+            for client in entry[1].values():
+                _close(client)
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self._loops = weakref.WeakKeyDictionary()
+
+
+registry = ClientRegistry()
+
+
+@receiver(setting_changed)
+def _reset_clients(setting, **kwargs):
+    if setting.startswith("TEXT_TRANSLATOR_HTTP"):
+        shared_http.reset()
+        registry.clear()
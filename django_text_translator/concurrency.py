@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from django.db import connections
+
+
+class EngineSlots:
+    """
+    Caps the requests in flight per engine row (TranslatorEngine.max_concurrency) across all callers
+    of the process: a semaphore per engine for threads, and one per engine and event loop for tasks.
+    """
+
+    def __init__(self):
+        self._semaphores = {}
+        self._loops = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(engine):
+        return engine._meta.label, engine.pk, engine.max_concurrency
+
+    def get(self, engine) -> threading.BoundedSemaphore:
+        key = self._key(engine)
+        with self._lock:
+            semaphore = self._semaphores.get(key)
+            if semaphore is None:
+                semaphore = self._semaphores[key] = threading.BoundedSemaphore(max(engine.max_concurrency, 1))
+        return semaphore
+
+    def aget(self, engine) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._loops.get(loop)
+            if semaphores is None:
+                semaphores = self._loops[loop] = {}
+        key = self._key(engine)
+        semaphore = semaphores.get(key)
+        if semaphore is None:
+            semaphore = semaphores[key] = asyncio.Semaphore(max(engine.max_concurrency, 1))
+        return semaphore
+
+
+slots = EngineSlots()
+
+
+def run_in_thread(function, *args, name: str = "translator") -> Future:
+    """
+    Call function(*args) in a new daemon thread. For calls the caller may stop waiting for: an abandoned call
+    keeps running, and in a shared pool it would hold a worker that the next calls then queue behind.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(function(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            connections.close_all()
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
@@ -0,0 +1,150 @@
+import contextvars
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import cityhash
+from . import errors
+from .breaker import is_outage
+
+# Consecutive outages or rejected credentials that take a member out of the pool for the engine's breaker timeout.
+EJECT_AFTER = 3
+# Weight of the latest call in a member's latency average.
+LATENCY_WEIGHT = 0.2
+
+# The member a provider request of the current thread/task goes to, set by the guarded decorator.
+current = contextvars.ContextVar("translator_endpoint", default=None)
+
+
+def current_member():
+    return current.get()
+
+
+def is_rejected(error) -> bool:
+    # The member's key or endpoint was refused, which says nothing about the input.
+    return bool(error) and error.get('status') in (401, 403)
+
+
+def parse_credentials(text: str, default_url: str) -> list:
+    """(api_key, base_url) pairs from lines of "api_key" or "api_key base_url"; blank lines and # comments are skipped."""
+    credentials = []
+    for line in (text or "").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            api_key, _, base_url = line.partition(" ")
+            credentials.append((api_key, base_url.strip() or default_url))
+    return credentials
+
+
+class PoolMember:
+    def __init__(self, api_key: str, base_url: str):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.id = cityhash.CityHash64(f"{api_key}|{base_url}").to_bytes(8, byteorder='little').hex()
+        self.inflight = 0
+        self.latency = None
+        self.failures = 0
+        self.rate_limited = 0
+        self.available_at = 0.0
+        self.calls = 0
+
+    def __str__(self):
+        return f"{self.api_key[:3]}...{self.api_key[-3:]}@{urlsplit(self.base_url).netloc}"
+
+
+class EndpointPool:
+    """
+    The API keys/endpoints of one engine. Each call goes to the available member with the lowest
+    (requests in flight + 1) * average latency, so untried and fast members are preferred and a slow one
+    gets fewer calls. A rate-limited member sits out its Retry-After (or an exponential backoff), and one
+    failing EJECT_AFTER times in a row (outage, or a 401/403) sits out `eject_timeout` seconds; when
+    every member is out, the one due back first is used.
+    """
+
+    def __init__(self, credentials, eject_timeout: float = 30, backoff: float = 1.0, backoff_max: float = 60.0):
+        self.members = [PoolMember(api_key, base_url) for api_key, base_url in credentials]
+        self.eject_timeout = eject_timeout
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+
+    def _score(self, member: PoolMember, fallback: float) -> float:
+        latency = member.latency if member.latency is not None else fallback
+        return (member.inflight + 1) * latency
+
+    def available(self) -> bool:
+        now = time.monotonic()
+        return any(member.available_at <= now for member in self.members)
+
+    def acquire(self) -> PoolMember:
+        with self._lock:
+            now = time.monotonic()
+            available = [member for member in self.members if member.available_at <= now]
+            if available:
+                # Members without a measured latency yet are tried first, the least busy of them first.
+                scores = [(self._score(member, 0.0), member.inflight) for member in available]
+                best = min(scores)
+                member = random.choice([member for member, score in zip(available, scores) if score == best])
+            else:
+                member = min(self.members, key=lambda member: member.available_at)
+            member.inflight += 1
+            member.calls += 1
+            return member
+
+    def release(self, member: PoolMember, result: dict = None, started: float = None):
+        """Give back a member taken by acquire(), with the result of its call (None if it was interrupted)."""
+        error = result.get('error') if result else None
+        with self._lock:
+            member.inflight -= 1
+            if result is None:
+                return
+            now = time.monotonic()
+            if not error:
+                if started is not None:
+                    elapsed = now - started
+                    member.latency = elapsed if member.latency is None else \
+                        (1 - LATENCY_WEIGHT) * member.latency + LATENCY_WEIGHT * elapsed
+                member.failures = 0
+                member.rate_limited = 0
+            elif error['type'] == errors.RATE_LIMITED:
+                member.rate_limited += 1
+                pause = error.get('retry_after') or min(self.backoff * 2 ** (member.rate_limited - 1), self.backoff_max)
+                member.available_at = max(member.available_at, now + pause)
+                logging.warning("EndpointPool->%s rate limited, skipped for %.1fs", member, pause)
+            elif is_outage(error) or is_rejected(error):
+                member.failures += 1
+                # A member back from ejection is ejected again by its next failure.
+                if member.failures >= EJECT_AFTER:
+                    member.available_at = now + self.eject_timeout
+                    logging.warning("EndpointPool->%s ejected for %.0fs after %d failures: %s", member,
+                                    self.eject_timeout, member.failures, error.get('message'))
+
+    def stats(self) -> list:
+        now = time.monotonic()
+        return [{'member': str(member), 'inflight': member.inflight, 'calls': member.calls,
+                 'latency': member.latency, 'failures': member.failures,
+                 'available_in': max(member.available_at - now, 0.0)} for member in self.members]
+
+
+class PoolRegistry:
+    """One EndpointPool per engine row and configuration; None for engines with a single key/endpoint."""
+
+    def __init__(self):
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def get(self, engine):
+        credentials = engine.credentials()
+        if len(credentials) < 2:
+            return None
+        key = (engine._meta.label, engine.pk, engine.config_fingerprint())
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = EndpointPool(credentials, engine.breaker_reset_timeout,
+                                                       engine.retry_backoff, engine.retry_backoff_max)
+        return pool
+
+
+pools = PoolRegistry()
@@ -0,0 +1,78 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+# Kinds of the structured `error` field of translate() results.
+UNSUPPORTED_LANGUAGE = "unsupported_language"
+CONTENT_POLICY = "content_policy"
+CLIENT_ERROR = "client_error"
+RATE_LIMITED = "rate_limited"
+SERVER_ERROR = "server_error"
+TIMEOUT = "timeout"
+CONNECTION_ERROR = "connection_error"
+CIRCUIT_OPEN = "circuit_open"
+UNKNOWN = "unknown"
+
+# Failures that will happen again for the same input, so retrying them only burns requests.
+DETERMINISTIC = {UNSUPPORTED_LANGUAGE, CONTENT_POLICY, CLIENT_ERROR}
+# Transient failures, worth retrying after a pause.
+RETRYABLE = {RATE_LIMITED, SERVER_ERROR, TIMEOUT, CONNECTION_ERROR}
+
+
+def make_error(kind: str, message: str, status: int = None, retry_after: float = None) -> dict:
+    return {'type': kind, 'message': message, 'status': status, 'retry_after': retry_after}
+
+
+def _status_code(exc):
+    # `code` is the HTTP status of google.api_core errors (Gemini).
+    for attr in ("status_code", "http_status_code", "code"):
+        status = getattr(exc, attr, None)
+        if isinstance(status, int):
+            return int(status)
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(exc):
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def from_exception(exc: Exception) -> dict:
+    """Classify an exception raised by an engine's client (httpx, openai, anthropic, deepl...)."""
+    status = _status_code(exc)
+    message = str(exc)
+    if status == 429:
+        return make_error(RATE_LIMITED, message, status, _retry_after(exc))
+    if status in (408, 504) or "timeout" in type(exc).__name__.lower() or isinstance(exc, TimeoutError):
+        return make_error(TIMEOUT, message, status)
+    if status is not None and status >= 500:
+        return make_error(SERVER_ERROR, message, status, _retry_after(exc))
+    if status is not None and status >= 400:
+        return make_error(CLIENT_ERROR, message, status)
+    if "connect" in type(exc).__name__.lower() or isinstance(exc, ConnectionError):
+        return make_error(CONNECTION_ERROR, message, status)
+    return make_error(UNKNOWN, message, status)
+
+
+def is_deterministic(error) -> bool:
+    return bool(error) and error.get('type') in DETERMINISTIC
+
+
+def is_retryable(error) -> bool:
+    return bool(error) and error.get('type') in RETRYABLE
@@ -0,0 +1,56 @@
+import base64
+import zlib
+from django.conf import settings
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+# Prefix of compressed values. TEXT columns can't hold raw bytes on every backend (Postgres rejects NUL),
+# so the zlib stream is stored base85-encoded behind a control character that never starts real content.
+COMPRESSED_MARKER = "\x1bz:"
+
+
+def compress_text(text: str) -> str:
+    return COMPRESSED_MARKER + base64.b85encode(zlib.compress(text.encode("utf-8"))).decode("ascii")
+
+
+def decompress_text(value):
+    if isinstance(value, str) and value.startswith(COMPRESSED_MARKER):
+        return zlib.decompress(base64.b85decode(value[len(COMPRESSED_MARKER):])).decode("utf-8")
+    return value
+
+
+def is_compressed(value) -> bool:
+    return isinstance(value, str) and value.startswith(COMPRESSED_MARKER)
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    # Values are loaded as stored and only inflated the first time the attribute is read.
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if is_compressed(value):
+            value = decompress_text(value)
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    # Defining __set__ makes this a data descriptor, so reads go through __get__ even once loaded.
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedTextField(models.TextField):
+    """
+    A TextField that zlib-compresses values of at least TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH characters
+    when they are written (disabled when the setting is None). Plain and compressed rows can coexist.
+    """
+    descriptor_class = CompressedTextDescriptor
+
+    def get_db_prep_save(self, value, connection):
+        value = super().get_db_prep_save(value, connection)
+        min_length = getattr(settings, "TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH", None)
+        if min_length is not None and isinstance(value, str) and len(value) >= min_length and not is_compressed(value):
+            compressed = compress_text(value)
+            if len(compressed) < len(value):
+                return compressed
+        return value
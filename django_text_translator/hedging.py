@@ -0,0 +1,165 @@
+import asyncio
+import collections
+import contextvars
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+from .concurrency import run_in_thread
+from .ratelimit import TokenBucket
+
+# Latencies kept per engine, and how many are needed before hedging starts.
+SAMPLES = 200
+MIN_SAMPLES = 20
+
+# Set by the request being hedged once it goes out to the provider, which starts the hedge delay.
+_sent = contextvars.ContextVar("translator_hedge_sent", default=None)
+
+
+def sending():
+    """Called by the guarded decorator right before the provider request, after the rate-limit wait."""
+    event = _sent.get()
+    if event is not None:
+        event.set()
+
+
+class Hedger:
+    """
+    Hedged requests for one engine: a request still running `percentile` of the engine's recent provider
+    latencies after it was sent gets a duplicate, and the first successful answer wins. With an endpoint
+    pool the duplicate goes to another member. At most `per_minute` duplicates are sent per minute.
+    A losing async request is cancelled. A sync request that may be hedged runs in a thread of its own,
+    so that the caller can stop waiting for it; the loser can't be interrupted and finishes there.
+    """
+
+    def __init__(self, percentile: int, per_minute: int):
+        self.percentile = percentile
+        self.budget = TokenBucket(per_minute)
+        self.latencies = collections.deque(maxlen=SAMPLES)
+        self.hedges = 0
+        self.wins = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float):
+        """The duration of a successful provider call, rate-limit waits excluded."""
+        with self._lock:
+            self.latencies.append(latency)
+
+    def delay(self):
+        """Seconds after which a request is hedged, or None until enough latencies were seen."""
+        with self._lock:
+            if len(self.latencies) < MIN_SAMPLES:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) * self.percentile // 100, len(ordered) - 1)]
+
+    def _plan(self):
+        # The hedge delay, or None when this request won't be hedged (not enough latencies, or no budget left).
+        delay = self.delay()
+        if delay is None or self.budget.tokens() < 1:
+            return None
+        return delay
+
+    def _hedge(self, delay: float) -> bool:
+        if not self.budget.take():
+            return False
+        with self._lock:
+            self.hedges += 1
+        logging.info("Hedger->No answer after %.2fs, sending a duplicate request", delay)
+        return True
+
+    def _won(self, future, primary):
+        if future is not primary:
+            with self._lock:
+                self.wins += 1
+
+    @staticmethod
+    def _call(attempt, sent):
+        token = _sent.set(sent)
+        try:
+            return attempt()
+        finally:
+            # Also set when the attempt ends without a provider request (an exception...).
+            sent.set()
+            _sent.reset(token)
+
+    @staticmethod
+    async def _acall(attempt, sent):
+        # Tasks run in a copy of the context, so the variable is only seen by this attempt.
+        _sent.set(sent)
+        try:
+            return await attempt()
+        finally:
+            sent.set()
+
+    def run(self, attempt):
+        """attempt() (one provider request returning a result dict), hedged."""
+        delay = self._plan()
+        if delay is None:
+            return attempt()
+        sent = threading.Event()
+        primary = run_in_thread(self._call, attempt, sent, name="translator-hedge")
+        sent.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._hedge(delay):
+            return primary.result()
+        pending = {primary, run_in_thread(self._call, attempt, threading.Event(), name="translator-hedge")}
+        result = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not result.get('error'):
+                    self._won(future, primary)
+                    return result
+        return result
+
+    async def arun(self, attempt):
+        """run() for a coroutine function; the request that loses is cancelled."""
+        delay = self._plan()
+        if delay is None:
+            return await attempt()
+        sent = asyncio.Event()
+        primary = asyncio.ensure_future(self._acall(attempt, sent))
+        pending = {primary}
+        try:
+            await sent.wait()
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done or not self._hedge(delay):
+                return await primary
+            pending.add(asyncio.ensure_future(self._acall(attempt, asyncio.Event())))
+            result = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if not result.get('error'):
+                        self._won(task, primary)
+                        return result
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        return {'samples': len(self.latencies), 'delay': self.delay(), 'hedges': self.hedges, 'wins': self.wins}
+
+
+class HedgerRegistry:
+    """One Hedger per engine row and settings, shared by every caller of the process; None when hedging is off."""
+
+    def __init__(self):
+        self._hedgers = {}
+        self._lock = threading.Lock()
+
+    def get(self, engine):
+        if not engine.hedge_percentile or not engine.hedges_per_minute:
+            return None
+        key = (engine._meta.label, engine.pk, engine.hedge_percentile, engine.hedges_per_minute)
+        with self._lock:
+            hedger = self._hedgers.get(key)
+            if hedger is None:
+                hedger = self._hedgers[key] = Hedger(engine.hedge_percentile, engine.hedges_per_minute)
+        return hedger
+
+
+hedgers = HedgerRegistry()
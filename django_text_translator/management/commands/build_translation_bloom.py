@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_text_translator.bloom import BloomFilter, DEFAULT_ERROR_RATE
+from django_text_translator.models import Translated_Content
+
+
+class Command(BaseCommand):
+    help = "Build the Bloom filter of cached translation keys and save it to TEXT_TRANSLATOR_BLOOM_PATH."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="File to write (default: TEXT_TRANSLATOR_BLOOM_PATH).")
+        parser.add_argument("--capacity", type=int,
+                            help="Expected number of keys (default: TEXT_TRANSLATOR_BLOOM_CAPACITY, "
+                                 "or twice the current row count).")
+        parser.add_argument("--error-rate", type=float,
+                            help="Target false-positive rate (default: TEXT_TRANSLATOR_BLOOM_ERROR_RATE or 0.01).")
+
+    def handle(self, *args, **options):
+        path = options["output"] or getattr(settings, "TEXT_TRANSLATOR_BLOOM_PATH", None)
+        if not path:
+            raise CommandError("Give --output or set TEXT_TRANSLATOR_BLOOM_PATH.")
+        capacity = (options["capacity"] or getattr(settings, "TEXT_TRANSLATOR_BLOOM_CAPACITY", 0)
+                    or Translated_Content.objects.count() * 2)
+        error_rate = options["error_rate"] or getattr(settings, "TEXT_TRANSLATOR_BLOOM_ERROR_RATE", DEFAULT_ERROR_RATE)
+
+        bloom = BloomFilter.from_db(capacity, error_rate)
+        bloom.save(path)
+        stats = bloom.stats()
+        self.stdout.write(self.style.SUCCESS(
+            f"Saved {stats['count']} keys to {path} ({stats['bytes']} bytes, {stats['hashes']} hashes, "
+            f"estimated false-positive rate {stats['false_positive_rate']:.4%})."))
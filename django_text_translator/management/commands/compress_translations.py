@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.db.models import Case, Value, When
+from django_text_translator.backends import uses_orm
+from django_text_translator.fields import compress_text, decompress_text, is_compressed
+from django_text_translator.models import Translated_Content
+
+FIELDS = ("original_content", "translated_content")
+
+
+class Command(BaseCommand):
+    help = "Compress (or, with --decompress, inflate) the stored content of existing cached translations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--decompress", action="store_true",
+                            help="Store every row uncompressed again.")
+        parser.add_argument("--min-length", type=int,
+                            help="Only compress values of at least this many characters "
+                                 "(default: TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH, or 0).")
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="Rows read and written per batch (default: 500).")
+
+    def handle(self, *args, **options):
+        if not uses_orm():
+            raise CommandError("This command works on the Translated_Content table and needs TEXT_TRANSLATOR_BACKEND = \"orm\".")
+        decompress = options["decompress"]
+        if decompress and getattr(settings, "TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH", None) is not None:
+            raise CommandError("Unset TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH first, "
+                               "otherwise the rows are compressed again when they are written.")
+        min_length = options["min_length"]
+        if min_length is None:
+            min_length = getattr(settings, "TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH", None) or 0
+        batch_size = options["batch_size"]
+
+        converted = 0
+        last_hash = None
+        while True:
+            rows = Translated_Content.objects.order_by("hash")
+            if last_hash is not None:
+                rows = rows.filter(hash__gt=last_hash)
+            rows = list(rows.values_list("hash", *FIELDS)[:batch_size])
+            if not rows:
+                break
+            last_hash = rows[-1][0]
+
+            changed = {}
+            for text_hash, *values in rows:
+                new_values = [self.convert(value, decompress, min_length) for value in values]
+                if new_values != values:
+                    changed[bytes(text_hash)] = new_values
+            if changed:
+                # bulk_update() would read the values back through the lazily-inflating attributes,
+                # so the CASE statement it generates is built here from the raw values instead.
+                Translated_Content.objects.filter(hash__in=list(changed)).update(**{
+                    field: Case(
+                        *[When(hash=text_hash, then=Value(values[i], output_field=models.TextField()))
+                          for text_hash, values in changed.items()],
+                        output_field=models.TextField(),
+                    )
+                    for i, field in enumerate(FIELDS)
+                })
+                converted += len(changed)
+            self.stdout.write(f"Converted {converted} rows...")
+
+        self.stdout.write(self.style.SUCCESS(f"Converted {converted} cached translations."))
+
+    @staticmethod
+    def convert(value, decompress, min_length):
+        if decompress:
+            return decompress_text(value)
+        if is_compressed(value) or len(value) < min_length:
+            return value
+        compressed = compress_text(value)
+        return compressed if len(compressed) < len(value) else value
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from django_text_translator.backends import uses_orm
+from django_text_translator import snapshot
+
+
+class Command(BaseCommand):
+    help = "Write every cached translation to a compressed snapshot file (or an mmap-able indexed one)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Snapshot file to write.")
+        parser.add_argument("--indexed", action="store_true",
+                            help="Write an uncompressed, indexed snapshot usable as TEXT_TRANSLATOR_SNAPSHOT_PATH.")
+        parser.add_argument("--batch-size", type=int, default=snapshot.READ_BATCH_SIZE,
+                            help=f"Rows read per query (default: {snapshot.READ_BATCH_SIZE}).")
+
+    def handle(self, *args, **options):
+        if not uses_orm():
+            raise CommandError("This command works on the Translated_Content table and needs TEXT_TRANSLATOR_BACKEND = \"orm\".")
+        rows = snapshot.iter_rows(options["batch_size"])
+        if options["indexed"]:
+            count = snapshot.write_indexed(options["path"], rows)
+        else:
+            count = snapshot.write_stream(options["path"], rows)
+        self.stdout.write(self.style.SUCCESS(f"Dumped {count} cached translations to {options['path']}."))
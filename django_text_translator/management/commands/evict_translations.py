@@ -0,0 +1,88 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django_text_translator.backends import uses_orm
+from django_text_translator import cache
+from django_text_translator.models import Translated_Content
+
+
+class Command(BaseCommand):
+    help = "Delete cached translations by age, by last use or above a per-language row cap, in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=int, metavar="DAYS",
+                            help="Delete rows created more than DAYS days ago.")
+        parser.add_argument("--unused-for", type=int, metavar="DAYS",
+                            help="Delete rows not hit (or created, if never hit) in the last DAYS days.")
+        parser.add_argument("--max-per-language", type=int, metavar="ROWS",
+                            help="Keep only the ROWS most recently used rows of each language (rows tied with the last kept one stay).")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Rows deleted per statement (default: 1000).")
+        parser.add_argument("--pause", type=float, default=0.1,
+                            help="Seconds to sleep between batches so other writers get the table (default: 0.1).")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Only count the rows that would be deleted.")
+
+    def handle(self, *args, **options):
+        if not uses_orm():
+            raise CommandError("This command works on the Translated_Content table and needs TEXT_TRANSLATOR_BACKEND = \"orm\".")
+        if not any(options[name] is not None for name in ("older_than", "unused_for", "max_per_language")):
+            raise CommandError("Give at least one of --older-than, --unused-for or --max-per-language.")
+        if options["max_per_language"] is not None and options["max_per_language"] < 1:
+            raise CommandError("--max-per-language must be positive.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        self.batch_size = options["batch_size"]
+        self.pause = options["pause"]
+        self.dry_run = options["dry_run"]
+
+        tracker = cache.get_hit_tracker()
+        if tracker is not None:
+            tracker.flush()
+
+        now = timezone.now()
+        rows = Translated_Content.objects.all()
+        total = 0
+        if options["older_than"] is not None:
+            total += self.evict(rows.filter(created__lt=now - timedelta(days=options["older_than"])), "created")
+        if options["unused_for"] is not None:
+            total += self.evict(rows.filter(last_hit__lt=now - timedelta(days=options["unused_for"])), "last_hit")
+        if options["max_per_language"] is not None:
+            cap = options["max_per_language"]
+            languages = rows.order_by().values_list("translated_language", flat=True).distinct()
+            for language in list(languages):
+                # The last_hit of the oldest row to keep, read once from the (language, last_hit) index;
+                # rows tied with it are kept as well.
+                language_rows = rows.filter(translated_language=language)
+                cutoff = list(language_rows.order_by("-last_hit").values_list("last_hit", flat=True)[cap - 1:cap + 1])
+                if len(cutoff) > 1:
+                    total += self.evict(language_rows.filter(last_hit__lt=cutoff[0]), "last_hit")
+
+        verb = "Would delete" if self.dry_run else "Deleted"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {total} cached translations."))
+
+    def evict(self, queryset, field: str) -> int:
+        """
+        Delete the rows of `queryset` in batches, oldest `field` first. Every batch starts where the previous
+        one ended (keyset paging on the indexed `field`) instead of scanning and sorting the table again.
+        """
+        if self.dry_run:
+            return queryset.count()
+
+        deleted = 0
+        cursor = None
+        while True:
+            page = queryset if cursor is None else queryset.filter(**{f"{field}__gte": cursor})
+            batch = list(page.order_by(field).values_list(field, "hash")[:self.batch_size])
+            if not batch:
+                break
+            keys = [bytes(key) for _, key in batch]
+            Translated_Content.objects.filter(hash__in=keys).delete()
+            cache.delete_many(keys)
+            deleted += len(keys)
+            cursor = batch[-1][0]
+            self.stdout.write(f"Deleted {deleted} rows...")
+            if self.pause:
+                time.sleep(self.pause)
+        return deleted
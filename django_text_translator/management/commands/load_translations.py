@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django_text_translator.backends import uses_orm
+from django_text_translator import bloom, cache, snapshot
+from django_text_translator.fields import decompress_text
+from django_text_translator.models import Translated_Content
+
+
+class Command(BaseCommand):
+    help = "Load a snapshot written by dump_translations. Rows whose key already exists are kept as they are."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Snapshot file to read.")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Rows inserted per statement (default: 1000).")
+
+    def handle(self, *args, **options):
+        if not uses_orm():
+            raise CommandError("This command works on the Translated_Content table and needs TEXT_TRANSLATOR_BACKEND = \"orm\".")
+        batch_size = options["batch_size"]
+        loaded = 0
+        batch = []
+        try:
+            with bloom.publishing() as publish:
+                for row in snapshot.read_rows(options["path"]):
+                    batch.append(Translated_Content(**dict(zip(snapshot.FIELDS, row))))
+                    if len(batch) >= batch_size:
+                        loaded += self.insert(batch, publish)
+                        batch = []
+                loaded += self.insert(batch, publish)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Cannot read {options['path']}: {e}")
+        self.stdout.write(self.style.SUCCESS(f"Loaded {loaded} cached translations from {options['path']}."))
+
+    def insert(self, batch, publish) -> int:
+        if not batch:
+            return 0
+        keys = [bytes(row.hash) for row in batch]
+        existing = {bytes(key) for key in Translated_Content.objects.filter(hash__in=keys).values_list("hash", flat=True)}
+        Translated_Content.objects.bulk_create(batch, ignore_conflicts=True)
+        # Like rows stored through Translated_Content, the new rows go to the shared cache and the Bloom filter.
+        cache.set_many({
+            bytes(row.hash): {'text': decompress_text(row.translated_content), 'tokens': row.tokens or 0,
+                              'characters': row.characters or 0}
+            for row in batch if bytes(row.hash) not in existing
+        })
+        publish(keys)
+        self.stdout.write(f"Read {len(batch)} rows...")
+        return len(batch)
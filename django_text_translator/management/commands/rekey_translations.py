@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django_text_translator.backends import uses_orm
+from django_text_translator import bloom, cache
+from django_text_translator.fields import decompress_text
+from django_text_translator.models import Translated_Content
+
+
+class Command(BaseCommand):
+    help = ("Recompute the keys of cached translations with the current TEXT_TRANSLATOR_NORMALIZER. "
+            "Rows whose normalized key already exists are dropped as duplicates.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="Rows read and rewritten per transaction (default: 500).")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Only count the rows that would change.")
+
+    def handle(self, *args, **options):
+        if not uses_orm():
+            raise CommandError("This command works on the Translated_Content table and needs TEXT_TRANSLATOR_BACKEND = \"orm\".")
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        with bloom.publishing() as publish:
+            rekeyed, dropped = self.rekey(batch_size, dry_run, publish)
+
+        verb = "Would re-key" if dry_run else "Re-keyed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {rekeyed} cached translations, dropped {dropped} duplicates."))
+
+    def rekey(self, batch_size: int, dry_run: bool, publish):
+        rekeyed = 0
+        dropped = 0
+        last_hash = None
+        while True:
+            rows = Translated_Content.objects.order_by("hash")
+            if last_hash is not None:
+                rows = rows.filter(hash__gt=last_hash)
+            rows = list(rows.values_list("hash", "original_content", "translated_language", "namespace",
+                                         "translated_content", "tokens", "characters")[:batch_size])
+            if not rows:
+                break
+            last_hash = rows[-1][0]
+
+            changes = {}
+            stored = {}
+            for text_hash, original_content, language, namespace, translated, tokens, characters in rows:
+                new_hash = Translated_Content.make_hash(decompress_text(original_content), language, namespace)
+                if new_hash != bytes(text_hash):
+                    changes[bytes(text_hash)] = new_hash
+                    stored[new_hash] = {'text': decompress_text(translated), 'tokens': tokens or 0,
+                                        'characters': characters or 0}
+            if not changes:
+                continue
+            if dry_run:
+                rekeyed += len(changes)
+                continue
+
+            with transaction.atomic():
+                taken = {bytes(key) for key in Translated_Content.objects.filter(
+                    hash__in=list(changes.values())).values_list("hash", flat=True)}
+                duplicates = []
+                moved = {}
+                for old_hash, new_hash in changes.items():
+                    if new_hash in taken:
+                        duplicates.append(old_hash)
+                        continue
+                    # Updating the key in place keeps created/last_hit and the stored (maybe compressed) content.
+                    Translated_Content.objects.filter(hash=old_hash).update(hash=new_hash)
+                    taken.add(new_hash)
+                    rekeyed += 1
+                    moved[new_hash] = stored[new_hash]
+                Translated_Content.objects.filter(hash__in=duplicates).delete()
+                dropped += len(duplicates)
+            cache.delete_many(changes.keys())
+            # Like rows stored through Translated_Content, the new keys go to the shared cache and the Bloom filter.
+            cache.set_many(moved)
+            publish(moved.keys())
+            self.stdout.write(f"Re-keyed {rekeyed} rows, dropped {dropped} duplicates...")
+        return rekeyed, dropped
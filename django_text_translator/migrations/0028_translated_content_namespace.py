@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0027_alter_azureaitranslator_api_key_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translated_content',
+            name='namespace',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0028_translated_content_namespace'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translated_content',
+            name='created',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='translated_content',
+            name='last_hit',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:11
+
+import django_text_translator.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0029_translated_content_created_last_hit'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='translated_content',
+            name='original_content',
+            field=django_text_translator.fields.CompressedTextField(),
+        ),
+        migrations.AlterField(
+            model_name='translated_content',
+            name='translated_content',
+            field=django_text_translator.fields.CompressedTextField(),
+        ),
+    ]
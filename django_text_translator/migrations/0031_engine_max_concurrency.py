@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0030_compressed_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='max_concurrency',
+            field=models.PositiveSmallIntegerField(default=4, help_text='Requests sent in parallel by translate_many() and other batch calls', verbose_name='Max Concurrent Requests'),
+        ),
+    ]
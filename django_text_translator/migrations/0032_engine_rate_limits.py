@@ -0,0 +1,204 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:27
+
+from django.db import migrations, models
+
+# Engines that used to sleep `interval` seconds after every call.
+INTERVAL_ENGINES = ["DeepLXTranslator", "DeepLWebTranslator", "GeminiTranslator",
+                    "GoogleTranslateWebTranslator", "TestTranslator"]
+
+
+def interval_to_rate_limit(apps, schema_editor):
+    for name in INTERVAL_ENGINES:
+        model = apps.get_model("translator", name)
+        for engine in model.objects.all():
+            engine.requests_per_minute = max(60 // engine.interval, 1) if engine.interval > 0 else None
+            engine.save(update_fields=["requests_per_minute"])
+
+
+def rate_limit_to_interval(apps, schema_editor):
+    for name in INTERVAL_ENGINES:
+        model = apps.get_model("translator", name)
+        for engine in model.objects.all():
+            engine.interval = 60 // engine.requests_per_minute if engine.requests_per_minute else 0
+            engine.save(update_fields=["interval"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0031_engine_max_concurrency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=12, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=20, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=20, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=20, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='requests_per_minute',
+            field=models.PositiveIntegerField(blank=True, default=None, help_text='Leave empty for no limit', null=True, verbose_name='Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='units_per_minute',
+            field=models.PositiveIntegerField(blank=True, help_text='Tokens for AI engines, characters for the others. Leave empty for no limit', null=True, verbose_name='Characters/Tokens per Minute'),
+        ),
+        migrations.RunPython(interval_to_rate_limit, rate_limit_to_interval),
+        migrations.RemoveField(
+            model_name='deeplwebtranslator',
+            name='interval',
+        ),
+        migrations.RemoveField(
+            model_name='deeplxtranslator',
+            name='interval',
+        ),
+        migrations.RemoveField(
+            model_name='geminitranslator',
+            name='interval',
+        ),
+        migrations.RemoveField(
+            model_name='googletranslatewebtranslator',
+            name='interval',
+        ),
+        migrations.RemoveField(
+            model_name='testtranslator',
+            name='interval',
+        ),
+    ]
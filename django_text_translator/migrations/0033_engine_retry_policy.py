@@ -0,0 +1,313 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0032_engine_rate_limits'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='adaptive_throttle',
+            field=models.BooleanField(default=True, help_text='Space out requests after rate-limited responses, and speed back up after successes', verbose_name='Adaptive Throttle'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='max_retries',
+            field=models.PositiveSmallIntegerField(default=3, help_text='Retries of rate-limited, timed out and server errors', verbose_name='Max Retries'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='retry_backoff',
+            field=models.FloatField(default=1.0, help_text='Delay before the first retry, doubled on every retry', verbose_name='Retry Backoff(s)'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='retry_backoff_max',
+            field=models.FloatField(default=60.0, verbose_name='Max Retry Backoff(s)'),
+        ),
+    ]
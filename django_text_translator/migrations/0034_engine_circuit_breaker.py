@@ -0,0 +1,163 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0033_engine_retry_policy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='caiyuntranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='claudetranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='deepltranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='deeplwebtranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='deeplxtranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='geminitranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='googletranslatewebtranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='microsofttranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='testtranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='breaker_reset_timeout',
+            field=models.FloatField(default=30.0, help_text='How long calls are suspended before a probe call', verbose_name='Circuit Breaker Timeout(s)'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='breaker_threshold',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables', verbose_name='Circuit Breaker Threshold'),
+        ),
+    ]
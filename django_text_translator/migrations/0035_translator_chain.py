@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('translator', '0034_engine_circuit_breaker'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslatorChain',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Name')),
+            ],
+            options={
+                'verbose_name': 'Translator Chain',
+                'verbose_name_plural': 'Translator Chains',
+            },
+        ),
+        migrations.CreateModel(
+            name='TranslatorChainStep',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order', models.PositiveSmallIntegerField(default=0, verbose_name='Order')),
+                ('object_id', models.PositiveIntegerField(verbose_name='Engine ID')),
+                ('timeout', models.FloatField(blank=True, help_text="Fail over to the next engine if this one hasn't answered in time. Leave empty to wait", null=True, verbose_name='Latency Budget(s)')),
+                ('chain', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='steps', to='translator.translatorchain')),
+                ('content_type', models.ForeignKey(limit_choices_to={'app_label': 'translator', 'model__endswith': 'translator'}, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='Engine Type')),
+            ],
+            options={
+                'verbose_name': 'Step',
+                'verbose_name_plural': 'Steps',
+                'ordering': ['order', 'pk'],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:35
+
+import encrypted_model_fields.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0035_translator_chain'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='extra_credentials',
+            field=encrypted_model_fields.fields.EncryptedTextField(blank=True, default='', help_text='One per line: an API key, optionally followed by a space and its API URL (default: the API URL above). Requests are spread over all the keys, and the rate limits apply to each key', verbose_name='Extra API Keys'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='extra_credentials',
+            field=encrypted_model_fields.fields.EncryptedTextField(blank=True, default='', help_text='One per line: an API key, optionally followed by a space and its API URL (default: the API URL above). Requests are spread over all the keys, and the rate limits apply to each key', verbose_name='Extra API Keys'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='extra_credentials',
+            field=encrypted_model_fields.fields.EncryptedTextField(blank=True, default='', help_text='One per line: an API key, optionally followed by a space and its API URL (default: the API URL above). Requests are spread over all the keys, and the rate limits apply to each key', verbose_name='Extra API Keys'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='extra_credentials',
+            field=encrypted_model_fields.fields.EncryptedTextField(blank=True, default='', help_text='One per line: an API key, optionally followed by a space and its API URL (default: the API URL above). Requests are spread over all the keys, and the rate limits apply to each key', verbose_name='Extra API Keys'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='extra_credentials',
+            field=encrypted_model_fields.fields.EncryptedTextField(blank=True, default='', help_text='One per line: an API key, optionally followed by a space and its API URL (default: the API URL above). Requests are spread over all the keys, and the rate limits apply to each key', verbose_name='Extra API Keys'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='extra_credentials',
+            field=encrypted_model_fields.fields.EncryptedTextField(blank=True, default='', help_text='One per line: an API key, optionally followed by a space and its API URL (default: the API URL above). Requests are spread over all the keys, and the rate limits apply to each key', verbose_name='Extra API Keys'),
+        ),
+    ]
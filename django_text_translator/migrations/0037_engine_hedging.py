@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:37
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0036_engine_extra_credentials'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='hedge_percentile',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) and keep the first answer. Leave empty to disable', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(99)], verbose_name='Hedge After Percentile'),
+        ),
+        migrations.AddField(
+            model_name='azureaitranslator',
+            name='hedges_per_minute',
+            field=models.PositiveIntegerField(default=10, help_text='Cap on the duplicate requests', verbose_name='Max Hedged Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='hedge_percentile',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) and keep the first answer. Leave empty to disable', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(99)], verbose_name='Hedge After Percentile'),
+        ),
+        migrations.AddField(
+            model_name='groqtranslator',
+            name='hedges_per_minute',
+            field=models.PositiveIntegerField(default=10, help_text='Cap on the duplicate requests', verbose_name='Max Hedged Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='hedge_percentile',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) and keep the first answer. Leave empty to disable', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(99)], verbose_name='Hedge After Percentile'),
+        ),
+        migrations.AddField(
+            model_name='moonshotaitranslator',
+            name='hedges_per_minute',
+            field=models.PositiveIntegerField(default=10, help_text='Cap on the duplicate requests', verbose_name='Max Hedged Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='hedge_percentile',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) and keep the first answer. Leave empty to disable', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(99)], verbose_name='Hedge After Percentile'),
+        ),
+        migrations.AddField(
+            model_name='openaitranslator',
+            name='hedges_per_minute',
+            field=models.PositiveIntegerField(default=10, help_text='Cap on the duplicate requests', verbose_name='Max Hedged Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='hedge_percentile',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) and keep the first answer. Leave empty to disable', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(99)], verbose_name='Hedge After Percentile'),
+        ),
+        migrations.AddField(
+            model_name='openrouteraitranslator',
+            name='hedges_per_minute',
+            field=models.PositiveIntegerField(default=10, help_text='Cap on the duplicate requests', verbose_name='Max Hedged Requests per Minute'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='hedge_percentile',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) and keep the first answer. Leave empty to disable', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(99)], verbose_name='Hedge After Percentile'),
+        ),
+        migrations.AddField(
+            model_name='togetheraitranslator',
+            name='hedges_per_minute',
+            field=models.PositiveIntegerField(default=10, help_text='Cap on the duplicate requests', verbose_name='Max Hedged Requests per Minute'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:51
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def fill_last_hit(apps, schema_editor):
+    # Rows never served count as used when they were created.
+    Translated_Content = apps.get_model("translator", "Translated_Content")
+    Translated_Content.objects.filter(last_hit__isnull=True).update(last_hit=models.F("created"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translator', '0037_engine_hedging'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_last_hit, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='translated_content',
+            name='last_hit',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='translated_content',
+            index=models.Index(fields=['translated_language', 'last_hit'], name='translator_language_hit_idx'),
+        ),
+    ]
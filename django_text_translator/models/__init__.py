@@ -13,6 +13,7 @@ from .openai import OpenAITranslator
 from .togetherai import TogetherAITranslator
 from .openrouterai import OpenRouterAITranslator
 from .groq import GroqTranslator
+from .chain import TranslatorChain, TranslatorChainStep
 
 
 from .dev import TestTranslator
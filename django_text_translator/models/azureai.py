@@ -1,7 +1,9 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from openai import AzureOpenAI
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from .base import OpenAIInterface
+from ..clients import http_limits
 
 
 class AzureAITranslator(OpenAIInterface):
@@ -14,10 +16,22 @@ class AzureAITranslator(OpenAIInterface):
         verbose_name = "Azure OpenAI"
         verbose_name_plural = "Azure OpenAI"
 
-    def _init(self):
+    def _init(self, api_key: str = None, base_url: str = None):
         return AzureOpenAI(
-                    api_key=self.api_key,
+                    api_key=api_key or self.api_key,
                     api_version=self.version,
-                    azure_endpoint=self.base_url,
+                    azure_endpoint=base_url or self.base_url,
                     timeout=120.0,
-                )
\ No newline at end of file
+                    max_retries=0,
+                    http_client=httpx.Client(limits=http_limits(), timeout=120.0, follow_redirects=True),
+                )
+
+    def _ainit(self, api_key: str = None, base_url: str = None):
+        return AsyncAzureOpenAI(
+                    api_key=api_key or self.api_key,
+                    api_version=self.version,
+                    azure_endpoint=base_url or self.base_url,
+                    timeout=120.0,
+                    max_retries=0,
+                    http_client=httpx.AsyncClient(limits=http_limits(), timeout=120.0, follow_redirects=True),
+                )
@@ -1,20 +1,204 @@
+import asyncio
+import functools
+import inspect
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import sync_to_async
+from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 import cityhash
-from openai import OpenAI
-from encrypted_model_fields.fields import EncryptedCharField
+import httpx
+from openai import OpenAI, AsyncOpenAI
+from encrypted_model_fields.fields import EncryptedCharField, EncryptedTextField
+from .. import cache
+from ..backends import get_backend, uses_orm, STORE_BATCH_SIZE
+from ..fields import CompressedTextField
+from ..segments import split_text, join_segments
+from ..normalizers import get_normalizer
+from .. import endpoints, errors, hedging, retry, singleflight
+from ..breaker import breakers
+from ..clients import registry as client_registry, http_limits
+from ..bloom import get_bloom
+from ..concurrency import slots
+from ..ratelimit import limiters
+
+def guarded(method):
+    """
+    Decorator for the translate()/atranslate() methods of engines: identical concurrent calls to the same
+    engine are collapsed into one provider request (see singleflight.do), inputs that recently failed
+    deterministically (see errors.DETERMINISTIC) are answered from the negative cache, provider
+    requests wait for the engine's rate limits (see ratelimit.EngineLimiter), transient failures
+    are retried with backoff (see retry.run), and calls fail fast while the engine's circuit breaker is open.
+    Engines with several API keys/endpoints spread their requests over them (see endpoints.EndpointPool),
+    and engines with hedging on duplicate the requests that run late (see hedging.Hedger).
+    """
+    def keys(self, text, target_language, *args, **kwargs):
+        # Unsupported languages are remembered for the engine as a whole, other failures per input.
+        return self.call_key(text, target_language, *args, **kwargs), self.call_key("", target_language, scope="language")
+
+    def skipped(self, text, error):
+        logging.info("%s->Skipping recently failed input (%s): %s", self.__class__.__name__, error['type'], text)
+        return {'text': '', 'tokens': 0, 'characters': 0, 'error': error}
+
+    def failure_key(key, language_key, result):
+        error = result.get('error')
+        if not errors.is_deterministic(error):
+            return None
+        return language_key if error['type'] == errors.UNSUPPORTED_LANGUAGE else key
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, text, target_language, *args, **kwargs):
+            key, language_key = keys(self, text, target_language, *args, **kwargs)
+            negative = cache.get_negative_cache()
+            if negative is not None:
+                error = await negative.aget([language_key, key])
+                if error is not None:
+                    return skipped(self, text, error)
+
+            hedger = self.hedger()
+            circuit = breakers.get(self)
+
+            async def attempt():
+                pool = self.endpoint_pool()
+                member = pool.acquire() if pool is not None else None
+                token = endpoints.current.set(member)
+                result = started = None
+                try:
+                    limiter = limiters.get(self, member)
+                    if limiter is not None:
+                        reserved = await limiter.aacquire(self.estimate_units(text))
+                    hedging.sending()
+                    started = time.monotonic()
+                    result = await method(self, text, target_language, *args, **kwargs)
+                    if hedger is not None and not result.get('error'):
+                        hedger.record(time.monotonic() - started)
+                    if limiter is not None:
+                        await limiter.aconsume(result, reserved)
+                finally:
+                    endpoints.current.reset(token)
+                    if member is not None:
+                        pool.release(member, result, started)
+                if circuit is not None:
+                    await circuit.arecord(result.get('error'))
+                return result
+
+            call = attempt if hedger is None else functools.partial(hedger.arun, attempt)
+            result = await singleflight.ado(key, lambda: retry.arun(self, call, circuit))
+
+            if negative is not None and (failed := failure_key(key, language_key, result)):
+                await negative.aset(failed, result['error'])
+            return result
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, text, target_language, *args, **kwargs):
+        key, language_key = keys(self, text, target_language, *args, **kwargs)
+        negative = cache.get_negative_cache()
+        if negative is not None:
+            error = negative.get([language_key, key])
+            if error is not None:
+                return skipped(self, text, error)
+
+        hedger = self.hedger()
+        circuit = breakers.get(self)
+
+        def attempt():
+            pool = self.endpoint_pool()
+            member = pool.acquire() if pool is not None else None
+            token = endpoints.current.set(member)
+            result = started = None
+            try:
+                limiter = limiters.get(self, member)
+                if limiter is not None:
+                    reserved = limiter.acquire(self.estimate_units(text))
+                hedging.sending()
+                started = time.monotonic()
+                result = method(self, text, target_language, *args, **kwargs)
+                if hedger is not None and not result.get('error'):
+                    hedger.record(time.monotonic() - started)
+                if limiter is not None:
+                    limiter.consume(result, reserved)
+            finally:
+                endpoints.current.reset(token)
+                if member is not None:
+                    pool.release(member, result, started)
+            if circuit is not None:
+                circuit.record(result.get('error'))
+            return result
+
+        call = attempt if hedger is None else functools.partial(hedger.run, attempt)
+        result = singleflight.do(key, lambda: retry.run(self, call, circuit))
+
+        if negative is not None and (failed := failure_key(key, language_key, result)):
+            negative.set(failed, result['error'])
+        return result
+    return wrapper
+
+
+def requests_per_minute_field(default=None):
+    # Engines that scrape free endpoints override the field with a cautious default.
+    return models.PositiveIntegerField(
+        _("Requests per Minute"), null=True, blank=True, default=default, help_text=_("Leave empty for no limit"))
+
 
 class TranslatorEngine(models.Model):
     name = models.CharField(_("Name"), max_length=100, unique=True)
     valid = models.BooleanField(_("Valid"), null=True)
     is_ai = models.BooleanField(default=False, editable=False)
+    max_concurrency = models.PositiveSmallIntegerField(
+        _("Max Concurrent Requests"), default=4,
+        help_text=_("Requests sent in parallel by translate_many() and other batch calls"))
+    requests_per_minute = requests_per_minute_field()
+    units_per_minute = models.PositiveIntegerField(
+        _("Characters/Tokens per Minute"), null=True, blank=True,
+        help_text=_("Tokens for AI engines, characters for the others. Leave empty for no limit"))
+    max_retries = models.PositiveSmallIntegerField(
+        _("Max Retries"), default=3, help_text=_("Retries of rate-limited, timed out and server errors"))
+    retry_backoff = models.FloatField(
+        _("Retry Backoff(s)"), default=1.0, help_text=_("Delay before the first retry, doubled on every retry"))
+    retry_backoff_max = models.FloatField(_("Max Retry Backoff(s)"), default=60.0)
+    adaptive_throttle = models.BooleanField(
+        _("Adaptive Throttle"), default=True,
+        help_text=_("Space out requests after rate-limited responses, and speed back up after successes"))
+    breaker_threshold = models.PositiveSmallIntegerField(
+        _("Circuit Breaker Threshold"), default=5,
+        help_text=_("Consecutive server errors, timeouts or connection errors that suspend the engine. 0 disables"))
+    breaker_reset_timeout = models.FloatField(
+        _("Circuit Breaker Timeout(s)"), default=30.0, help_text=_("How long calls are suspended before a probe call"))
 
     def translate(self, text: str, target_language: str) -> dict:
         raise NotImplementedError(
             "subclasses of TranslatorEngine must provide a translate() method"
         )
 
+    async def atranslate(self, text: str, target_language: str, *args, **kwargs) -> dict:
+        """
+        Async translate(). Engines with an async SDK or HTTP client override it;
+        the others run translate() in a worker thread.
+        """
+        return await sync_to_async(self.translate, thread_sensitive=False)(text, target_language, *args, **kwargs)
+
+    async def asummarize(self, text: str, target_language: str) -> dict:
+        return await sync_to_async(self.summarize, thread_sensitive=False)(text, target_language)
+
+    def unsupported_language(self, target_language: str) -> dict:
+        logging.error("%s->Not support target language:%s", self.__class__.__name__, target_language)
+        error = errors.make_error(errors.UNSUPPORTED_LANGUAGE, f"Not support target language: {target_language}")
+        return {'text': '', "characters": 0, "error": error}
+
+    def estimate_units(self, text: str) -> int:
+        """
+        The characters/tokens a call on `text` is expected to use (max_tokens for AI engines, the length of
+        the text for the others), reserved from units_per_minute before the call and corrected after it.
+        """
+        if self.is_ai and hasattr(self, "max_tokens"):
+            return self.max_tokens
+        return len(text)
+
     def min_size(self) -> int:
         if hasattr(self, "max_characters"):
             return self.max_characters * 0.7
@@ -33,6 +217,149 @@ class TranslatorEngine(models.Model):
             "subclasses of TranslatorEngine must provide a validate() method"
         )
 
+    def translate_many(self, texts, target_language: str, max_workers: int = None, namespace=None) -> list:
+        """
+        Translate a batch of texts: cached ones are answered from a single lookup, the others are sent
+        in parallel (at most max_workers, and never more than max_concurrency for the engine at a time)
+        and stored in bulk. Returns one result per text, in input order; cached results have "cached": True.
+        """
+        hits, misses = Translated_Content.lookup_many(texts, target_language, namespace)
+        results = {text: dict(result, error=None, cached=True) for text, result in hits.items()}
+        if misses:
+            slot = slots.get(self)
+
+            def call(text):
+                with slot:
+                    return self.translate(text, target_language)
+
+            with ThreadPoolExecutor(max_workers=min(max_workers or self.max_concurrency, len(misses)) or 1) as pool:
+                translated = dict(zip(misses, pool.map(call, misses)))
+            Translated_Content.bulk_store(self._new_entries(translated, target_language), namespace=namespace)
+            results.update(translated)
+        return [results[text] for text in texts]
+
+    async def atranslate_many(self, texts, target_language: str, max_workers: int = None, namespace=None) -> list:
+        """Async translate_many(): misses run as tasks on the event loop."""
+        hits, misses = await Translated_Content.alookup_many(texts, target_language, namespace)
+        results = {text: dict(result, error=None, cached=True) for text, result in hits.items()}
+        if misses:
+            slot = slots.aget(self)
+            limit = asyncio.Semaphore(max_workers or self.max_concurrency or 1)
+
+            async def call(text):
+                async with limit, slot:
+                    return await self.atranslate(text, target_language)
+
+            translated = dict(zip(misses, await asyncio.gather(*[call(text) for text in misses])))
+            await Translated_Content.abulk_store(self._new_entries(translated, target_language), namespace=namespace)
+            results.update(translated)
+        return [results[text] for text in texts]
+
+    @staticmethod
+    def _new_entries(translated: dict, target_language: str) -> list:
+        entries = []
+        for text, result in translated.items():
+            result['cached'] = False
+            if result.get('text'):
+                entries.append((text, target_language, result['text'],
+                                result.get('tokens', 0), result.get('characters', len(text))))
+        return entries
+
+    def translate_segmented(self, text: str, target_language: str, split: str = "paragraph", namespace=None) -> dict:
+        """
+        Translate text paragraph by paragraph (or sentence by sentence), caching every segment on its own
+        so that an edited document only costs its changed segments. If some segments fail, "error" is set
+        and "failed_segments" counts them; they stay untranslated in "text", which is empty if all failed.
+        """
+        pieces = split_text(text, split)
+        segments = list(dict.fromkeys(segment for _, segment, _ in pieces if segment))
+        return self._segmented_result(pieces, segments, self.translate_many(segments, target_language, namespace=namespace))
+
+    async def atranslate_segmented(self, text: str, target_language: str, split: str = "paragraph", namespace=None) -> dict:
+        pieces = split_text(text, split)
+        segments = list(dict.fromkeys(segment for _, segment, _ in pieces if segment))
+        return self._segmented_result(pieces, segments, await self.atranslate_many(segments, target_language, namespace=namespace))
+
+    @staticmethod
+    def _segmented_result(pieces, segments, results) -> dict:
+        translations = {}
+        tokens = 0
+        characters = 0
+        translated_segments = 0
+        failures = []
+        for segment, result in zip(segments, results):
+            if not result.get('text'):
+                logging.warning("translate_segmented->Segment not translated: %s", segment)
+                failures.append(result.get('error') or errors.make_error(errors.UNKNOWN, "Empty translation"))
+                continue
+            translations[segment] = result['text']
+            if not result['cached']:
+                tokens += result.get('tokens', 0)
+                characters += result.get('characters', len(segment))
+                translated_segments += 1
+
+        error = None
+        if failures:
+            # Reported as the first failure, so that callers can still tell a rate limit from a bad input.
+            first = failures[0]
+            error = errors.make_error(first['type'], f"{len(failures)} of {len(segments)} segments not translated: "
+                                      f"{first.get('message')}", first.get('status'), first.get('retry_after'))
+        return {
+            # Failed segments keep their source text; with nothing translated there is no text at all.
+            'text': join_segments(pieces, translations) if translations or not segments else '',
+            'tokens': tokens,
+            'characters': characters,
+            'segments': len(segments),
+            'translated_segments': translated_segments,
+            'failed_segments': len(failures),
+            'error': error,
+        }
+
+    def config_fingerprint(self) -> str:
+        # Changes whenever a setting of the engine (API key, URL, model, prompts...) is edited.
+        values = [f"{field.attname}={getattr(self, field.attname)!r}"
+                  for field in self._meta.concrete_fields if field.attname != "valid"]
+        return cityhash.CityHash64("|".join(values)).to_bytes(8, byteorder='little').hex()
+
+    def client(self):
+        # The client built by _init(), kept for the process and rebuilt once the engine's settings change.
+        return client_registry.get(self, self._init)
+
+    def aclient(self):
+        # The async counterpart built by _ainit(), kept per event loop.
+        return client_registry.aget(self, self._ainit)
+
+    def endpoint_pool(self):
+        # Engines with several API keys/endpoints return their endpoints.EndpointPool.
+        return None
+
+    def hedger(self):
+        # Engines that hedge their slow requests return their hedging.Hedger.
+        return None
+
+    def call_key(self, text: str, target_language: str, *args, **kwargs) -> bytes:
+        # Identifies one provider request: same engine row and configuration, same input, same prompts.
+        namespace = f"{self.__class__.__name__}:{self.pk}:{self.config_fingerprint()}"
+        extra = [repr(arg) for arg in args] + [f"{name}={value!r}" for name, value in sorted(kwargs.items())]
+        if extra:
+            namespace = f"{namespace}:{'|'.join(extra)}"
+        return Translated_Content.make_hash(text, target_language, namespace)
+
+    def cache_namespace(self, kind: str = "translate") -> str:
+        """
+        Namespace for Translated_Content keys, so that engines, models and prompts don't share cache slots.
+        `kind` is "translate" or "summary".
+        """
+        parts = [self.__class__.__name__]
+        if getattr(self, "model", None):
+            parts.append(self.model)
+        prompt = getattr(self, "summary_prompt" if kind == "summary" else "translate_prompt", None)
+        if prompt:
+            parts.append(cityhash.CityHash64(prompt).to_bytes(8, byteorder='little').hex())
+        if kind != "translate":
+            parts.append(kind)
+        return ":".join(parts)
+
     class Meta:
         abstract = True
 
@@ -42,39 +369,162 @@ class TranslatorEngine(models.Model):
 
 class Translated_Content(models.Model):
     hash = models.BinaryField(max_length=8, unique=True, primary_key=True, editable=False)
-    original_content = models.TextField()
+    original_content = CompressedTextField()
 
     translated_language = models.CharField(max_length=255)
-    translated_content = models.TextField()
+    translated_content = CompressedTextField()
 
     tokens = models.IntegerField(default=0)
     characters = models.IntegerField(default=0)
 
+    namespace = models.CharField(max_length=255, blank=True, default="", editable=False)
+
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Set on insert too, so that "last used" is this one indexed column.
+    last_hit = models.DateTimeField(default=timezone.now, db_index=True, editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=["translated_language", "last_hit"], name="translator_language_hit_idx")]
+
     def __str__(self):
         return self.original_content
 
+    @staticmethod
+    def make_hash(text, target_language, namespace=None) -> bytes:
+        text = get_normalizer()(text)
+        if namespace:
+            return cityhash.CityHash64(f"{namespace}\x00{text}{target_language}").to_bytes(8, byteorder='little')
+        return cityhash.CityHash64(f"{text}{target_language}").to_bytes(8, byteorder='little')
+
     @classmethod
-    def is_translated(cls, text, target_language):
-        text_hash = cityhash.CityHash64(f"{text}{target_language}").to_bytes(8, byteorder='little')
-        try:
-            content = Translated_Content.objects.get(hash=text_hash)
-            # logging.info("Using cached translations:%s", text)
-            return {
-                'text': content.translated_content,
-                'tokens': content.tokens,
-                'characters': content.characters
-            }
-        except Translated_Content.DoesNotExist:
+    def is_translated(cls, text, target_language, namespace=None):
+        text_hash = cls.make_hash(text, target_language, namespace)
+        cached = cache.get_many([text_hash])
+        if cached:
+            cache.record_lookup(namespace, hit_keys=[text_hash])
+            return cached[text_hash]
+        bloom = get_bloom()
+        if bloom is not None and not bloom.might_contain(text_hash):
+            cache.record_lookup(namespace, misses=1)
+            return None
+        result = get_backend().get(text_hash)
+        if result is None:
             logging.info("Does not exist in cache:%s", text)
+            cache.record_lookup(namespace, misses=1)
             return None
+        # logging.info("Using cached translations:%s", text)
+        cache.set_many({text_hash: result})
+        cache.record_lookup(namespace, hit_keys=[text_hash])
+        return result
+
+    @classmethod
+    def lookup_many(cls, texts, target_language, namespace=None):
+        """
+        Check a batch of texts against the cache in as few queries as possible.
+        Returns ({text: {'text', 'tokens', 'characters'}}, [missed texts]).
+        """
+        hashes = {}
+        for text in texts:
+            if text not in hashes:
+                hashes[text] = cls.make_hash(text, target_language, namespace)
+
+        found = cache.get_many(hashes.values())
+        bloom = get_bloom()
+        keys = [text_hash for text_hash in hashes.values()
+                if text_hash not in found and (bloom is None or bloom.might_contain(text_hash))]
+        fetched = get_backend().get_many(keys) if keys else {}
+        cache.set_many(fetched)
+        found.update(fetched)
+
+        hits = {}
+        misses = []
+        for text, text_hash in hashes.items():
+            if text_hash in found:
+                hits[text] = found[text_hash]
+            else:
+                misses.append(text)
+        cache.record_lookup(namespace, hit_keys=list(found), misses=len(misses))
+        logging.info("Cache lookup [%s]: %d hits, %d misses", target_language, len(hits), len(misses))
+        return hits, misses
+
+    @classmethod
+    async def ais_translated(cls, text, target_language, namespace=None):
+        return await sync_to_async(cls.is_translated)(text, target_language, namespace)
+
+    @classmethod
+    async def alookup_many(cls, texts, target_language, namespace=None):
+        """
+        Async lookup_many(). Like Django's async ORM methods, the lookups run in the thread that
+        sync_to_async keeps for database access, so the event loop is never blocked.
+        """
+        return await sync_to_async(cls.lookup_many)(texts, target_language, namespace)
+
+    @classmethod
+    def bulk_store(cls, entries, batch_size=STORE_BATCH_SIZE, namespace=None):
+        """
+        Store many translations at once.
+        `entries` is an iterable of (original, language, translated, tokens, characters) tuples;
+        rows whose hash already exists are left untouched.
+        """
+        rows = {}
+        for original, language, translated, tokens, characters in entries:
+            rows[cls.make_hash(original, language, namespace)] = {
+                'original': original,
+                'language': language,
+                'text': translated,
+                'tokens': tokens or 0,
+                'characters': characters or 0,
+                'namespace': namespace or "",
+            }
+        keys = list(rows)
+        backend = get_backend()
+        for i in range(0, len(keys), batch_size):
+            backend.set_many({key: rows[key] for key in keys[i:i + batch_size]})
+        cls._stored(rows)
+        return len(rows)
+
+    @classmethod
+    async def abulk_store(cls, entries, batch_size=STORE_BATCH_SIZE, namespace=None):
+        return await sync_to_async(cls.bulk_store)(entries, batch_size, namespace)
+
+    @staticmethod
+    def _stored(rows: dict):
+        if not rows:
+            return
+        cache.set_many({
+            key: {'text': row['text'], 'tokens': row['tokens'], 'characters': row['characters']}
+            for key, row in rows.items()
+        })
+        bloom = get_bloom()
+        if bloom is not None:
+            bloom.add_many(rows.keys())
 
     def save(self, *args, **kwargs):
         if not self.hash:
-            self.hash = cityhash.CityHash64(f"{self.original_content}{self.translated_language}").to_bytes(8, byteorder='little')
+            self.hash = self.make_hash(self.original_content, self.translated_language, self.namespace)
         # if self.hash not is binary, convert it to binary
-        else:
+        elif isinstance(self.hash, int):
             self.hash = self.hash.to_bytes(8, byteorder='little')
-        super(Translated_Content, self).save(*args, **kwargs)
+        row = {
+            'original': self.original_content,
+            'language': self.translated_language,
+            'text': self.translated_content,
+            'tokens': self.tokens,
+            'characters': self.characters,
+            'namespace': self.namespace,
+        }
+        if uses_orm():
+            super(Translated_Content, self).save(*args, **kwargs)
+        else:
+            get_backend().set_many({bytes(self.hash): row}, overwrite=True)
+        self._stored({bytes(self.hash): row})
+
+    def delete(self, *args, **kwargs):
+        cache.delete(bytes(self.hash))
+        if not uses_orm():
+            get_backend().delete(bytes(self.hash))
+            return 1, {self._meta.label: 1}
+        return super(Translated_Content, self).delete(*args, **kwargs)
 
 
 class OpenAIInterface(TranslatorEngine):
@@ -91,21 +541,65 @@ class OpenAIInterface(TranslatorEngine):
     max_tokens = models.IntegerField(default=1000)
 
     summary_prompt = models.TextField(default="Summarize the following text in {target_language}.")
+    extra_credentials = EncryptedTextField(
+        _("Extra API Keys"), blank=True, default="",
+        help_text=_("One per line: an API key, optionally followed by a space and its API URL (default: the API URL "
+                    "above). Requests are spread over all the keys, and the rate limits apply to each key"))
+    hedge_percentile = models.PositiveSmallIntegerField(
+        _("Hedge After Percentile"), null=True, blank=True,
+        validators=[MinValueValidator(1), MaxValueValidator(99)],
+        help_text=_("Send a duplicate of requests slower than this percentile of the recent ones (e.g. 95) "
+                    "and keep the first answer. Leave empty to disable"))
+    hedges_per_minute = models.PositiveIntegerField(
+        _("Max Hedged Requests per Minute"), default=10, help_text=_("Cap on the duplicate requests"))
 
     class Meta:
         abstract = True
-    
-    def _init(self):
+
+    def credentials(self) -> list:
+        # (api_key, base_url) of every key/endpoint of the engine, its own first.
+        return [(self.api_key, self.base_url)] + endpoints.parse_credentials(self.extra_credentials, self.base_url)
+
+    def endpoint_pool(self):
+        return endpoints.pools.get(self)
+
+    def hedger(self):
+        return hedging.hedgers.get(self)
+
+    def client(self):
+        member = endpoints.current_member()
+        if member is None:
+            return super().client()
+        return client_registry.get(self, lambda: self._init(member.api_key, member.base_url), name=member.id)
+
+    def aclient(self):
+        member = endpoints.current_member()
+        if member is None:
+            return super().aclient()
+        return client_registry.aget(self, lambda: self._ainit(member.api_key, member.base_url), name=member.id)
+
+    def _init(self, api_key: str = None, base_url: str = None):
         return OpenAI(
-                    api_key=self.api_key,
-                    base_url = self.base_url,
+                    api_key=api_key or self.api_key,
+                    base_url = base_url or self.base_url,
                     timeout=120.0,
+                    max_retries=0,
+                    http_client=httpx.Client(limits=http_limits(), timeout=120.0, follow_redirects=True),
+                )
+
+    def _ainit(self, api_key: str = None, base_url: str = None):
+        return AsyncOpenAI(
+                    api_key=api_key or self.api_key,
+                    base_url = base_url or self.base_url,
+                    timeout=120.0,
+                    max_retries=0,
+                    http_client=httpx.AsyncClient(limits=http_limits(), timeout=120.0, follow_redirects=True),
                 )
 
     def validate(self) -> bool:
         if self.api_key:
             try:
-                client = self._init()
+                client = self.client()
                 res = client.with_options(max_retries=3).chat.completions.create(
                     model=self.model,
                     messages=[{"role": "user", "content": 'Hi'}],
@@ -118,42 +612,62 @@ class OpenAIInterface(TranslatorEngine):
                 logging.error("OpenAIInterface validate ->%s", e)
                 return False
 
+    def _chat_request(self, text: str, target_language: str, system_prompt: str = None, user_prompt: str = None) -> dict:
+        system_prompt = (system_prompt or self.translate_prompt).replace('{target_language}', target_language)
+        if user_prompt:
+            system_prompt += f"\n\n{user_prompt}"
+        return dict(
+            model=self.model,
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text}
+            ],
+            temperature=self.temperature,
+            top_p=self.top_p,
+            frequency_penalty=self.frequency_penalty,
+            presence_penalty=self.presence_penalty,
+            max_tokens=self.max_tokens,
+        )
+
+    def _chat_result(self, res, text: str) -> dict:
+        translated_text = ''
+        error = None
+        if res.choices[0].finish_reason == "stop" or res.choices[0].message.content:
+            logging.info("OpenAITranslator->%s: %s", res.choices[0].finish_reason, text)
+            translated_text = res.choices[0].message.content
+        elif res.choices[0].finish_reason == "content_filter":
+            error = errors.make_error(errors.CONTENT_POLICY, "Response blocked by the content filter")
+        # else:
+        #     translated_text = ''
+        #     logging.warning("Translator->%s: %s", res.choices[0].finish_reason, text)
+        return {'text': translated_text, "tokens": res.usage.total_tokens, "error": error}
+
+    @guarded
     def translate(self, text:str, target_language:str, system_prompt:str=None, user_prompt:str=None) -> dict:
         logging.info(">>> Translate [%s]:", target_language)
-        client = self._init()
-        tokens = 0
-        translated_text = ''
-        system_prompt = system_prompt or self.translate_prompt
         try:
-            system_prompt = system_prompt.replace('{target_language}', target_language)
-            if user_prompt:
-                system_prompt += f"\n\n{user_prompt}"
-
-            res = client.with_options(max_retries=3).chat.completions.create(
-                model=self.model,
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                frequency_penalty=self.frequency_penalty,
-                presence_penalty=self.presence_penalty,
-                max_tokens=self.max_tokens,
-            )
-            if res.choices[0].finish_reason == "stop" or res.choices[0].message.content:
-                logging.info("OpenAITranslator->%s: %s", res.choices[0].finish_reason, text)
-                translated_text = res.choices[0].message.content
-            # else:
-            #     translated_text = ''
-            #     logging.warning("Translator->%s: %s", res.choices[0].finish_reason, text)
-            tokens = res.usage.total_tokens
+            res = self.client().chat.completions.create(
+                **self._chat_request(text, target_language, system_prompt, user_prompt))
+            return self._chat_result(res, text)
         except Exception as e:
             logging.error("Translator->%s: %s", e, text)
+            return {'text': '', "tokens": 0, "error": errors.from_exception(e)}
 
-        return {'text': translated_text, "tokens": tokens}
+    @guarded
+    async def atranslate(self, text:str, target_language:str, system_prompt:str=None, user_prompt:str=None) -> dict:
+        logging.info(">>> Translate [%s]:", target_language)
+        try:
+            res = await self.aclient().chat.completions.create(
+                **self._chat_request(text, target_language, system_prompt, user_prompt))
+            return self._chat_result(res, text)
+        except Exception as e:
+            logging.error("Translator->%s: %s", e, text)
+            return {'text': '', "tokens": 0, "error": errors.from_exception(e)}
     
     def summarize(self, text:str, target_language:str) -> dict:
         logging.info(">>> Summarize [%s]:", target_language)
         return self.translate(text, target_language, system_prompt=self.summary_prompt)
 
+    async def asummarize(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Summarize [%s]:", target_language)
+        return await self.atranslate(text, target_language, system_prompt=self.summary_prompt)
@@ -1,7 +1,8 @@
 import uuid
 import json
-import httpx
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded
+from .. import errors
+from ..clients import http_request, ahttp_request
 import logging
 from django.db import models
 from encrypted_model_fields.fields import EncryptedCharField
@@ -31,31 +32,51 @@ class CaiYunTranslator(TranslatorEngine):
         result = self.translate("Hi", "Chinese Simplified")
         return result.get("text") != ""
 
+    def _request_kwargs(self, text: str, target_code: str) -> dict:
+        payload = {
+            "source": text,
+            "trans_type": f"auto2{target_code}",
+            "request_id": uuid.uuid4().hex,
+            "detect": True,
+        }
+
+        headers = {
+            "content-type": "application/json",
+            "x-authorization": f"token {self.token}",
+        }
+        return {"headers": headers, "content": json.dumps(payload)}
+
+    @guarded
     def translate(self, text: str, target_language: str) -> dict:
         logging.info(">>> CaiYun Translate [%s]: %s", target_language, text)
         target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
         translated_text = ''
+        error = None
         try:
-            if target_code is None:
-                logging.error("CaiYunTranslator->Not support target language:%s", target_language)
-
-            payload = {
-                "source": text,
-                "trans_type": f"auto2{target_code}",
-                "request_id": uuid.uuid4().hex,
-                "detect": True,
-            }
-
-            headers = {
-                "content-type": "application/json",
-                "x-authorization": f"token {self.token}",
-            }
-
-            resp = httpx.post(url=self.url, headers=headers, data=json.dumps(payload), timeout=10)
+            resp = http_request("POST", self.url, **self._request_kwargs(text, target_code))
             resp.raise_for_status()
             translated_text = resp.json()["target"]
         except Exception as e:
             logging.error("CaiYunTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
         finally:
-            return {'text': translated_text, "characters": len(text)}
+            return {'text': translated_text, "characters": len(text), "error": error}
 
+    @guarded
+    async def atranslate(self, text: str, target_language: str) -> dict:
+        logging.info(">>> CaiYun Translate [%s]: %s", target_language, text)
+        target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
+        translated_text = ''
+        error = None
+        try:
+            resp = await ahttp_request("POST", self.url, **self._request_kwargs(text, target_code))
+            resp.raise_for_status()
+            translated_text = resp.json()["target"]
+        except Exception as e:
+            logging.error("CaiYunTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
+        return {'text': translated_text, "characters": len(text), "error": error}
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from .. import errors
+from ..concurrency import run_in_thread
+
+
+class TranslatorChain(models.Model):
+    """
+    An ordered list of engines used as one: each call goes to the first engine and fails over to the
+    next one when it returns an error (including an open circuit breaker), no text, raises, or exceeds its
+    step's latency budget. Results say which engine answered in "engine".
+    """
+    name = models.CharField(_("Name"), max_length=100, unique=True)
+
+    class Meta:
+        verbose_name = "Translator Chain"
+        verbose_name_plural = "Translator Chains"
+
+    def __str__(self):
+        return self.name
+
+    def chain_steps(self) -> list:
+        # Loaded once per instance; fetch the chain again to see edited steps.
+        if not hasattr(self, "_chain_steps"):
+            self._chain_steps = [step for step in self.steps.prefetch_related("engine") if step.engine is not None]
+        return self._chain_steps
+
+    def _call(self, step, method_name: str, text: str, target_language: str):
+        method = getattr(step.engine, method_name)
+        if not step.timeout:
+            return method(text, target_language)
+        # A thread per call, so that calls to healthy engines never queue behind abandoned ones.
+        return run_in_thread(method, text, target_language, name="translator-chain").result(timeout=step.timeout)
+
+    async def _acall(self, step, method_name: str, text: str, target_language: str):
+        call = getattr(step.engine, f"a{method_name}")(text, target_language)
+        if not step.timeout:
+            return await call
+        return await asyncio.wait_for(call, step.timeout)
+
+    def _run(self, method_name: str, text: str, target_language: str) -> dict:
+        result = None
+        for step in self.chain_steps():
+            if not hasattr(step.engine, method_name):
+                continue
+            started = time.monotonic()
+            try:
+                result = self._call(step, method_name, text, target_language)
+            except FutureTimeout:
+                result = self._timed_out(step)
+            except Exception as e:
+                result = self._raised(step, e)
+            result = self._tagged(step, result)
+            if self._answered(step, result, started):
+                return result
+        return result or self._no_engine()
+
+    async def _arun(self, method_name: str, text: str, target_language: str) -> dict:
+        steps = await sync_to_async(self.chain_steps)()
+        result = None
+        for step in steps:
+            if not hasattr(step.engine, method_name):
+                continue
+            started = time.monotonic()
+            try:
+                result = await self._acall(step, method_name, text, target_language)
+            except asyncio.TimeoutError:
+                result = self._timed_out(step)
+            except Exception as e:
+                result = self._raised(step, e)
+            result = self._tagged(step, result)
+            if self._answered(step, result, started):
+                return result
+        return result or self._no_engine()
+
+    @staticmethod
+    def _timed_out(step) -> dict:
+        message = f"No answer within the {step.timeout}s budget"
+        return {'text': '', 'tokens': 0, 'characters': 0, 'error': errors.make_error(errors.TIMEOUT, message)}
+
+    def _raised(self, step, exc: Exception) -> dict:
+        logging.error("TranslatorChain %s->%s raised: %s", self.name, step.engine, exc)
+        return {'text': '', 'tokens': 0, 'characters': 0, 'error': errors.from_exception(exc)}
+
+    @staticmethod
+    def _tagged(step, result: dict) -> dict:
+        # A copy: the result may be shared with other callers by single-flight, or come from a cache.
+        return {**result, 'engine': str(step.engine)}
+
+    def _answered(self, step, result: dict, started: float) -> bool:
+        if result.get('text') and not result.get('error'):
+            return True
+        error = result.get('error') or {}
+        logging.warning("TranslatorChain %s->%s failed after %.1fs (%s), trying the next engine", self.name,
+                        step.engine, time.monotonic() - started, error.get('type', "no text"))
+        return False
+
+    def _no_engine(self) -> dict:
+        logging.error("TranslatorChain %s->No engine to call", self.name)
+        return {'text': '', 'tokens': 0, 'characters': 0, 'engine': None,
+                'error': errors.make_error(errors.UNKNOWN, f"Translator chain {self.name} has no usable engine")}
+
+    def translate(self, text: str, target_language: str) -> dict:
+        return self._run("translate", text, target_language)
+
+    def summarize(self, text: str, target_language: str) -> dict:
+        return self._run("summarize", text, target_language)
+
+    async def atranslate(self, text: str, target_language: str) -> dict:
+        return await self._arun("translate", text, target_language)
+
+    async def asummarize(self, text: str, target_language: str) -> dict:
+        return await self._arun("summarize", text, target_language)
+
+
+class TranslatorChainStep(models.Model):
+    chain = models.ForeignKey(TranslatorChain, on_delete=models.CASCADE, related_name="steps")
+    order = models.PositiveSmallIntegerField(_("Order"), default=0)
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, verbose_name=_("Engine Type"),
+        limit_choices_to={"app_label": "translator", "model__endswith": "translator"})
+    object_id = models.PositiveIntegerField(_("Engine ID"))
+    engine = GenericForeignKey("content_type", "object_id")
+    timeout = models.FloatField(
+        _("Latency Budget(s)"), null=True, blank=True,
+        help_text=_("Fail over to the next engine if this one hasn't answered in time. Leave empty to wait"))
+
+    class Meta:
+        ordering = ["order", "pk"]
+        verbose_name = "Step"
+        verbose_name_plural = "Steps"
+
+    def __str__(self):
+        return f"{self.order}: {self.engine}"
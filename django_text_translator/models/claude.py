@@ -1,5 +1,8 @@
 import anthropic
-from .base import TranslatorEngine
+import httpx
+from .base import TranslatorEngine, guarded
+from .. import errors
+from ..clients import http_limits
 import logging
 from django.db import models
 from encrypted_model_fields.fields import EncryptedCharField
@@ -28,7 +31,8 @@ class ClaudeTranslator(TranslatorEngine):
         return anthropic.Anthropic(
             api_key=self.api_key,
             base_url=self.base_url,
-            proxies=self.proxy,
+            max_retries=0,
+            http_client=httpx.Client(proxy=self.proxy, limits=http_limits(), timeout=600.0, follow_redirects=True),
         )
 
     def validate(self) -> bool:
@@ -36,37 +40,73 @@ class ClaudeTranslator(TranslatorEngine):
             res = self.translate("hi", "Chinese Simplified")
             return res.get("text") != ""
 
+    def _ainit(self):
+        return anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            max_retries=0,
+            http_client=httpx.AsyncClient(proxy=self.proxy, limits=http_limits(), timeout=600.0, follow_redirects=True),
+        )
+
+    def _message_request(self, text: str, target_language: str, system_prompt: str = None, user_prompt: str = None) -> dict:
+        system_prompt = (system_prompt or self.translate_prompt).replace('{target_language}', target_language)
+        if user_prompt is not None:
+            system_prompt += f"\n\n{user_prompt}"
+        return dict(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            system=system_prompt,
+            messages=[{"role": "user", "content": text}],
+            temperature=self.temperature,
+            top_p=self.top_p,
+            top_k=self.top_k,
+        )
+
+    @staticmethod
+    def _message_text(res) -> str:
+        result = res.content
+        if result and result[0].type == "text":
+            return result[0].text
+        logging.warning("ClaudeTranslator-> %s", res.stop_reason)
+        return ''
+
+    @guarded
     def translate(self, text:str, target_language:str, system_prompt:str=None, user_prompt:str=None) -> dict:
         logging.info(">>> Claude Translate [%s]:", target_language)
-        client = self._init()
+        client = self.client()
         tokens = client.count_tokens(text)
         translated_text = ''
-        system_prompt = system_prompt or self.translate_prompt
+        error = None
         try:
-            system_prompt = system_prompt.replace('{target_language}', target_language)
-            if user_prompt is not None:
-                system_prompt += f"\n\n{user_prompt}"
-                
-            res = client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=system_prompt,
-                messages=[{"role": "user", "content": text}],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                top_k=self.top_k,
-            )
-            result = res.content
-            if result and result[0].type == "text":
-                translated_text = result[0].text
-            else:
-                logging.warning("ClaudeTranslator-> %s", res.stop_reason)
+            res = client.messages.create(**self._message_request(text, target_language, system_prompt, user_prompt))
+            translated_text = self._message_text(res)
             tokens = res.usage.output_tokens + res.usage.input_tokens
         except Exception as e:
             logging.error("ClaudeTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
         finally:
-            return {'text': translated_text, "tokens": tokens}
+            return {'text': translated_text, "tokens": tokens, "error": error}
+
+    @guarded
+    async def atranslate(self, text:str, target_language:str, system_prompt:str=None, user_prompt:str=None) -> dict:
+        logging.info(">>> Claude Translate [%s]:", target_language)
+        client = self.aclient()
+        tokens = await client.count_tokens(text)
+        translated_text = ''
+        error = None
+        try:
+            res = await client.messages.create(**self._message_request(text, target_language, system_prompt, user_prompt))
+            translated_text = self._message_text(res)
+            tokens = res.usage.output_tokens + res.usage.input_tokens
+        except Exception as e:
+            logging.error("ClaudeTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
+        return {'text': translated_text, "tokens": tokens, "error": error}
         
     def summarize(self, text:str, target_language:str) -> dict:
         logging.info(">>> Claude Summarize [%s]:", target_language)
         return self.translate(text, target_language, system_prompt=self.summary_prompt)
+
+    async def asummarize(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Claude Summarize [%s]:", target_language)
+        return await self.atranslate(text, target_language, system_prompt=self.summary_prompt)
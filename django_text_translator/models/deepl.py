@@ -1,10 +1,15 @@
 import deepl
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded
+from .. import errors
 import logging
 from django.db import models
 from encrypted_model_fields.fields import EncryptedCharField
 from django.utils.translation import gettext_lazy as _
 
+# Failed requests are retried by the engine's retry policy (see retry.run); the SDK's own retries,
+# a module-wide setting, would multiply them.
+deepl.http_client.max_network_retries = 0
+
 class DeepLTranslator(TranslatorEngine):
     # https://github.com/DeepLcom/deepl-python
     api_key = EncryptedCharField(_("API Key"), max_length=255)
@@ -42,24 +47,27 @@ class DeepLTranslator(TranslatorEngine):
 
     def validate(self) -> bool:
         try:
-            translator = self._init()
+            translator = self.client()
             usage = translator.get_usage()
             return usage.character.valid
         except Exception as e:
             logging.error("DeepLTranslator validate ->%s", e)
             return False
 
+    @guarded
     def translate(self, text:str, target_language:str) -> dict:
         logging.info(">>> DeepL Translate [%s]: %s", target_language, text)
         target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
         translated_text = ''
+        error = None
         try:
-            if target_code is None:
-                logging.error("DeepLTranslator->Not support target language:%s", target_language)
-            translator = self._init()
+            translator = self.client()
             resp = translator.translate_text(text, target_lang=target_code, preserve_formatting=True,
                                              split_sentences='nonewlines')
             translated_text = resp.text
         except Exception as e:
             logging.error("DeepLTranslator->%s: %s", e, text)
-        return {'text': translated_text, "characters": len(text)}
+            error = errors.from_exception(e)
+        return {'text': translated_text, "characters": len(text), "error": error}
@@ -1,14 +1,14 @@
 from PyDeepLX import PyDeepLX
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded, requests_per_minute_field
+from .. import errors
 import logging
-from time import sleep
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 class DeepLWebTranslator(TranslatorEngine):
     # https://github.com/OwO-Network/PyDeepLX
     max_characters = models.IntegerField(default=5000)
-    interval = models.IntegerField(_("Request Interval(s)"), default=5)
+    requests_per_minute = requests_per_minute_field(default=12)
     proxy = models.URLField(_("Proxy(optional)"), null=True, blank=True, default=None)
     language_code_map = {
         "English": "EN",
@@ -44,18 +44,19 @@ class DeepLWebTranslator(TranslatorEngine):
             logging.error("DeepLWebTranslator validate ->%s", e)
             return False
 
+    @guarded
     def translate(self, text:str, target_language:str) -> dict:
         logging.info(">>> DeepL Web Translate [%s]: %s", target_language, text)
         target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
         translated_text = ''
+        error = None
         try:
-            if target_code is None:
-                logging.error("DeepLWebTranslator->Not support target language:%s", target_language)
-
             translated_text = PyDeepLX.translate(text=text, targetLang=target_code, sourceLang="auto",
                                                  proxies=self.proxy)
         except Exception as e:
             logging.error("DeepLWebTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
         finally:
-            sleep(self.interval)
-            return {'text': translated_text, "characters": len(text)}
+            return {'text': translated_text, "characters": len(text), "error": error}
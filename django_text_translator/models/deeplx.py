@@ -1,16 +1,15 @@
 import json
-import httpx
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded, requests_per_minute_field
+from .. import errors
+from ..clients import http_request, ahttp_request
 import logging
-from time import sleep
 from django.db import models
-from django.utils.translation import gettext_lazy as _
 
 class DeepLXTranslator(TranslatorEngine):
     # https://github.com/OwO-Network/DeepLX
     deeplx_api = models.CharField(max_length=255, default="http://127.0.0.1:1188/translate")
     max_characters = models.IntegerField(default=5000)
-    interval = models.IntegerField(_("Request Interval(s)"), default=3)
+    requests_per_minute = requests_per_minute_field(default=20)
     language_code_map = {
         "English": "EN",
         "Chinese Simplified": "ZH",
@@ -44,30 +43,53 @@ class DeepLXTranslator(TranslatorEngine):
         except Exception as e:
             return False
 
+    def _request_kwargs(self, text: str, target_code: str) -> dict:
+        data = {
+            "text": text,
+            "source_lang": "auto",
+            "target_lang": target_code,
+        }
+        headers = {
+          'Content-Type': 'application/json'
+        }
+        return {"headers": headers, "content": json.dumps(data)}
+
+    @staticmethod
+    def _parse(resp) -> str:
+        if resp.status_code == 429:
+            logging.warning("DeepLXTranslator-> IP has been blocked by DeepL temporarily")
+        resp.raise_for_status()
+        return resp.json()["data"]
+
+    @guarded
     def translate(self, text:str, target_language:str) -> dict:
         logging.info(">>> DeepLX Translate [%s]: %s", target_language, text)
         target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
         translated_text = ''
+        error = None
         try:
-            if target_code is None:
-                logging.error("DeepLXTranslator->Not support target language:%s", target_language)
-
-            data = {
-                "text": text,
-                "source_lang": "auto",
-                "target_lang": target_code,
-            }
-            headers = {
-              'Content-Type': 'application/json'
-            }
-            post_data = json.dumps(data)
-            resp = httpx.post(url=self.deeplx_api, headers=headers, data=post_data, timeout=10)
-            if resp.status_code == 429:
-                raise ("DeepLXTranslator-> IP has been blocked by DeepL temporarily")
-            translated_text = resp.json()["data"]
+            resp = http_request("POST", self.deeplx_api, **self._request_kwargs(text, target_code))
+            translated_text = self._parse(resp)
         except Exception as e:
             logging.error("DeepLXTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
         finally:
-            sleep(self.interval)
-            return {'text': translated_text, "characters": len(text)}
+            return {'text': translated_text, "characters": len(text), "error": error}
 
+    @guarded
+    async def atranslate(self, text:str, target_language:str) -> dict:
+        logging.info(">>> DeepLX Translate [%s]: %s", target_language, text)
+        target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
+        translated_text = ''
+        error = None
+        try:
+            resp = await ahttp_request("POST", self.deeplx_api, **self._request_kwargs(text, target_code))
+            translated_text = self._parse(resp)
+        except Exception as e:
+            logging.error("DeepLXTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
+        return {'text': translated_text, "characters": len(text), "error": error}
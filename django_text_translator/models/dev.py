@@ -1,14 +1,11 @@
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded
 import logging
 from django.db import models
-from time import sleep
-from django.utils.translation import gettext_lazy as _
 
 
 class TestTranslator(TranslatorEngine):
     translated_text = models.TextField(default="@@Translated Text@@")
     max_characters = models.IntegerField(default=50000)
-    interval = models.IntegerField(_("Request Interval(s)"), default=3)
     is_ai = models.BooleanField(default=True, editable=False)
 
     class Meta:
@@ -18,11 +15,20 @@ class TestTranslator(TranslatorEngine):
     def validate(self) -> bool:
         return True
 
+    @guarded
     def translate(self, text:str, target_language:str) -> dict:
         logging.info(">>> Test Translate [%s]: %s", target_language, text)
-        sleep(self.interval)
-        return {'text': f"{target_language} {self.translated_text} {text}", "tokens": 0, "characters": len(text)}
+        return {'text': f"{target_language} {self.translated_text} {text}", "tokens": 0, "characters": len(text), "error": None}
+
+    @guarded
+    async def atranslate(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Test Translate [%s]: %s", target_language, text)
+        return {'text': f"{target_language} {self.translated_text} {text}", "tokens": 0, "characters": len(text), "error": None}
     
     def summarize(self, text:str, target_language:str) -> dict:
         logging.info(">>> Test Summarize [%s]:", target_language)
         return self.translate(text, target_language)
+
+    async def asummarize(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Test Summarize [%s]:", target_language)
+        return await self.atranslate(text, target_language)
@@ -1,7 +1,8 @@
 import google.generativeai as genai
-from .base import TranslatorEngine
+from google.ai import generativelanguage as glm
+from .base import TranslatorEngine, guarded, requests_per_minute_field
+from .. import errors
 import logging
-from time import sleep
 from django.db import models
 from encrypted_model_fields.fields import EncryptedCharField
 from django.utils.translation import gettext_lazy as _
@@ -18,7 +19,7 @@ class GeminiTranslator(TranslatorEngine):
     top_p = models.FloatField(default=1)
     top_k = models.IntegerField(default=1)
     max_tokens = models.IntegerField(default=1000)
-    interval = models.IntegerField(_("Request Interval(s)"), default=3)
+    requests_per_minute = requests_per_minute_field(default=20)
 
     summary_prompt = models.TextField(default="Summarize the following text in {target_language}.")
 
@@ -28,53 +29,96 @@ class GeminiTranslator(TranslatorEngine):
         verbose_name_plural = "Google Gemini"
 
     def _init(self, system_prompt:str=None):
-        genai.configure(api_key=self.api_key)
-        return genai.GenerativeModel(model_name=self.model, 
+        model = genai.GenerativeModel(model_name=self.model, 
                                      #system_instruction=system_prompt or self.translate_prompt
                                      )
+        # genai.configure() is global to the process, and a model without a client of its own would pick
+        # the default one on its first call, with whatever API key was configured last.
+        model._client = glm.GenerativeServiceClient(client_options={"api_key": self.api_key})
+        return model
+
+    def _ainit(self):
+        # The async client opens a gRPC channel bound to the running loop.
+        model = genai.GenerativeModel(model_name=self.model)
+        model._async_client = glm.GenerativeServiceAsyncClient(client_options={"api_key": self.api_key})
+        return model
 
     def validate(self) -> bool:
         if self.api_key:
             try:
-                model = self._init()
+                model = self.client()
                 res = model.generate_content("hi")
                 return res.candidates[0].finish_reason == 1
             except Exception as e:
                 logging.error("GeminiTranslator validate ->%s", e)
                 return False
 
+    def _prompt(self, text: str, target_language: str, system_prompt: str = None, user_prompt: str = None) -> str:
+        system_prompt = system_prompt or self.translate_prompt
+        return f"{system_prompt.replace('{target_language}', target_language)}\n{user_prompt}\n{text}"
+
+    def _generation_config(self):
+        return genai.types.GenerationConfig(
+            candidate_count=1,
+            temperature=self.temperature,
+            top_p=self.top_p,
+            top_k=self.top_k,
+            max_output_tokens=self.max_tokens
+        )
+
+    @staticmethod
+    def _result(res, text: str):
+        finish_reason = res.candidates[0].finish_reason if res.candidates else None
+        if finish_reason == 1:
+            return res.text, None
+        logging.info("GeminiTranslator finish_reason->%s: %s", getattr(finish_reason, "name", finish_reason), text)
+        # SAFETY / RECITATION, or no candidate at all because the prompt itself was blocked
+        if finish_reason in (3, 4) or finish_reason is None:
+            return '', errors.make_error(errors.CONTENT_POLICY, f"Blocked by Gemini: {getattr(finish_reason, 'name', 'prompt blocked')}")
+        return '', None
+
+    @guarded
     def translate(self, text:str, target_language:str, system_prompt:str=None, user_prompt:str=None) -> dict:
         logging.info(">>> Gemini Translate [%s]:", target_language)
         
         tokens = 0
         translated_text = ''
-        system_prompt = system_prompt or self.translate_prompt
-        prompt = f"{system_prompt.replace('{target_language}', target_language)}\n{user_prompt}\n{text}"
+        error = None
+        prompt = self._prompt(text, target_language, system_prompt, user_prompt)
         try:
-            model = self._init()
-            generation_config = genai.types.GenerationConfig(
-                candidate_count=1,
-                temperature=self.temperature,
-                top_p=self.top_p,
-                top_k=self.top_k,
-                max_output_tokens=self.max_tokens
-            )
-            res = model.generate_content(prompt, generation_config=generation_config)
-            finish_reason = res.candidates[0].finish_reason if res.candidates else None
-            if finish_reason == 1:
-                translated_text = res.text
-            else:
-                translated_text = ''
-                logging.info("GeminiTranslator finish_reason->%s: %s", finish_reason.name, text)
+            model = self.client()
+            res = model.generate_content(prompt, generation_config=self._generation_config())
+            translated_text, error = self._result(res, text)
             tokens = model.count_tokens(prompt).total_tokens
         except Exception as e:
             logging.error("GeminiTranslator->%s: %s", e, text)
-        finally:
-            sleep(self.interval)
+            error = errors.from_exception(e)
+
+        return {'text': translated_text, "tokens": tokens, "error": error}
+
+    @guarded
+    async def atranslate(self, text:str, target_language:str, system_prompt:str=None, user_prompt:str=None) -> dict:
+        logging.info(">>> Gemini Translate [%s]:", target_language)
+
+        tokens = 0
+        translated_text = ''
+        error = None
+        prompt = self._prompt(text, target_language, system_prompt, user_prompt)
+        try:
+            model = self.aclient()
+            res = await model.generate_content_async(prompt, generation_config=self._generation_config())
+            translated_text, error = self._result(res, text)
+            tokens = (await model.count_tokens_async(prompt)).total_tokens
+        except Exception as e:
+            logging.error("GeminiTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
 
-        return {'text': translated_text, "tokens": tokens}
+        return {'text': translated_text, "tokens": tokens, "error": error}
     
     def summarize(self, text:str, target_language:str) -> dict:
         logging.info(">>> Gemini Summarize [%s]:", target_language)
         return self.translate(text, target_language, system_prompt=self.summary_prompt)
 
+    async def asummarize(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Gemini Summarize [%s]:", target_language)
+        return await self.atranslate(text, target_language, system_prompt=self.summary_prompt)
@@ -1,6 +1,6 @@
-import httpx
-from time import sleep
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded, requests_per_minute_field
+from .. import errors
+from ..clients import http_request, ahttp_request
 import logging
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -8,7 +8,7 @@ from django.utils.translation import gettext_lazy as _
 class GoogleTranslateWebTranslator(TranslatorEngine):
     base_url = models.URLField(_("URL"), default="https://translate.googleapis.com/translate_a/single")
     proxy = models.URLField(_("Proxy(optional)"), null=True, blank=True, default=None)
-    interval = models.IntegerField(_("Request Interval(s)"), default=3)
+    requests_per_minute = requests_per_minute_field(default=20)
     max_characters = models.IntegerField(default=1000)
     language_code_map = {
         "English": "en",
@@ -41,30 +41,54 @@ class GoogleTranslateWebTranslator(TranslatorEngine):
         results = self.translate("hi", "Chinese Simplified")
         return results.get("text") != ""
 
+    @staticmethod
+    def _params(text: str, target_code: str) -> dict:
+        return {
+            "client": "gtx",
+            "sl": "auto",
+            "tl": target_code,
+            "dt": "t",
+            "q": text,
+        }
+
+    @staticmethod
+    def _parse(resp):
+        resp.raise_for_status()
+        resp_json = resp.json()
+        if resp_json:
+            return resp_json[0][0][0], None
+        logging.error("GoogleTranslateWebTranslator->Invalid response: %s", resp.text)
+        return '', errors.make_error(errors.UNKNOWN, "Invalid response")
+
+    @guarded
     def translate(self, text:str, target_language:str) -> dict:
         logging.info(">>> Google Translate Web Translate [%s]:", target_language)
-        target_language = self.language_code_map.get(target_language)
+        target_code = self.language_code_map.get(target_language)
+        if target_code is None:
+            return self.unsupported_language(target_language)
         translated_text = ''
-        if target_language is None:
-            logging.error("GoogleTranslateWebTranslator->Not support target language:%s", target_language)
-            return {'text': translated_text, "characters": len(text)}
+        error = None
         try:
-            params = {
-                "client": "gtx",
-                "sl": "auto",
-                "tl": target_language,
-                "dt": "t",
-                "q": text,
-            }
-            resp = httpx.get(self.base_url, params=params, timeout=10, proxy=self.proxy)
-            resp.raise_for_status()
-            resp_json = resp.json()
-            if resp_json:
-                translated_text = resp_json[0][0][0]
-            else:
-                logging.error("GoogleTranslateWebTranslator->Invalid response: %s", resp.text)
+            resp = http_request("GET", self.base_url, params=self._params(text, target_code), proxy=self.proxy)
+            translated_text, error = self._parse(resp)
         except Exception as e:
             logging.error("GoogleTranslateWebTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
         finally:
-            sleep(self.interval)
-            return {'text': translated_text, "characters": len(text)}
+            return {'text': translated_text, "characters": len(text), "error": error}
+
+    @guarded
+    async def atranslate(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Google Translate Web Translate [%s]:", target_language)
+        target_code = self.language_code_map.get(target_language)
+        if target_code is None:
+            return self.unsupported_language(target_language)
+        translated_text = ''
+        error = None
+        try:
+            resp = await ahttp_request("GET", self.base_url, params=self._params(text, target_code), proxy=self.proxy)
+            translated_text, error = self._parse(resp)
+        except Exception as e:
+            logging.error("GoogleTranslateWebTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
+        return {'text': translated_text, "characters": len(text), "error": error}
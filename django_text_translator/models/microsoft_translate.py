@@ -1,5 +1,7 @@
 import httpx
-from .base import TranslatorEngine
+from .base import TranslatorEngine, guarded
+from .. import errors
+from ..clients import http_limits
 import logging
 from django.db import models
 from encrypted_model_fields.fields import EncryptedCharField
@@ -39,37 +41,62 @@ class MicrosoftTranslator(TranslatorEngine):
         verbose_name = "Microsoft Translator"
         verbose_name_plural = "Microsoft Translator"
 
+    def _init(self):
+        return httpx.Client(limits=http_limits())
+
+    def _ainit(self):
+        return httpx.AsyncClient(limits=http_limits())
+
     def validate(self) -> bool:
         result = self.translate("Hi", "Chinese Simplified")
         return result.get("text") != ""
 
+    def _request_kwargs(self, text: str, target_code: str) -> dict:
+        params = {"api-version": "3.0", "to": target_code}
+        headers = {
+            "Ocp-Apim-Subscription-Key": self.api_key,
+            "Ocp-Apim-Subscription-Region": self.location,
+            "Content-type": "application/json",
+            "X-ClientTraceId": str(uuid.uuid4()),
+        }
+        body = [{"text": text}]
+        return {"params": params, "headers": headers, "json": body, "timeout": 10}
+
+    @staticmethod
+    def _parse(resp) -> str:
+        resp.raise_for_status()
+        # [{'detectedLanguage': {'language': 'en', 'score': 1.0}, 'translations': [{'text': '你好，我叫约翰。', 'to': 'zh-Hans'}]}]
+        return resp.json()[0]["translations"][0]["text"]
+
+    @guarded
     def translate(self, text:str, target_language:str) -> dict:
         logging.info(">>> Microsoft Translate [%s]: %s", target_language, text)
         target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
         translated_text = ''
+        error = None
         try:
-            if target_code is None:
-                logging.error("MicrosoftTranslator->Not support target language:%s", target_language)
-
-            constructed_url = f"{self.endpoint}/translate"
-            params = {"api-version": "3.0", "to": target_code}
-            headers = {
-                "Ocp-Apim-Subscription-Key": self.api_key,
-                "Ocp-Apim-Subscription-Region": self.location,
-                "Content-type": "application/json",
-                "X-ClientTraceId": str(uuid.uuid4()),
-            }
-            body = [{"text": text}]
-
-            with httpx.Client() as client:
-                resp = client.post(
-                    constructed_url, params=params, headers=headers, json=body, timeout=10
-                )
-                resp.raise_for_status()
-                translated_text = resp.json()[0]["translations"][0]["text"]
-            # [{'detectedLanguage': {'language': 'en', 'score': 1.0}, 'translations': [{'text': '你好，我叫约翰。', 'to': 'zh-Hans'}]}]
+            resp = self.client().post(f"{self.endpoint}/translate", **self._request_kwargs(text, target_code))
+            translated_text = self._parse(resp)
         except Exception as e:
             logging.error("MicrosoftTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
         finally:
-            return {'text': translated_text, "characters": len(text)}
+            return {'text': translated_text, "characters": len(text), "error": error}
 
+    @guarded
+    async def atranslate(self, text:str, target_language:str) -> dict:
+        logging.info(">>> Microsoft Translate [%s]: %s", target_language, text)
+        target_code = self.language_code_map.get(target_language, None)
+        if target_code is None:
+            return self.unsupported_language(target_language)
+        translated_text = ''
+        error = None
+        try:
+            resp = await self.aclient().post(f"{self.endpoint}/translate", **self._request_kwargs(text, target_code))
+            translated_text = self._parse(resp)
+        except Exception as e:
+            logging.error("MicrosoftTranslator->%s: %s", e, text)
+            error = errors.from_exception(e)
+        return {'text': translated_text, "characters": len(text), "error": error}
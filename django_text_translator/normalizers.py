@@ -0,0 +1,68 @@
+import html
+import re
+import unicodedata
+from functools import lru_cache
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# Horizontal whitespace, including the non-breaking and fixed-width spaces feeds like to use.
+HORIZONTAL_SPACE = re.compile(r"[ \t\f\v\u00a0\u1680\u2000-\u200a\u202f\u205f\u3000]+")
+TRAILING_SPACE = re.compile(r" +\n")
+
+
+def identity(text: str) -> str:
+    return text
+
+
+def nfc(text: str) -> str:
+    return unicodedata.normalize("NFC", text)
+
+
+def collapse_whitespace(text: str) -> str:
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = HORIZONTAL_SPACE.sub(" ", text)
+    return TRAILING_SPACE.sub("\n", text).strip()
+
+
+def unescape_html(text: str) -> str:
+    return html.unescape(text)
+
+
+def default(text: str) -> str:
+    return collapse_whitespace(nfc(text))
+
+
+def full(text: str) -> str:
+    return collapse_whitespace(nfc(unescape_html(text)))
+
+
+NORMALIZERS = {
+    "none": identity,
+    "nfc": nfc,
+    "whitespace": collapse_whitespace,
+    "html": unescape_html,
+    "default": default,
+    "full": full,
+}
+
+
+@lru_cache(maxsize=None)
+def get_normalizer():
+    """
+    The function applied to texts before they are hashed into Translated_Content keys,
+    picked by TEXT_TRANSLATOR_NORMALIZER: one of NORMALIZERS, a dotted path or a callable (default: "none").
+    """
+    normalizer = getattr(settings, "TEXT_TRANSLATOR_NORMALIZER", None) or "none"
+    if callable(normalizer):
+        return normalizer
+    if normalizer in NORMALIZERS:
+        return NORMALIZERS[normalizer]
+    return import_string(normalizer)
+
+
+@receiver(setting_changed)
+def _reset_normalizer(setting, **kwargs):
+    if setting == "TEXT_TRANSLATOR_NORMALIZER":
+        get_normalizer.cache_clear()
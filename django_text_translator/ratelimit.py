@@ -0,0 +1,304 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from django.conf import settings
+from django.core.cache import caches
+
+WINDOW = 60
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at `per_minute` tokens per minute, holding at most a minute's worth.
+    Callers take tokens up front and may drive the bucket into debt; the debt is the time they have to wait,
+    so concurrent callers queue up in order instead of polling.
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float = 1) -> float:
+        """Take `amount` tokens; returns the seconds to wait before using them."""
+        with self._lock:
+            self._refill()
+            self.level -= min(amount, self.capacity)
+            return max(0.0, -self.level / self.rate)
+
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self.level
+
+    def take(self, amount: float = 1) -> bool:
+        """Take `amount` tokens only if they are there now, without going into debt."""
+        with self._lock:
+            self._refill()
+            if self.level < amount:
+                return False
+            self.level -= amount
+            return True
+
+    def debit(self, amount: float):
+        """
+        Take tokens that were already used (e.g. tokens reported by the provider after the call);
+        a negative amount gives back what a reservation took in excess.
+        """
+        with self._lock:
+            self._refill()
+            self.level = min(self.capacity, self.level - amount)
+
+    def wait_time(self) -> float:
+        with self._lock:
+            self._refill()
+            return max(0.0, -self.level / self.rate)
+
+
+class EngineLimiter:
+    """
+    The request and characters/tokens budgets of one engine. A call reserves one request and an estimate of
+    its characters/tokens, and waits until both are covered; once it returns, the estimate is corrected
+    by what it actually used.
+    """
+
+    def __init__(self, requests_per_minute: int = None, units_per_minute: int = None):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.units = TokenBucket(units_per_minute) if units_per_minute else None
+
+    def delay(self, units: int = 0) -> float:
+        delay = self.requests.reserve() if self.requests is not None else 0.0
+        if self.units is not None:
+            delay = max(delay, self.units.reserve(units))
+        return delay
+
+    def _reserved(self, units: int) -> int:
+        return min(units, self.units.capacity) if self.units is not None else 0
+
+    def acquire(self, units: int = 0):
+        """Wait for the budgets of a call expected to use `units`; returns the reservation for consume()."""
+        delay = self.delay(units)
+        if delay:
+            time.sleep(delay)
+        return self._reserved(units)
+
+    async def aacquire(self, units: int = 0):
+        delay = self.delay(units)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._reserved(units)
+
+    def consume(self, result: dict, reserved=0):
+        if self.units is not None:
+            used = units_used(result) if result else 0
+            if used != reserved:
+                self.units.debit(used - reserved)
+
+    async def aconsume(self, result: dict, reserved=0):
+        self.consume(result, reserved)
+
+
+def units_used(result: dict) -> int:
+    return result.get('tokens') or result.get('characters') or 0
+
+
+class CacheLimiter:
+    """
+    EngineLimiter shared by every process through a Django cache (TEXT_TRANSLATOR_RATE_LIMIT_CACHE):
+    a sliding window estimated from the counters of the current and previous minute, which only needs
+    the atomic add/incr of Redis or Memcached. A call is admitted by counting its estimated characters/tokens
+    with incr, so that concurrent processes see each other's calls, and the counter is corrected by what it
+    actually used once it returns. If the cache fails, the process falls back to its own buckets.
+    """
+
+    def __init__(self, alias: str, key: str, requests_per_minute: int = None, units_per_minute: int = None):
+        self.alias = alias
+        self.key = key
+        self.requests_per_minute = requests_per_minute
+        self.units_per_minute = units_per_minute
+        self.local = EngineLimiter(requests_per_minute, units_per_minute)
+
+    def _keys(self, kind: str, now: float):
+        window = int(now // WINDOW)
+        return f"{self.key}:{kind}:{window}", f"{self.key}:{kind}:{window - 1}", now % WINDOW
+
+    @staticmethod
+    def _wait(current: int, previous: int, elapsed: float, limit: int) -> float:
+        # Seconds until `current` (this window) plus the still-weighted part of `previous` fits in `limit`.
+        over = previous * (WINDOW - elapsed) / WINDOW + current - limit
+        if over <= 0:
+            return 0.0
+        wait = WINDOW - elapsed
+        if previous:
+            wait = min(wait, over * WINDOW / previous)
+        # Jitter, so that the waiting processes don't all come back at the same instant.
+        return max(wait, 0.01) * random.uniform(1, 1.1)
+
+    def delay(self, units: int = 0):
+        """
+        One attempt: (0, reservation) when the call is admitted and counted,
+        else (seconds to wait before retrying, None).
+        """
+        backend = caches[self.alias]
+        now = time.time()
+        reservation = ("", 0)
+        if self.units_per_minute:
+            current, previous, elapsed = self._keys("units", now)
+            # A call larger than the whole budget is admitted once the window is empty.
+            units = min(units, self.units_per_minute)
+            backend.add(current, 0, timeout=WINDOW * 2)
+            count = backend.incr(current, units) if units else backend.get(current, 0)
+            wait = self._wait(count, backend.get(previous, 0), elapsed, self.units_per_minute)
+            if wait:
+                if units:
+                    backend.decr(current, units)
+                return wait, None
+            reservation = (current, units)
+        if self.requests_per_minute:
+            current, previous, elapsed = self._keys("requests", now)
+            backend.add(current, 0, timeout=WINDOW * 2)
+            count = backend.incr(current)
+            wait = self._wait(count, backend.get(previous, 0), elapsed, self.requests_per_minute)
+            if wait:
+                backend.decr(current)
+                if reservation[1]:
+                    backend.decr(*reservation)
+                return wait, None
+        return 0.0, reservation
+
+    async def adelay(self, units: int = 0):
+        backend = caches[self.alias]
+        now = time.time()
+        reservation = ("", 0)
+        if self.units_per_minute:
+            current, previous, elapsed = self._keys("units", now)
+            units = min(units, self.units_per_minute)
+            await backend.aadd(current, 0, timeout=WINDOW * 2)
+            count = await backend.aincr(current, units) if units else await backend.aget(current, 0)
+            wait = self._wait(count, await backend.aget(previous, 0), elapsed, self.units_per_minute)
+            if wait:
+                if units:
+                    await backend.adecr(current, units)
+                return wait, None
+            reservation = (current, units)
+        if self.requests_per_minute:
+            current, previous, elapsed = self._keys("requests", now)
+            await backend.aadd(current, 0, timeout=WINDOW * 2)
+            count = await backend.aincr(current)
+            wait = self._wait(count, await backend.aget(previous, 0), elapsed, self.requests_per_minute)
+            if wait:
+                await backend.adecr(current)
+                if reservation[1]:
+                    await backend.adecr(*reservation)
+                return wait, None
+        return 0.0, reservation
+
+    def acquire(self, units: int = 0):
+        """
+        Wait until a call expected to use `units` fits the shared budgets; returns the reservation for
+        consume(): the counter the units were added to and how many, or (None, units) on the local fallback.
+        """
+        try:
+            while True:
+                delay, reservation = self.delay(units)
+                if not delay:
+                    return reservation
+                time.sleep(delay)
+        except Exception as e:
+            logging.error("CacheLimiter %s ->%s", self.key, e)
+            return None, self.local.acquire(units)
+
+    async def aacquire(self, units: int = 0):
+        try:
+            while True:
+                delay, reservation = await self.adelay(units)
+                if not delay:
+                    return reservation
+                await asyncio.sleep(delay)
+        except Exception as e:
+            logging.error("CacheLimiter %s ->%s", self.key, e)
+            return None, await self.local.aacquire(units)
+
+    def _correction(self, result: dict, reservation):
+        # The counter holding the reservation (the current one when nothing was reserved) and the units to add.
+        key, reserved = reservation or ("", 0)
+        delta = (units_used(result) if result else 0) - reserved
+        return key or self._keys("units", time.time())[0], delta
+
+    def consume(self, result: dict, reservation=None):
+        if not self.units_per_minute:
+            return
+        if reservation is not None and reservation[0] is None:
+            # Reserved from the local buckets after a cache failure.
+            return self.local.consume(result, reservation[1])
+        key, delta = self._correction(result, reservation)
+        if not delta:
+            return
+        backend = caches[self.alias]
+        try:
+            backend.add(key, 0, timeout=WINDOW * 2)
+            backend.incr(key, delta)
+        except Exception as e:
+            logging.error("CacheLimiter %s ->%s", self.key, e)
+            self.local.consume(result)
+
+    async def aconsume(self, result: dict, reservation=None):
+        if not self.units_per_minute:
+            return
+        if reservation is not None and reservation[0] is None:
+            return self.local.consume(result, reservation[1])
+        key, delta = self._correction(result, reservation)
+        if not delta:
+            return
+        backend = caches[self.alias]
+        try:
+            await backend.aadd(key, 0, timeout=WINDOW * 2)
+            await backend.aincr(key, delta)
+        except Exception as e:
+            logging.error("CacheLimiter %s ->%s", self.key, e)
+            self.local.consume(result)
+
+
+class LimiterRegistry:
+    """
+    One limiter per engine row and limits, shared by every caller of the process: an EngineLimiter, or a
+    CacheLimiter keyed by the engine row when TEXT_TRANSLATOR_RATE_LIMIT_CACHE names a CACHES alias.
+    Engines with an endpoint pool have one per pool member instead, since providers limit each API key.
+    """
+
+    def __init__(self):
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def get(self, engine, member=None):
+        requests_per_minute = engine.requests_per_minute
+        units_per_minute = engine.units_per_minute
+        if not requests_per_minute and not units_per_minute:
+            return None
+        alias = getattr(settings, "TEXT_TRANSLATOR_RATE_LIMIT_CACHE", None)
+        member_id = member.id if member is not None else None
+        key = (engine._meta.label, engine.pk, member_id, requests_per_minute, units_per_minute, alias)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                if alias:
+                    cache_key = f"translator:rate:{engine._meta.label}:{engine.pk}"
+                    if member_id is not None:
+                        cache_key = f"{cache_key}:{member_id}"
+                    limiter = CacheLimiter(alias, cache_key, requests_per_minute, units_per_minute)
+                else:
+                    limiter = EngineLimiter(requests_per_minute, units_per_minute)
+                self._limiters[key] = limiter
+        return limiter
+
+
+limiters = LimiterRegistry()
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from . import breaker, endpoints, errors
+
+MIN_GAP = 0.05
+SPEED_UP = 0.9
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient failures (errors.RETRYABLE): the n-th retry waits
+    a random time up to backoff * 2**n, capped at backoff_max, and at least the provider's Retry-After.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff: float = 1.0, backoff_max: float = 60.0):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+    @classmethod
+    def for_engine(cls, engine):
+        return cls(engine.max_retries, engine.retry_backoff, engine.retry_backoff_max)
+
+    def retry_delay(self, attempt: int, error, failover: bool = False) -> float:
+        """
+        Seconds to wait before retrying after `error`, or None to give up. With `failover` the retry goes
+        to another endpoint of the engine, so a rejected key is retried too and Retry-After doesn't apply.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if not errors.is_retryable(error) and not (failover and endpoints.is_rejected(error)):
+            return None
+        retry_after = 0 if failover else error.get('retry_after') or 0
+        if retry_after > self.backoff_max:
+            return None
+        return max(random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt)), retry_after)
+
+
+class Throttle:
+    """
+    Pacing learned from an engine's answers: each rate-limited answer doubles the gap kept between its
+    requests (and holds all of them until Retry-After), each success shrinks the gap by a tenth until it's gone.
+    """
+
+    def __init__(self, initial_gap: float = 1.0, max_gap: float = 60.0):
+        self.initial_gap = initial_gap
+        self.max_gap = max_gap
+        self.gap = 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.gap
+            return start - now
+
+    def record(self, error):
+        with self._lock:
+            if error and error.get('type') == errors.RATE_LIMITED:
+                self.gap = min(max(self.gap * 2, self.initial_gap, MIN_GAP), self.max_gap)
+                if error.get('retry_after'):
+                    self._next = max(self._next, time.monotonic() + min(error['retry_after'], self.max_gap))
+                logging.warning("Throttle->Rate limited, %.2fs between requests", self.gap)
+            elif not error and self.gap:
+                self.gap = self.gap * SPEED_UP if self.gap * SPEED_UP >= MIN_GAP else 0.0
+
+
+class ThrottleRegistry:
+    """
+    One Throttle per engine row, shared by every caller of the process. Engines with an endpoint pool
+    have none: the pool rests each rate-limited member on its own instead of slowing down all of them.
+    """
+
+    def __init__(self):
+        self._throttles = {}
+        self._lock = threading.Lock()
+
+    def get(self, engine):
+        if not engine.adaptive_throttle or engine.endpoint_pool() is not None:
+            return None
+        key = (engine._meta.label, engine.pk, engine.retry_backoff, engine.retry_backoff_max)
+        with self._lock:
+            throttle = self._throttles.get(key)
+            if throttle is None:
+                throttle = self._throttles[key] = Throttle(engine.retry_backoff, engine.retry_backoff_max)
+        return throttle
+
+
+throttles = ThrottleRegistry()
+
+
+def _log_retry(engine, delay, error, attempt, policy):
+    logging.warning("%s->Retrying in %.1fs after %s (%d/%d): %s", engine.__class__.__name__, delay,
+                    error['type'], attempt, policy.max_retries, error.get('message'))
+
+
+def _circuit_open(engine, retry_after: float) -> dict:
+    return {'text': '', 'tokens': 0, 'characters': 0, 'error': breaker.open_error(engine, retry_after)}
+
+
+def run(engine, attempt, circuit=None):
+    """
+    Call attempt() (one provider request returning a result dict) under the engine's retry policy and throttle.
+    The circuit breaker is checked before every request, ahead of the throttle, so that calls to an engine
+    whose breaker is open fail at once instead of waiting for a throttle slot.
+    """
+    policy = RetryPolicy.for_engine(engine)
+    throttle = throttles.get(engine)
+    pool = engine.endpoint_pool()
+    number = 0
+    while True:
+        if circuit is not None and (retry_after := circuit.retry_after()):
+            return _circuit_open(engine, retry_after)
+        if throttle is not None and (wait := throttle.delay()):
+            time.sleep(wait)
+        result = attempt()
+        error = result.get('error')
+        if throttle is not None:
+            throttle.record(error)
+        delay = policy.retry_delay(number, error, failover=pool is not None and pool.available())
+        if delay is None:
+            return result
+        number += 1
+        _log_retry(engine, delay, error, number, policy)
+        time.sleep(delay)
+
+
+async def arun(engine, attempt, circuit=None):
+    """run() for a coroutine function."""
+    policy = RetryPolicy.for_engine(engine)
+    throttle = throttles.get(engine)
+    pool = engine.endpoint_pool()
+    number = 0
+    while True:
+        if circuit is not None and (retry_after := await circuit.aretry_after()):
+            return _circuit_open(engine, retry_after)
+        if throttle is not None and (wait := throttle.delay()):
+            await asyncio.sleep(wait)
+        result = await attempt()
+        error = result.get('error')
+        if throttle is not None:
+            throttle.record(error)
+        delay = policy.retry_delay(number, error, failover=pool is not None and pool.available())
+        if delay is None:
+            return result
+        number += 1
+        _log_retry(engine, delay, error, number, policy)
+        await asyncio.sleep(delay)
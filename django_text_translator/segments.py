@@ -0,0 +1,35 @@
+import re
+
+# Separators are captured so that joining the pieces gives back the original text exactly.
+SPLITTERS = {
+    "paragraph": re.compile(r"(\n[ \t\r\f\v]*\n\s*)"),
+    "sentence": re.compile(r"((?<=[.!?。！？])\s+|\n[ \t\r\f\v]*\n\s*)"),
+}
+
+
+def split_text(text: str, mode: str = "paragraph") -> list:
+    """
+    Split text into pieces for segment-level caching.
+    Returns a list of (leading whitespace, segment, trailing whitespace) tuples; separators and
+    blank pieces have an empty segment. Concatenating every tuple gives back the original text.
+    """
+    if mode not in SPLITTERS:
+        raise ValueError(f"Unknown split mode: {mode!r}, expected one of {', '.join(SPLITTERS)}")
+    pieces = []
+    for piece in SPLITTERS[mode].split(text):
+        if not piece:
+            continue
+        segment = piece.strip()
+        if not segment:
+            pieces.append((piece, "", ""))
+            continue
+        start = piece.index(segment)
+        pieces.append((piece[:start], segment, piece[start + len(segment):]))
+    return pieces
+
+
+def join_segments(pieces: list, translations: dict) -> str:
+    return "".join(
+        f"{lead}{translations.get(segment, segment)}{trail}" if segment else lead
+        for lead, segment, trail in pieces
+    )
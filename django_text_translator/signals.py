@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete
+from .clients import registry
+from .models import TranslatorEngine
+
+
+def close_engine_clients(sender, instance, **kwargs):
+    registry.invalidate(instance)
+
+
+def connect(app_config):
+    # Edited engines get new clients through their config fingerprint; deleted ones are closed here.
+    # One receiver per engine model: a post_delete receiver without a sender would disable Django's
+    # fast deletes for every model of the project, Translated_Content included.
+    for model in app_config.get_models():
+        if issubclass(model, TranslatorEngine):
+            post_delete.connect(close_engine_clients, sender=model, dispatch_uid=f"translator_clients_delete_{model._meta.label}")
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import Future
+from django.conf import settings
+from django.core.cache import caches
+
+DEFAULT_TIMEOUT = 120
+POLL_INTERVAL = 0.2
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one: the first caller runs the function,
+    the others block until it finishes and get its result (or its exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines: followers await the leader's task, per event loop."""
+
+    def __init__(self):
+        self._loops = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    async def do(self, key, fn):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._loops.get(loop)
+            if calls is None:
+                calls = self._loops[loop] = {}
+        future = calls.get(key)
+        if future is not None:
+            # shield: a cancelled follower must not cancel the leader's call.
+            return await asyncio.shield(future)
+        future = loop.create_future()
+        calls[key] = future
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Retrieved, so that asyncio doesn't log it when nobody else waited.
+            raise
+        finally:
+            calls.pop(key, None)
+
+
+class CacheLease:
+    """
+    Cross-process single flight through a Django cache: the process that adds the lease key calls the
+    provider and publishes a successful result; the others poll for it until the lease is released or expires.
+    The lease holds a token of its holder, so that a leader that outran the lease timeout doesn't release
+    the lease another process took in the meantime.
+    """
+
+    def __init__(self, alias: str, timeout: int = DEFAULT_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+
+    @staticmethod
+    def _release(backend, lease_key: str, token: str):
+        # Django caches have no compare-and-delete: this narrows the race to the get/delete round trip.
+        try:
+            if backend.get(lease_key) == token:
+                backend.delete(lease_key)
+        except Exception as e:
+            logging.error("CacheLease release ->%s", e)
+
+    @staticmethod
+    async def _arelease(backend, lease_key: str, token: str):
+        try:
+            if await backend.aget(lease_key) == token:
+                await backend.adelete(lease_key)
+        except Exception as e:
+            logging.error("CacheLease release ->%s", e)
+
+    def do(self, key: bytes, fn):
+        backend = caches[self.alias]
+        lease_key = f"translator:lease:{key.hex()}"
+        result_key = f"translator:flight:{key.hex()}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = backend.add(lease_key, token, timeout=self.timeout)
+        except Exception as e:
+            logging.error("CacheLease add ->%s", e)
+            return fn()
+
+        if acquired:
+            try:
+                result = fn()
+                if result and result.get('text'):
+                    backend.set(result_key, result, timeout=self.timeout)
+                return result
+            finally:
+                self._release(backend, lease_key, token)
+
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            result = backend.get(result_key)
+            if result is not None:
+                return result
+            if backend.get(lease_key) is None:
+                break
+            time.sleep(POLL_INTERVAL)
+        # The leader failed, gave up or took too long: try ourselves.
+        return backend.get(result_key) or fn()
+
+    async def ado(self, key: bytes, fn):
+        backend = caches[self.alias]
+        lease_key = f"translator:lease:{key.hex()}"
+        result_key = f"translator:flight:{key.hex()}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await backend.aadd(lease_key, token, timeout=self.timeout)
+        except Exception as e:
+            logging.error("CacheLease add ->%s", e)
+            return await fn()
+
+        if acquired:
+            try:
+                result = await fn()
+                if result and result.get('text'):
+                    await backend.aset(result_key, result, timeout=self.timeout)
+                return result
+            finally:
+                await self._arelease(backend, lease_key, token)
+
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            result = await backend.aget(result_key)
+            if result is not None:
+                return result
+            if await backend.aget(lease_key) is None:
+                break
+            await asyncio.sleep(POLL_INTERVAL)
+        return await backend.aget(result_key) or await fn()
+
+
+_local = SingleFlight()
+_async_local = AsyncSingleFlight()
+
+
+def do(key: bytes, fn):
+    """
+    Run fn() once per key at a time. TEXT_TRANSLATOR_SINGLE_FLIGHT (default True) toggles the in-process
+    de-duplication; TEXT_TRANSLATOR_SINGLE_FLIGHT_CACHE names a CACHES alias to also de-duplicate across processes.
+    """
+    if not getattr(settings, "TEXT_TRANSLATOR_SINGLE_FLIGHT", True):
+        return fn()
+    alias = getattr(settings, "TEXT_TRANSLATOR_SINGLE_FLIGHT_CACHE", None)
+    if alias:
+        lease = CacheLease(alias, getattr(settings, "TEXT_TRANSLATOR_SINGLE_FLIGHT_TIMEOUT", DEFAULT_TIMEOUT))
+        return _local.do(key, lambda: lease.do(key, fn))
+    return _local.do(key, fn)
+
+
+async def ado(key: bytes, fn):
+    """do() for coroutine functions, with the same settings."""
+    if not getattr(settings, "TEXT_TRANSLATOR_SINGLE_FLIGHT", True):
+        return await fn()
+    alias = getattr(settings, "TEXT_TRANSLATOR_SINGLE_FLIGHT_CACHE", None)
+    if alias:
+        lease = CacheLease(alias, getattr(settings, "TEXT_TRANSLATOR_SINGLE_FLIGHT_TIMEOUT", DEFAULT_TIMEOUT))
+        return await _async_local.do(key, lambda: lease.ado(key, fn))
+    return await _async_local.do(key, fn)
@@ -0,0 +1,201 @@
+import gzip
+import logging
+import mmap
+import struct
+import threading
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from .fields import decompress_text
+
+# Two layouts share the same records:
+# - stream: gzip(STREAM_MAGIC + records), compact, for dump/load;
+# - indexed: INDEX_MAGIC + header + records + sorted (hash, offset) index, uncompressed so it can be mmapped.
+STREAM_MAGIC = b"TTSNAP1\n"
+INDEX_MAGIC = b"TTIDX1\n\x00"
+GZIP_MAGIC = b"\x1f\x8b"
+INDEX_HEADER = struct.Struct("<QQ")  # record count, index offset
+INDEX_ENTRY = struct.Struct("<8sQ")  # hash, record offset
+RECORD_HEAD = struct.Struct("<8siiIIII")  # hash, tokens, characters, then the byte lengths of the 4 strings
+FIELDS = ("hash", "original_content", "translated_language", "translated_content", "tokens", "characters", "namespace")
+READ_BATCH_SIZE = 2000
+
+
+def encode_record(text_hash, original, language, translated, tokens, characters, namespace) -> bytes:
+    strings = [value.encode("utf-8") for value in (original, language, translated, namespace or "")]
+    return RECORD_HEAD.pack(bytes(text_hash), tokens, characters, *map(len, strings)) + b"".join(strings)
+
+
+def decode_record(buffer, offset=0):
+    """Returns the row as a FIELDS tuple and the offset of the next record."""
+    text_hash, tokens, characters, *lengths = RECORD_HEAD.unpack_from(buffer, offset)
+    offset += RECORD_HEAD.size
+    strings = []
+    for length in lengths:
+        strings.append(bytes(buffer[offset:offset + length]).decode("utf-8"))
+        offset += length
+    original, language, translated, namespace = strings
+    return (text_hash, original, language, translated, tokens, characters, namespace), offset
+
+
+def _read_record(f):
+    head = f.read(RECORD_HEAD.size)
+    if not head:
+        return None
+    if len(head) < RECORD_HEAD.size:
+        raise ValueError("Truncated snapshot")
+    text_hash, tokens, characters, *lengths = RECORD_HEAD.unpack(head)
+    strings = []
+    for length in lengths:
+        data = f.read(length)
+        if len(data) < length:
+            raise ValueError("Truncated snapshot")
+        strings.append(data.decode("utf-8"))
+    original, language, translated, namespace = strings
+    return text_hash, original, language, translated, tokens, characters, namespace
+
+
+def iter_rows(batch_size: int = READ_BATCH_SIZE):
+    """Stream every Translated_Content row (content as stored, maybe compressed) in key order."""
+    model = apps.get_model("translator", "Translated_Content")
+    last_hash = None
+    while True:
+        rows = model.objects.order_by("hash")
+        if last_hash is not None:
+            rows = rows.filter(hash__gt=last_hash)
+        rows = list(rows.values_list(*FIELDS)[:batch_size])
+        if not rows:
+            return
+        last_hash = rows[-1][0]
+        for row in rows:
+            yield (bytes(row[0]),) + tuple(row[1:])
+
+
+def write_stream(path: str, rows) -> int:
+    count = 0
+    with gzip.open(path, "wb", compresslevel=6) as f:
+        f.write(STREAM_MAGIC)
+        for row in rows:
+            f.write(encode_record(*row))
+            count += 1
+    return count
+
+
+def write_indexed(path: str, rows) -> int:
+    index = []
+    with open(path, "wb") as f:
+        f.write(INDEX_MAGIC)
+        f.write(INDEX_HEADER.pack(0, 0))
+        for row in rows:
+            index.append((row[0], f.tell()))
+            f.write(encode_record(*row))
+        index_offset = f.tell()
+        index.sort()
+        for text_hash, offset in index:
+            f.write(INDEX_ENTRY.pack(text_hash, offset))
+        f.seek(len(INDEX_MAGIC))
+        f.write(INDEX_HEADER.pack(len(index), index_offset))
+    return len(index)
+
+
+def read_rows(path: str):
+    """Yield the FIELDS tuples of a snapshot written by write_stream or write_indexed."""
+    with open(path, "rb") as f:
+        magic = f.read(len(INDEX_MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        with gzip.open(path, "rb") as f:
+            if f.read(len(STREAM_MAGIC)) != STREAM_MAGIC:
+                raise ValueError(f"{path} is not a translation snapshot")
+            while (row := _read_record(f)) is not None:
+                yield row
+    elif magic == INDEX_MAGIC:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            count, index_offset = INDEX_HEADER.unpack_from(mm, len(INDEX_MAGIC))
+            offset = len(INDEX_MAGIC) + INDEX_HEADER.size
+            while offset < index_offset:
+                row, offset = decode_record(mm, offset)
+                yield row
+    else:
+        raise ValueError(f"{path} is not a translation snapshot")
+
+
+class SnapshotStore:
+    """Read-only lookups by key in an indexed snapshot, through mmap and a binary search of its index."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not an indexed translation snapshot")
+        self.count, self.index_offset = INDEX_HEADER.unpack_from(self._mm, len(INDEX_MAGIC))
+        self.hits = 0
+        self.misses = 0
+
+    def _find(self, key: bytes):
+        mm = self._mm
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            position = self.index_offset + middle * INDEX_ENTRY.size
+            entry_hash = mm[position:position + 8]
+            if entry_hash < key:
+                low = middle + 1
+            elif entry_hash > key:
+                high = middle
+            else:
+                return INDEX_ENTRY.unpack_from(mm, position)[1]
+        return None
+
+    def get(self, key: bytes):
+        offset = self._find(bytes(key))
+        if offset is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        row, _ = decode_record(self._mm, offset)
+        return {'text': decompress_text(row[3]), 'tokens': row[4], 'characters': row[5]}
+
+    def get_many(self, keys) -> dict:
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def close(self):
+        self._mm.close()
+
+    def stats(self) -> dict:
+        return {'path': self.path, 'entries': self.count, 'hits': self.hits, 'misses': self.misses}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store():
+    """The read-only store of TEXT_TRANSLATOR_SNAPSHOT_PATH (an indexed snapshot), or None when unset."""
+    global _store
+    if _store is None:
+        path = getattr(settings, "TEXT_TRANSLATOR_SNAPSHOT_PATH", None)
+        if not path:
+            return None
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = SnapshotStore(path)
+                except (OSError, ValueError) as e:
+                    logging.error("SnapshotStore %s ->%s", path, e)
+                    return None
+    return _store
+
+
+@receiver(setting_changed)
+def _reset_store(setting, **kwargs):
+    global _store
+    if setting == "TEXT_TRANSLATOR_SNAPSHOT_PATH":
+        _store = None
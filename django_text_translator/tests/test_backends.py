@@ -0,0 +1,74 @@
+import os
+import tempfile
+from django.test import TestCase, override_settings
+from .. import backends, cache
+from ..backends import ORMBackend, SQLiteBackend
+from ..models import Translated_Content
+
+HELLO = Translated_Content.make_hash("Hello", "fr")
+WORLD = Translated_Content.make_hash("World", "fr")
+
+
+def entry(text: str, translated: str) -> dict:
+    return {'original': text, 'language': "fr", 'text': translated, 'tokens': 2, 'characters': len(text),
+            'namespace': ""}
+
+
+class BackendContract:
+    """Behavior every TranslationBackend must have; `self.backend` is set by the subclass."""
+
+    def test_set_and_get(self):
+        self.backend.set_many({HELLO: entry("Hello", "Bonjour"), WORLD: entry("World", "Monde")})
+        self.assertEqual(self.backend.get_many([HELLO, WORLD, b"\x00" * 8]), {
+            HELLO: {'text': "Bonjour", 'tokens': 2, 'characters': 5},
+            WORLD: {'text': "Monde", 'tokens': 2, 'characters': 5},
+        })
+        self.assertIsNone(self.backend.get(b"\x00" * 8))
+
+    def test_existing_entries_are_kept_unless_overwritten(self):
+        self.backend.set_many({HELLO: entry("Hello", "Bonjour")})
+        self.backend.set_many({HELLO: entry("Hello", "Salut")})
+        self.assertEqual(self.backend.get(HELLO)['text'], "Bonjour")
+        self.backend.set_many({HELLO: entry("Hello", "Salut")}, overwrite=True)
+        self.assertEqual(self.backend.get(HELLO)['text'], "Salut")
+
+    def test_delete_and_iterate(self):
+        self.backend.set_many({HELLO: entry("Hello", "Bonjour"), WORLD: entry("World", "Monde")})
+        self.backend.delete(HELLO)
+        self.assertEqual(list(self.backend.iter_keys()), [WORLD])
+
+
+class ORMBackendTests(BackendContract, TestCase):
+    def setUp(self):
+        self.backend = ORMBackend()
+
+
+class SQLiteBackendTests(BackendContract, TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.backend = SQLiteBackend(os.path.join(directory.name, "cache.sqlite3"))
+
+
+class GetBackendTests(TestCase):
+    def test_defaults_to_the_orm(self):
+        self.assertIsInstance(backends.get_backend(), ORMBackend)
+
+    def test_dotted_paths_are_imported(self):
+        with override_settings(TEXT_TRANSLATOR_BACKEND="django_text_translator.backends.ORMBackend"):
+            self.assertIsInstance(backends.get_backend(), ORMBackend)
+
+    @override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+    def test_translations_are_stored_in_the_configured_backend(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(TEXT_TRANSLATOR_BACKEND="sqlite",
+                                   TEXT_TRANSLATOR_BACKEND_OPTIONS={"path": os.path.join(directory, "cache.sqlite3")}):
+                self.assertIsInstance(backends.get_backend(), SQLiteBackend)
+                Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+                lru = cache.get_lru()
+                if lru is not None:
+                    lru.clear()
+                with self.assertNumQueries(0):
+                    hits, misses = Translated_Content.lookup_many(["Hello", "World"], "fr")
+        self.assertEqual((hits["Hello"]['text'], misses), ("Bonjour", ["World"]))
+        self.assertFalse(Translated_Content.objects.exists())
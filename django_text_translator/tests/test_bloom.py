@@ -0,0 +1,105 @@
+import os
+import tempfile
+import time
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from .. import bloom
+from ..bloom import BloomFilter, BloomTier
+from ..models import Translated_Content
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "translations": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "translations"},
+}
+
+
+def keys(count: int, prefix: str = "text") -> list:
+    return [Translated_Content.make_hash(f"{prefix} {i}", "fr") for i in range(count)]
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_has_no_false_negatives(self):
+        added = keys(1000)
+        bloom_filter = BloomFilter(1000)
+        bloom_filter.add_many(added)
+        self.assertTrue(all(key in bloom_filter for key in added))
+        self.assertEqual(bloom_filter.count, 1000)
+
+    def test_false_positive_rate_is_near_the_target(self):
+        bloom_filter = BloomFilter(1000, error_rate=0.01)
+        bloom_filter.add_many(keys(1000))
+        false_positives = sum(key in bloom_filter for key in keys(10000, "other"))
+        self.assertLess(false_positives, 300)
+
+    def test_save_and_load(self):
+        added = keys(100)
+        bloom_filter = BloomFilter(100)
+        bloom_filter.add_many(added)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bloom.bin")
+            bloom_filter.save(path)
+            loaded = BloomFilter.load(path)
+        self.assertEqual((loaded.bits, loaded.hashes, loaded.count), (bloom_filter.bits, bloom_filter.hashes, 100))
+        self.assertTrue(all(key in loaded for key in added))
+
+    def test_load_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bloom.bin")
+            with open(path, "wb") as f:
+                f.write(b"not a filter")
+            with self.assertRaises(ValueError):
+                BloomFilter.load(path)
+
+
+class BloomTierTests(SimpleTestCase):
+    def test_every_key_might_exist_until_the_file_is_loaded(self):
+        added, missing = keys(10), Translated_Content.make_hash("missing", "fr")
+        bloom_filter = BloomFilter(100)
+        bloom_filter.add_many(added)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bloom.bin")
+            bloom_filter.save(path)
+            tier = BloomTier(100, 0.01, path)
+            self.assertTrue(tier.might_contain(missing))
+            deadline = time.monotonic() + 5
+            while tier.filter is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertFalse(tier.might_contain(missing))
+        self.assertTrue(tier.might_contain(added[0]))
+        self.assertEqual(tier.stats()['skipped_queries'], 1)
+
+    def test_keys_added_while_loading_are_kept(self):
+        tier = BloomTier(100, 0.01, "unused")
+        tier._building = True
+        added = Translated_Content.make_hash("added", "fr")
+        tier.add(added)
+        tier._swap(BloomFilter(100), time.time())
+        self.assertIn(added, tier.filter)
+
+    @override_settings(TEXT_TRANSLATOR_BLOOM_CAPACITY=100)
+    def test_needs_the_shared_cache_tier(self):
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(bloom.get_bloom())
+
+
+@override_settings(CACHES=CACHES, TEXT_TRANSLATOR_CACHE_ALIAS="translations", TEXT_TRANSLATOR_BLOOM_CAPACITY=100,
+                   TEXT_TRANSLATOR_TRACK_HITS=False)
+class BloomLookupTests(TestCase):
+    def setUp(self):
+        caches["translations"].clear()
+        # A ready, empty filter, so that the tier doesn't scan the table in the background.
+        self.tier = bloom.get_bloom()
+        self.tier._swap(BloomFilter(100), time.time())
+        self.tier.skipped = 0
+
+    def test_guaranteed_misses_skip_the_database(self):
+        with self.assertNumQueries(0):
+            hits, misses = Translated_Content.lookup_many(["Hello", "World"], "fr")
+        self.assertEqual((hits, misses), ({}, ["Hello", "World"]))
+        self.assertEqual(self.tier.skipped, 2)
+
+    def test_stored_translations_are_added(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 0, 5)])
+        self.assertIn(Translated_Content.make_hash("Hello", "fr"), self.tier.filter)
+        hits, misses = Translated_Content.lookup_many(["Hello"], "fr")
+        self.assertEqual(hits["Hello"]['text'], "Bonjour")
@@ -0,0 +1,180 @@
+from unittest import mock
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from .. import cache, normalizers
+from ..cache import ENTRY_OVERHEAD, LRUCache, SharedCache
+from ..models import OpenAITranslator, Translated_Content
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class LookupManyTests(TestCase):
+    def setUp(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5), ("Bye", "fr", "Au revoir", 1, 3)])
+
+    def test_splits_hits_and_misses_in_one_query(self):
+        with self.assertNumQueries(1):
+            hits, misses = Translated_Content.lookup_many(["Hello", "Unknown", "Bye", "Hello"], "fr")
+        self.assertEqual(hits["Hello"], {'text': "Bonjour", 'tokens': 2, 'characters': 5})
+        self.assertEqual(hits["Bye"]['text'], "Au revoir")
+        self.assertEqual(misses, ["Unknown"])
+
+    def test_keys_are_per_language(self):
+        hits, misses = Translated_Content.lookup_many(["Hello"], "de")
+        self.assertEqual((hits, misses), ({}, ["Hello"]))
+
+    async def test_async_lookup(self):
+        hits, misses = await Translated_Content.alookup_many(["Hello", "Unknown"], "fr")
+        self.assertEqual(hits["Hello"]['text'], "Bonjour")
+        self.assertEqual(misses, ["Unknown"])
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class BulkStoreTests(TestCase):
+    def test_stores_every_entry(self):
+        stored = Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5), ("Hello", "de", "Hallo", 2, 5)])
+        self.assertEqual(stored, 2)
+        self.assertEqual(Translated_Content.is_translated("Hello", "de")['text'], "Hallo")
+
+    def test_keeps_existing_rows(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+        Translated_Content.bulk_store([("Hello", "fr", "Salut", 1, 5), ("Bye", "fr", "Au revoir", 1, 3)])
+        self.assertEqual(Translated_Content.objects.count(), 2)
+        row = Translated_Content.objects.get(hash=Translated_Content.make_hash("Hello", "fr"))
+        self.assertEqual(row.translated_content, "Bonjour")
+
+    def test_inserts_in_batches(self):
+        entries = [(f"Text {number}", "fr", f"Texte {number}", 1, 6) for number in range(10)]
+        with self.assertNumQueries(3):
+            Translated_Content.bulk_store(entries, batch_size=4)
+        self.assertEqual(Translated_Content.objects.count(), 10)
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_evicts_the_least_recently_used_entry(self):
+        lru = LRUCache(max_entries=2)
+        lru.set_many({b"a": {'text': "A"}, b"b": {'text': "B"}})
+        lru.get(b"a")
+        lru.set(b"c", {'text': "C"})
+        self.assertEqual(set(lru.get_many([b"a", b"b", b"c"])), {b"a", b"c"})
+        self.assertEqual(lru.stats()['evictions'], 1)
+
+    def test_bounds_the_cached_bytes(self):
+        lru = LRUCache(max_entries=100, max_bytes=2 * (ENTRY_OVERHEAD + 10))
+        for key in (b"a", b"b", b"c"):
+            lru.set(key, {'text': "x" * 10})
+        self.assertEqual(lru.stats()['entries'], 2)
+        lru.set(b"big", {'text': "x" * 1000})
+        self.assertIsNone(lru.get(b"big"))
+
+    def test_returns_copies(self):
+        lru = LRUCache(max_entries=2)
+        lru.set(b"a", {'text': "A"})
+        lru.get(b"a")['text'] = "changed"
+        self.assertEqual(lru.get(b"a")['text'], "A")
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False, TEXT_TRANSLATOR_LRU_MAX_ENTRIES=100)
+class LRUTierTests(TestCase):
+    def setUp(self):
+        cache.get_lru().clear()
+
+    def test_repeated_lookups_skip_the_database(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+        with self.assertNumQueries(0):
+            self.assertEqual(Translated_Content.is_translated("Hello", "fr")['text'], "Bonjour")
+
+    def test_deleted_rows_leave_the_tier(self):
+        Translated_Content(original_content="Hello", translated_language="fr", translated_content="Bonjour").save()
+        Translated_Content.objects.get().delete()
+        self.assertIsNone(Translated_Content.is_translated("Hello", "fr"))
+
+
+SHARED_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "translations": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "translations"},
+}
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False, CACHES=SHARED_CACHES, TEXT_TRANSLATOR_CACHE_ALIAS="translations")
+class SharedTierTests(TestCase):
+    def setUp(self):
+        caches["translations"].clear()
+
+    def test_stored_rows_are_served_from_the_shared_cache(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+        # As seen by another process: the row is only in the shared cache.
+        Translated_Content.objects.all().delete()
+        with self.assertNumQueries(0):
+            self.assertEqual(Translated_Content.is_translated("Hello", "fr")['text'], "Bonjour")
+
+    def test_database_hits_are_written_back(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+        caches["translations"].clear()
+        Translated_Content.lookup_many(["Hello"], "fr")
+        key = Translated_Content.make_hash("Hello", "fr")
+        self.assertEqual(cache.get_shared_cache().get_many([key])[key]['text'], "Bonjour")
+
+    def test_a_failing_cache_falls_back_to_the_database(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+        broken = mock.Mock(**{"get_many.side_effect": ConnectionError, "set_many.side_effect": ConnectionError})
+        with mock.patch.object(SharedCache, "backend", new_callable=mock.PropertyMock, return_value=broken):
+            self.assertEqual(Translated_Content.is_translated("Hello", "fr")['text'], "Bonjour")
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class NamespaceTests(TestCase):
+    def setUp(self):
+        cache.namespace_stats.clear()
+
+    def test_namespaces_keep_results_apart(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)], namespace="OpenAITranslator:gpt-4")
+        self.assertIsNone(Translated_Content.is_translated("Hello", "fr"))
+        self.assertIsNone(Translated_Content.is_translated("Hello", "fr", namespace="OpenAITranslator:gpt-3.5"))
+        hits, _ = Translated_Content.lookup_many(["Hello"], "fr", namespace="OpenAITranslator:gpt-4")
+        self.assertEqual(hits["Hello"]['text'], "Bonjour")
+
+    def test_engine_namespace_follows_model_and_prompt(self):
+        engine = OpenAITranslator(name="openai", model="gpt-4")
+        namespace = engine.cache_namespace()
+        self.assertTrue(namespace.startswith("OpenAITranslator:gpt-4:"))
+        self.assertNotEqual(engine.cache_namespace("summary"), namespace)
+        engine.translate_prompt = "Translate into {target_language}, keep the markup."
+        self.assertNotEqual(engine.cache_namespace(), namespace)
+
+    def test_hit_rate_per_namespace(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)], namespace="a")
+        Translated_Content.lookup_many(["Hello", "Bye"], "fr", namespace="a")
+        Translated_Content.is_translated("Hello", "fr")
+        stats = cache.namespace_stats.snapshot()
+        self.assertEqual(stats["a"], {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+        self.assertEqual(stats[""]['misses'], 1)
+
+
+class NormalizerTests(SimpleTestCase):
+    def test_builtin_normalizers(self):
+        text = "  Café&amp; bar \r\n\r\n next  "
+        self.assertEqual(normalizers.collapse_whitespace(text), "Café&amp; bar\n\n next")
+        self.assertEqual(normalizers.default(text), "Café&amp; bar\n\n next")
+        self.assertEqual(normalizers.full(text), "Café& bar\n\n next")
+
+    @override_settings(TEXT_TRANSLATOR_NORMALIZER="none")
+    def test_none_keeps_keys_exact(self):
+        self.assertNotEqual(Translated_Content.make_hash("Hello ", "fr"), Translated_Content.make_hash("Hello", "fr"))
+
+    @override_settings(TEXT_TRANSLATOR_NORMALIZER="default")
+    def test_equivalent_texts_share_a_key(self):
+        self.assertEqual(Translated_Content.make_hash("Café  au lait\r\n", "fr"),
+                         Translated_Content.make_hash("Café au lait", "fr"))
+
+    @override_settings(TEXT_TRANSLATOR_NORMALIZER="django_text_translator.normalizers.full")
+    def test_dotted_path(self):
+        self.assertIs(normalizers.get_normalizer(), normalizers.full)
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False, TEXT_TRANSLATOR_NORMALIZER="whitespace")
+class NormalizedLookupTests(TestCase):
+    def test_whitespace_variants_hit_the_cache(self):
+        Translated_Content.bulk_store([("Hello  world", "fr", "Bonjour le monde", 3, 11)])
+        hits, misses = Translated_Content.lookup_many(["Hello world", " Hello\tworld\n"], "fr")
+        self.assertEqual(len(hits), 2)
+        self.assertEqual(misses, [])
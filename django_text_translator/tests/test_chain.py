@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+from .. import errors
+from ..breaker import breakers
+from ..models import TestTranslator, TranslatorChain, TranslatorChainStep
+from ..models.base import guarded
+from .utils import EngineTestCase, failed, ok
+
+
+@guarded
+def translate(self, text, target_language):
+    if self.name == "broken":
+        raise RuntimeError("count_tokens is not available")
+    return ok(f"{self.name}: {text}")
+
+
+@guarded
+async def atranslate(self, text, target_language):
+    return translate.__wrapped__(self, text, target_language)
+
+
+class TranslatorChainTests(EngineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.chain = TranslatorChain.objects.create(name="chain")
+        for order, name in enumerate(["broken", "backup"]):
+            TranslatorChainStep.objects.create(chain=self.chain, order=order, engine=self.engine(name=name))
+
+    @mock.patch.object(TestTranslator, "translate", translate)
+    def test_fails_over_when_an_engine_raises(self):
+        result = self.chain.translate("hello", "fr")
+        self.assertEqual(result['text'], "backup: hello")
+        self.assertEqual(result['engine'], "backup")
+
+    @mock.patch.object(TestTranslator, "atranslate", atranslate)
+    async def test_async_fails_over_when_an_engine_raises(self):
+        result = await self.chain.atranslate("hello", "fr")
+        self.assertEqual(result['text'], "backup: hello")
+
+    def test_returns_the_last_failure_when_every_engine_fails(self):
+        with mock.patch.object(TestTranslator, "translate", guarded(lambda self, text, language: 1 / 0)):
+            result = self.chain.translate("hello", "fr")
+        self.assertEqual(result['text'], "")
+        self.assertEqual(result['engine'], "backup")
+        self.assertIsNotNone(result['error'])
+
+    def test_does_not_modify_the_engine_result(self):
+        shared = ok("shared")
+        with mock.patch.object(TestTranslator, "translate", guarded(lambda self, text, language: shared)):
+            result = self.chain.translate("hello", "fr")
+        self.assertEqual(result['engine'], "broken")
+        self.assertNotIn('engine', shared)
+
+
+def by_engine(**answers):
+    """A guarded translate() answering with answers[engine name], a result dict or a function of the text."""
+    @guarded
+    def translate(self, text, target_language):
+        answer = answers.get(self.name, ok(f"{self.name}: {text}"))
+        return answer(text) if callable(answer) else dict(answer)
+
+    return translate
+
+
+class TranslatorChainFailoverTests(EngineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.chain = TranslatorChain.objects.create(name="chain")
+        self.primary = self.engine(name="primary", max_retries=0)
+        self.primary_step = TranslatorChainStep.objects.create(chain=self.chain, order=0, engine=self.primary)
+        TranslatorChainStep.objects.create(chain=self.chain, order=1, engine=self.engine(name="backup"))
+
+    def assertAnsweredBy(self, engine_name, answers):
+        with mock.patch.object(TestTranslator, "translate", by_engine(**answers)):
+            result = TranslatorChain.objects.get(pk=self.chain.pk).translate("hello", "fr")
+        self.assertEqual((result['text'], result['engine']), (f"{engine_name}: hello", engine_name))
+
+    def test_the_first_engine_answers_when_it_can(self):
+        self.assertAnsweredBy("primary", {})
+
+    def test_fails_over_on_an_error(self):
+        self.assertAnsweredBy("backup", {"primary": failed(errors.SERVER_ERROR, 500)})
+
+    def test_fails_over_on_an_empty_translation(self):
+        self.assertAnsweredBy("backup", {"primary": ok("")})
+
+    def test_fails_over_while_the_breaker_is_open(self):
+        self.primary.breaker_threshold = 1
+        self.primary.save()
+        breakers.get(self.primary).record(failed(errors.SERVER_ERROR, 500)['error'])
+        self.assertAnsweredBy("backup", {})
+
+    def test_fails_over_when_the_latency_budget_is_exceeded(self):
+        self.primary_step.timeout = 0.05
+        self.primary_step.save()
+        release, done = threading.Event(), threading.Event()
+
+        def slow(text):
+            release.wait(5)
+            done.set()
+            return ok("late")
+
+        # The abandoned call keeps running; let it end before the next test makes the same call.
+        self.addCleanup(done.wait, 5)
+        self.addCleanup(release.set)
+        started = time.monotonic()
+        self.assertAnsweredBy("backup", {"primary": slow})
+        self.assertLess(time.monotonic() - started, 1)
+
+    async def test_async_fails_over_when_the_latency_budget_is_exceeded(self):
+        self.primary_step.timeout = 0.05
+        await self.primary_step.asave()
+
+        @guarded
+        async def atranslate(engine, text, target_language):
+            if engine.name == "primary":
+                await asyncio.sleep(0.5)
+            return ok(f"{engine.name}: {text}")
+
+        with mock.patch.object(TestTranslator, "atranslate", atranslate):
+            result = await self.chain.atranslate("hello", "fr")
+        self.assertEqual(result['engine'], "backup")
+
+    def test_a_chain_without_engines_says_so(self):
+        result = TranslatorChain.objects.create(name="empty").translate("hello", "fr")
+        self.assertEqual((result['text'], result['engine'], result['error']['type']), ("", None, errors.UNKNOWN))
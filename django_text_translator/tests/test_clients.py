@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+import httpx
+from django.test import SimpleTestCase, override_settings
+from ..clients import SharedHTTP, registry
+from ..models import DeepLXTranslator, TestTranslator
+from .utils import EngineTestCase
+
+
+class ClientRegistryTests(EngineTestCase):
+    def test_reuses_the_client_of_an_unchanged_engine(self):
+        engine = self.engine()
+        first = registry.get(engine, mock.Mock)
+        self.assertIs(registry.get(engine, mock.Mock), first)
+
+    def test_replaces_and_closes_the_client_of_an_engine_edited_elsewhere(self):
+        engine = self.engine()
+        old = registry.get(engine, mock.Mock)
+        # Another process edits the row: this one only sees the new settings on its next load.
+        type(engine).objects.filter(pk=engine.pk).update(translated_text="edited")
+        engine.refresh_from_db()
+
+        new = registry.get(engine, mock.Mock)
+        self.assertIsNot(new, old)
+        old.close.assert_called_once_with()
+        new.close.assert_not_called()
+
+    def test_closes_the_clients_of_a_deleted_engine(self):
+        engine = self.engine()
+        client = registry.get(engine, mock.Mock)
+        engine.delete()
+        client.close.assert_called_once_with()
+
+    async def test_closes_replaced_async_clients_in_their_loop(self):
+        engine = TestTranslator(pk=1, name="test")
+        old = registry.aget(engine, mock.AsyncMock)
+        engine.translated_text = "edited"
+        self.assertIsNot(registry.aget(engine, mock.AsyncMock), old)
+        await asyncio.sleep(0)
+        old.aclose.assert_awaited_once_with()
+
+
+class SharedHTTPTests(SimpleTestCase):
+    def setUp(self):
+        self.requests = []
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+        self.http = SharedHTTP()
+        build = mock.patch.object(SharedHTTP, "_build", staticmethod(self.build))
+        build.start()
+        self.addCleanup(build.stop)
+
+    def build(self, client_class, proxy):
+        return client_class(transport=httpx.MockTransport(self.handler))
+
+    def handler(self, request):
+        with self.lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return httpx.Response(200, json={"data": "Bonjour"})
+
+    def test_one_client_per_proxy(self):
+        client = self.http.client()
+        self.assertIs(self.http.client(), client)
+        self.assertIsNot(self.http.client("http://proxy:8080"), client)
+
+    def test_reset_drops_the_clients(self):
+        client = self.http.client()
+        self.http.reset()
+        self.assertIsNot(self.http.client(), client)
+
+    def test_async_clients_are_kept_per_event_loop(self):
+        async def client():
+            return self.http.aclient()
+
+        first = asyncio.run(client())
+        self.assertIsNot(asyncio.run(client()), first)
+
+    @override_settings(TEXT_TRANSLATOR_HTTP_MAX_CONNECTIONS_PER_HOST=1)
+    def test_caps_concurrent_requests_per_host(self):
+        threads = [threading.Thread(target=self.http.request, args=("GET", "http://deeplx.test/translate"))
+                   for _ in range(3)]
+        threads.append(threading.Thread(target=self.http.request, args=("GET", "http://other.test/")))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual(self.peak, 2)
+
+    def test_engines_send_their_requests_through_the_shared_client(self):
+        engine = DeepLXTranslator(pk=1, name="deeplx", requests_per_minute=None)
+        with mock.patch("django_text_translator.clients.shared_http", self.http):
+            result = engine.translate("Hello", "French")
+            aresult = asyncio.run(engine.atranslate("World", "French"))
+        self.assertEqual((result['text'], aresult['text']), ("Bonjour", "Bonjour"))
+        self.assertEqual([request.url.host for request in self.requests], ["127.0.0.1"] * 2)
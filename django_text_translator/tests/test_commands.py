@@ -0,0 +1,107 @@
+import io
+import os
+import tempfile
+from datetime import timedelta
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from .. import cache
+from ..bloom import BloomFilter
+from ..cache import HitTracker
+from ..models import Translated_Content
+
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "translations": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "translations"},
+}
+
+
+class BloomPublishingTests(TestCase):
+    """Rows written by management commands reach the shared cache and the Bloom file the workers reload."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "bloom.bin")
+        settings = override_settings(CACHES=CACHES, TEXT_TRANSLATOR_CACHE_ALIAS="translations",
+                                     TEXT_TRANSLATOR_BLOOM_CAPACITY=1000, TEXT_TRANSLATOR_BLOOM_PATH=self.path)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def call(self, *args, **options):
+        call_command(*args, stdout=io.StringIO(), **options)
+
+    def assertPublished(self, key, text):
+        self.assertIn(key, BloomFilter.load(self.path))
+        self.assertEqual(cache.get_shared_cache().get_many([key])[key]['text'], text)
+
+    def test_rekey_publishes_the_new_keys(self):
+        Translated_Content(original_content="Hello  world", translated_language="fr",
+                           translated_content="Bonjour le monde").save()
+        self.call("build_translation_bloom")
+        with override_settings(TEXT_TRANSLATOR_NORMALIZER="whitespace"):
+            self.call("rekey_translations")
+            key = Translated_Content.make_hash("Hello world", "fr")
+        self.assertTrue(Translated_Content.objects.filter(hash=key).exists())
+        self.assertPublished(key, "Bonjour le monde")
+
+    def test_load_publishes_the_loaded_keys(self):
+        Translated_Content(original_content="Hello", translated_language="fr", translated_content="Bonjour",
+                           tokens=3, characters=5).save()
+        dump = os.path.join(os.path.dirname(self.path), "translations.snap")
+        self.call("dump_translations", dump)
+        Translated_Content.objects.all().delete()
+        cache.get_shared_cache().backend.clear()
+        self.call("build_translation_bloom")
+
+        self.call("load_translations", dump)
+        key = Translated_Content.make_hash("Hello", "fr")
+        row = Translated_Content.objects.get(hash=key)
+        self.assertEqual((row.translated_content, row.tokens, row.characters), ("Bonjour", 3, 5))
+        self.assertPublished(key, "Bonjour")
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class EvictTranslationsTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        for number, (language, age) in enumerate([("fr", 1), ("fr", 10), ("fr", 40), ("de", 40)]):
+            Translated_Content.bulk_store([(f"Text {number}", language, f"Translated {number}", 1, 6)])
+            Translated_Content.objects.filter(hash=Translated_Content.make_hash(f"Text {number}", language)).update(
+                created=now - timedelta(days=age), last_hit=now - timedelta(days=age))
+
+    def evict(self, *args):
+        call_command("evict_translations", *args, "--pause", "0", "--batch-size", "1", stdout=io.StringIO())
+        return sorted(Translated_Content.objects.values_list("original_content", flat=True))
+
+    def test_older_than(self):
+        self.assertEqual(self.evict("--older-than", "30"), ["Text 0", "Text 1"])
+
+    def test_unused_for_counts_recent_hits(self):
+        Translated_Content.objects.filter(original_content="Text 2").update(last_hit=timezone.now())
+        self.assertEqual(self.evict("--unused-for", "5"), ["Text 0", "Text 2"])
+
+    def test_max_per_language_keeps_the_most_recently_used(self):
+        self.assertEqual(self.evict("--max-per-language", "2"), ["Text 0", "Text 1", "Text 3"])
+
+    def test_dry_run_deletes_nothing(self):
+        self.assertEqual(len(self.evict("--older-than", "0", "--dry-run")), 4)
+
+    def test_evicted_rows_leave_the_cache_tiers(self):
+        with override_settings(TEXT_TRANSLATOR_LRU_MAX_ENTRIES=100):
+            self.assertIsNotNone(Translated_Content.is_translated("Text 2", "fr"))
+            self.evict("--older-than", "30")
+            self.assertIsNone(Translated_Content.is_translated("Text 2", "fr"))
+
+
+class HitTrackerTests(TestCase):
+    def test_flush_records_the_hits(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 2, 5)])
+        key = Translated_Content.make_hash("Hello", "fr")
+        Translated_Content.objects.filter(hash=key).update(last_hit=timezone.now() - timedelta(days=30))
+        tracker = HitTracker(flush_size=100, flush_interval=3600)
+        self.addCleanup(tracker.close)
+        tracker.record([key])
+        tracker.flush()
+        self.assertGreater(Translated_Content.objects.get(hash=key).last_hit, timezone.now() - timedelta(minutes=1))
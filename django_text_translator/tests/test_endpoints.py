@@ -0,0 +1,95 @@
+from unittest import mock
+from django.test import SimpleTestCase
+from .. import endpoints, errors
+from ..endpoints import EJECT_AFTER, EndpointPool, parse_credentials, pools
+from ..models import OpenAITranslator
+from ..models.base import guarded
+from .utils import EngineTestCase, FakeClock, failed, ok
+
+KEYS = [("sk-first", "https://a.example/v1"), ("sk-second", "https://b.example/v1"), ("sk-third", "https://c.example/v1")]
+
+
+class ParseCredentialsTests(SimpleTestCase):
+    def test_keys_with_optional_urls(self):
+        text = "sk-one\n\n# spare keys\nsk-two https://proxy.example/v1  # EU\n"
+        self.assertEqual(parse_credentials(text, "https://api.openai.com/v1"),
+                         [("sk-one", "https://api.openai.com/v1"), ("sk-two", "https://proxy.example/v1")])
+
+
+class EndpointPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(endpoints, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = EndpointPool(KEYS, eject_timeout=30, backoff=1, backoff_max=60)
+        self.first, self.second, self.third = self.pool.members
+
+    def call(self, member, result, seconds=0.1):
+        started = self.clock.now
+        self.clock.now += seconds
+        self.pool.release(member, result, started)
+
+    def test_spreads_concurrent_calls_over_the_members(self):
+        taken = {self.pool.acquire() for _ in range(3)}
+        self.assertEqual(taken, set(self.pool.members))
+
+    def test_prefers_the_fastest_member(self):
+        for member, seconds in ((self.first, 1.0), (self.second, 0.1), (self.third, 2.0)):
+            self.pool.acquire()
+            self.call(member, ok(), seconds)
+        self.assertIs(self.pool.acquire(), self.second)
+
+    def test_rests_a_rate_limited_member_for_its_retry_after(self):
+        for member in self.pool.members:
+            self.call(member, ok())
+        self.call(self.first, failed(errors.RATE_LIMITED, 429, retry_after=10))
+        self.assertNotIn(self.first, {self.pool.acquire() for _ in range(10)})
+        self.clock.now += 10
+        self.assertEqual(self.pool.stats()[0]['available_in'], 0)
+
+    def test_ejects_a_member_failing_repeatedly(self):
+        for _ in range(EJECT_AFTER - 1):
+            self.call(self.first, failed(errors.CLIENT_ERROR, 401))
+        self.assertEqual(self.pool.stats()[0]['available_in'], 0)
+        self.call(self.first, failed(errors.CLIENT_ERROR, 401))
+        self.assertAlmostEqual(self.pool.stats()[0]['available_in'], 30)
+
+    def test_uses_the_member_due_back_first_when_all_are_out(self):
+        for member, retry_after in zip(self.pool.members, (30, 10, 20)):
+            self.call(member, failed(errors.RATE_LIMITED, 429, retry_after=retry_after))
+        self.assertFalse(self.pool.available())
+        self.assertIs(self.pool.acquire(), self.second)
+
+
+@guarded
+def translate(self, text, target_language, system_prompt=None, user_prompt=None):
+    api_key = endpoints.current_member().api_key
+    translate.keys.append(api_key)
+    return failed(errors.CLIENT_ERROR, 401) if api_key == "sk-revoked" else ok(api_key)
+
+
+class EngineEndpointTests(EngineTestCase):
+    def setUp(self):
+        super().setUp()
+        translate.keys = []
+
+    def engine(self, **fields):
+        return OpenAITranslator.objects.create(name="openai", retry_backoff=0.01, **fields)
+
+    def test_engines_with_one_key_have_no_pool(self):
+        self.assertIsNone(pools.get(self.engine(api_key="sk-only")))
+
+    def test_calls_are_spread_over_the_keys(self):
+        engine = self.engine(api_key="sk-first", extra_credentials="sk-second\nsk-third")
+        with mock.patch.object(OpenAITranslator, "translate", translate):
+            for number in range(3):
+                engine.translate(f"Text {number}", "fr")
+        self.assertEqual(sorted(translate.keys), ["sk-first", "sk-second", "sk-third"])
+
+    def test_a_rejected_key_fails_over_to_another(self):
+        engine = self.engine(api_key="sk-revoked", extra_credentials="sk-valid")
+        with mock.patch.object(OpenAITranslator, "translate", translate):
+            results = [engine.translate(f"Text {number}", "fr") for number in range(3)]
+        self.assertEqual([result['text'] for result in results], ["sk-valid"] * 3)
+        self.assertLessEqual(translate.keys.count("sk-revoked"), EJECT_AFTER)
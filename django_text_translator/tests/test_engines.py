@@ -0,0 +1,187 @@
+import inspect
+import threading
+import time
+from unittest import mock
+from django.apps import apps
+from django.test import override_settings
+from .. import errors
+from ..models import TestTranslator, Translated_Content
+from ..models.base import TranslatorEngine
+from .utils import EngineTestCase, ascripted, echo, failed, ok, scripted
+
+DOCUMENT = "First paragraph.\n\nSecond paragraph.\n\n\nThird paragraph."
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class TranslateSegmentedTests(EngineTestCase):
+    def test_translates_each_paragraph_and_keeps_the_layout(self):
+        translate = scripted(echo)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            result = self.engine().translate_segmented(DOCUMENT, "fr")
+        self.assertEqual(result['text'], "<First paragraph.>\n\n<Second paragraph.>\n\n\n<Third paragraph.>")
+        self.assertEqual((result['segments'], result['translated_segments'], result['error']), (3, 3, None))
+
+    def test_only_changed_segments_are_translated_again(self):
+        engine = self.engine()
+        translate = scripted(echo)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate_segmented(DOCUMENT, "fr")
+            result = engine.translate_segmented(DOCUMENT.replace("Second", "Edited"), "fr")
+        self.assertEqual(translate.calls[3:], ["Edited paragraph."])
+        self.assertEqual(result['translated_segments'], 1)
+        self.assertEqual(result['characters'], len("<Edited paragraph.>"))
+        self.assertIn("<Edited paragraph.>", result['text'])
+
+    def test_failed_segments_are_reported(self):
+        translate = scripted(lambda text: failed(errors.CONTENT_POLICY, 400) if text.startswith("Second") else echo(text))
+        with mock.patch.object(TestTranslator, "translate", translate):
+            result = self.engine(max_retries=0).translate_segmented(DOCUMENT, "fr")
+        self.assertIn("\n\nSecond paragraph.\n\n", result['text'])
+        self.assertEqual(result['failed_segments'], 1)
+        self.assertEqual(result['error']['type'], errors.CONTENT_POLICY)
+
+    def test_nothing_translated_gives_no_text(self):
+        with mock.patch.object(TestTranslator, "translate", scripted(failed(errors.CONTENT_POLICY, 400))):
+            result = self.engine(max_retries=0).translate_segmented(DOCUMENT, "fr")
+        self.assertEqual(result['text'], "")
+        self.assertEqual(result['failed_segments'], 3)
+
+    async def test_async(self):
+        with mock.patch.object(TestTranslator, "atranslate", ascripted(echo)):
+            engine = await TestTranslator.objects.acreate(name="test")
+            result = await engine.atranslate_segmented("One.\n\nTwo.", "fr")
+        self.assertEqual(result['text'], "<One.>\n\n<Two.>")
+
+
+class NegativeCacheTests(EngineTestCase):
+    def test_deterministic_failures_are_not_sent_again(self):
+        translate = scripted(failed(errors.CONTENT_POLICY, 400), ok())
+        engine = self.engine()
+        with mock.patch.object(TestTranslator, "translate", translate):
+            first = engine.translate("Hello", "fr")
+            second = engine.translate("Hello", "fr")
+            other = engine.translate("World", "fr")
+        self.assertEqual(translate.calls, ["Hello", "World"])
+        self.assertEqual(first['error']['type'], errors.CONTENT_POLICY)
+        self.assertEqual((second['text'], second['error']['type']), ('', errors.CONTENT_POLICY))
+        self.assertEqual(other['text'], "translated")
+
+    def test_unsupported_languages_are_remembered_for_the_engine(self):
+        translate = scripted(lambda text: failed(errors.UNSUPPORTED_LANGUAGE) if text == "Hello" else ok())
+        engine = self.engine()
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("Hello", "xx")
+            skipped = engine.translate("World", "xx")
+            engine.translate("World", "fr")
+        self.assertEqual(translate.calls, ["Hello", "World"])
+        self.assertEqual(skipped['error']['type'], errors.UNSUPPORTED_LANGUAGE)
+
+    def test_transient_failures_are_not_remembered(self):
+        translate = scripted(failed(errors.SERVER_ERROR, 500), ok())
+        engine = self.engine(max_retries=0, breaker_threshold=0)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("Hello", "fr")
+            result = engine.translate("Hello", "fr")
+        self.assertEqual(translate.calls, ["Hello", "Hello"])
+        self.assertEqual(result['text'], "translated")
+
+    def test_changed_settings_are_not_answered_from_the_cache(self):
+        translate = scripted(failed(errors.CLIENT_ERROR, 401), ok())
+        engine = self.engine()
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("Hello", "fr")
+            engine.max_characters = 1000
+            result = engine.translate("Hello", "fr")
+        self.assertEqual(result['text'], "translated")
+
+    @override_settings(TEXT_TRANSLATOR_NEGATIVE_CACHE_TTL=0)
+    def test_can_be_turned_off(self):
+        translate = scripted(failed(errors.CONTENT_POLICY, 400))
+        engine = self.engine()
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("Hello", "fr")
+            engine.translate("Hello", "fr")
+        self.assertEqual(len(translate.calls), 2)
+
+    @override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+    def test_failed_translations_are_not_cached(self):
+        translate = scripted(lambda text: ok("") if text == "Empty" else failed(errors.CONTENT_POLICY, 400))
+        with mock.patch.object(TestTranslator, "translate", translate):
+            self.engine().translate_many(["Empty", "Blocked"], "fr")
+        self.assertFalse(Translated_Content.objects.exists())
+
+
+class AsyncTranslateTests(EngineTestCase):
+    def test_every_engine_has_an_async_translate(self):
+        for model in apps.get_app_config("translator").get_models():
+            if issubclass(model, TranslatorEngine):
+                with self.subTest(model=model.__name__):
+                    self.assertTrue(inspect.iscoroutinefunction(model.atranslate))
+
+    async def test_falls_back_to_translate_in_a_thread(self):
+        translate = scripted(echo)
+        engine = TestTranslator(pk=1, name="test")
+        with mock.patch.object(TestTranslator, "translate", translate):
+            result = await TranslatorEngine.atranslate(engine, "Hello", "fr")
+        self.assertEqual((result['text'], translate.calls), ("<Hello>", ["Hello"]))
+
+    async def test_transient_failures_are_retried(self):
+        atranslate = ascripted(failed(errors.SERVER_ERROR, 500), ok())
+        engine = TestTranslator(pk=1, name="test", retry_backoff=0.01)
+        with mock.patch.object(TestTranslator, "atranslate", atranslate):
+            result = await engine.atranslate("Hello", "fr")
+        self.assertEqual((result['text'], len(atranslate.calls)), ("translated", 2))
+
+    async def test_deterministic_failures_are_remembered(self):
+        atranslate = ascripted(failed(errors.CONTENT_POLICY, 400))
+        engine = TestTranslator(pk=1, name="test")
+        with mock.patch.object(TestTranslator, "atranslate", atranslate):
+            await engine.atranslate("Hello", "fr")
+            result = await engine.atranslate("Hello", "fr")
+        self.assertEqual((result['error']['type'], len(atranslate.calls)), (errors.CONTENT_POLICY, 1))
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class TranslateManyTests(EngineTestCase):
+    def test_keeps_the_input_order_and_uses_cached_translations(self):
+        Translated_Content.bulk_store([("Two", "fr", "Deux", 0, 3)])
+        translate = scripted(echo)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            results = self.engine().translate_many(["One", "Two", "Three", "One"], "fr")
+        self.assertEqual([result['text'] for result in results], ["<One>", "Deux", "<Three>", "<One>"])
+        self.assertEqual([result['cached'] for result in results], [False, True, False, False])
+        self.assertEqual(sorted(translate.calls), ["One", "Three"])
+
+    def test_stores_new_translations(self):
+        with mock.patch.object(TestTranslator, "translate", scripted(echo)):
+            self.engine().translate_many(["One", "Two"], "fr")
+        hits, misses = Translated_Content.lookup_many(["One", "Two"], "fr")
+        self.assertEqual((hits["Two"]['text'], misses), ("<Two>", []))
+
+    def test_sends_at_most_max_concurrency_requests_at_a_time(self):
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def slow(text):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            return echo(text)
+
+        translate = scripted(slow)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            self.engine(max_concurrency=2).translate_many([f"Text {i}" for i in range(6)], "fr", max_workers=6)
+        self.assertEqual(len(translate.calls), 6)
+        self.assertEqual(state['peak'], 2)
+
+    async def test_async(self):
+        await Translated_Content.abulk_store([("Two", "fr", "Deux", 0, 3)])
+        atranslate = ascripted(echo)
+        with mock.patch.object(TestTranslator, "atranslate", atranslate):
+            engine = await TestTranslator.objects.acreate(name="test")
+            results = await engine.atranslate_many(["One", "Two", "Three"], "fr")
+        self.assertEqual([result['text'] for result in results], ["<One>", "Deux", "<Three>"])
+        self.assertEqual(sorted(atranslate.calls), ["One", "Three"])
@@ -0,0 +1,35 @@
+from django.test import TestCase, override_settings
+from ..fields import decompress_text, is_compressed
+from ..models import Translated_Content
+
+LONG_TEXT = "The quick brown fox jumps over the lazy dog. " * 20
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False, TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH=100)
+class CompressedTextFieldTests(TestCase):
+    def raw(self, text, language="fr"):
+        return Translated_Content.objects.filter(hash=Translated_Content.make_hash(text, language)).values_list(
+            "original_content", "translated_content").get()
+
+    def test_long_values_are_stored_compressed(self):
+        Translated_Content(original_content=LONG_TEXT, translated_language="fr", translated_content=LONG_TEXT).save()
+        original, translated = self.raw(LONG_TEXT)
+        self.assertTrue(is_compressed(original) and is_compressed(translated))
+        self.assertLess(len(translated), len(LONG_TEXT))
+        self.assertEqual(decompress_text(translated), LONG_TEXT)
+
+    def test_reads_return_the_plain_text(self):
+        Translated_Content.bulk_store([(LONG_TEXT, "fr", LONG_TEXT, 10, len(LONG_TEXT))])
+        self.assertEqual(Translated_Content.objects.get().translated_content, LONG_TEXT)
+        hits, _ = Translated_Content.lookup_many([LONG_TEXT], "fr")
+        self.assertEqual(hits[LONG_TEXT]['text'], LONG_TEXT)
+
+    def test_short_values_stay_plain(self):
+        Translated_Content(original_content="Hello", translated_language="fr", translated_content="Bonjour").save()
+        self.assertEqual(self.raw("Hello"), ("Hello", "Bonjour"))
+
+    def test_plain_rows_are_still_read_when_compression_is_on(self):
+        with override_settings(TEXT_TRANSLATOR_COMPRESS_MIN_LENGTH=None):
+            Translated_Content.bulk_store([(LONG_TEXT, "fr", LONG_TEXT, 10, len(LONG_TEXT))])
+        self.assertFalse(is_compressed(self.raw(LONG_TEXT)[1]))
+        self.assertEqual(Translated_Content.is_translated(LONG_TEXT, "fr")['text'], LONG_TEXT)
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+from unittest import mock
+from django.test import SimpleTestCase
+from .. import hedging
+from ..hedging import MIN_SAMPLES, Hedger, hedgers
+from ..models import OpenAITranslator
+from ..models.base import guarded
+from .utils import EngineTestCase, ok
+
+
+def warmed_up(per_minute: int = 10) -> Hedger:
+    hedger = Hedger(percentile=90, per_minute=per_minute)
+    for _ in range(MIN_SAMPLES):
+        hedger.record(0.01)
+    return hedger
+
+
+class HedgerTests(SimpleTestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def attempt(self):
+        """The first call hangs until the test ends, the next ones answer at once."""
+        with self.lock:
+            self.calls += 1
+            number = self.calls
+        hedging.sending()
+        if number == 1:
+            self.release.wait(5)
+            return ok("primary")
+        return ok("duplicate")
+
+    def test_no_hedging_before_enough_latencies(self):
+        hedger = Hedger(percentile=90, per_minute=10)
+        for _ in range(MIN_SAMPLES - 1):
+            hedger.record(0.01)
+        self.assertIsNone(hedger.delay())
+        self.release.set()
+        self.assertEqual(hedger.run(self.attempt)['text'], "primary")
+        self.assertEqual(self.calls, 1)
+
+    def test_delay_is_the_percentile_of_recent_latencies(self):
+        hedger = Hedger(percentile=90, per_minute=10)
+        for number in range(1, 101):
+            hedger.record(number / 100)
+        self.assertAlmostEqual(hedger.delay(), 0.91)
+
+    def test_a_late_request_gets_a_duplicate_that_wins(self):
+        hedger = warmed_up()
+        result = hedger.run(self.attempt)
+        self.assertEqual(result['text'], "duplicate")
+        self.assertEqual(hedger.stats()['hedges'], 1)
+        self.assertEqual(hedger.stats()['wins'], 1)
+
+    def test_duplicates_are_capped_per_minute(self):
+        hedger = warmed_up(per_minute=1)
+        self.assertEqual(hedger.run(self.attempt)['text'], "duplicate")
+        self.calls = 0
+        threading.Timer(0.1, self.release.set).start()
+        self.assertEqual(hedger.run(self.attempt)['text'], "primary")
+        self.assertEqual((self.calls, hedger.hedges), (1, 1))
+
+    def test_async_loser_is_cancelled(self):
+        hedger = warmed_up()
+        cancelled = []
+
+        async def attempt():
+            hedging.sending()
+            if not cancelled:
+                cancelled.append(False)
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled[0] = True
+                    raise
+                return ok("primary")
+            return ok("duplicate")
+
+        async def run():
+            result = await hedger.arun(attempt)
+            await asyncio.sleep(0)
+            return result
+
+        self.assertEqual(asyncio.run(run())['text'], "duplicate")
+        self.assertEqual(cancelled, [True])
+
+
+class EngineHedgingTests(EngineTestCase):
+    def test_only_engines_with_a_percentile_hedge(self):
+        engine = OpenAITranslator.objects.create(name="openai", api_key="sk-test")
+        self.assertIsNone(hedgers.get(engine))
+        engine.hedge_percentile = 95
+        hedger = hedgers.get(engine)
+        self.assertEqual((hedger.percentile, hedger.budget.capacity), (95, engine.hedges_per_minute))
+        self.assertIs(hedgers.get(engine), hedger)
+
+    def test_slow_engine_calls_are_hedged(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        @guarded
+        def translate(engine, text, target_language, system_prompt=None, user_prompt=None):
+            calls.append(text)
+            if len(calls) == 1:
+                release.wait(5)
+                return ok("primary")
+            return ok("duplicate")
+
+        engine = OpenAITranslator.objects.create(name="openai", api_key="sk-test", hedge_percentile=90)
+        hedger = hedgers.get(engine)
+        for _ in range(MIN_SAMPLES):
+            hedger.record(0.01)
+        with mock.patch.object(OpenAITranslator, "translate", translate):
+            result = engine.translate("Hello", "fr")
+        self.assertEqual((result['text'], calls), ("duplicate", ["Hello", "Hello"]))
@@ -0,0 +1,183 @@
+from unittest import mock
+from django.core.cache import caches
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from .. import ratelimit
+from ..models import TestTranslator
+from ..ratelimit import CacheLimiter, EngineLimiter, TokenBucket, limiters
+from .utils import EngineTestCase, FakeClock, ok, scripted
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "rate": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "rate"},
+}
+
+
+class ClockTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        patcher = mock.patch.object(ratelimit, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TokenBucketTests(ClockTestMixin, SimpleTestCase):
+    def test_a_full_minute_is_available_at_once(self):
+        bucket = TokenBucket(60)
+        self.assertEqual([bucket.reserve() for _ in range(60)], [0.0] * 60)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+
+    def test_refills_at_the_rate(self):
+        bucket = TokenBucket(60)
+        bucket.reserve(60)
+        self.clock.now += 10
+        self.assertAlmostEqual(bucket.tokens(), 10)
+        self.clock.now += 120
+        self.assertAlmostEqual(bucket.tokens(), 60)
+
+    def test_take_does_not_go_into_debt(self):
+        bucket = TokenBucket(60)
+        self.assertTrue(bucket.take(60))
+        self.assertFalse(bucket.take())
+        self.assertEqual(bucket.tokens(), 0)
+
+    def test_debit_gives_back_at_most_the_capacity(self):
+        bucket = TokenBucket(60)
+        bucket.debit(90)
+        self.assertAlmostEqual(bucket.wait_time(), 30)
+        bucket.debit(-200)
+        self.assertEqual(bucket.tokens(), 60)
+
+
+class EngineLimiterTests(ClockTestMixin, SimpleTestCase):
+    def test_waits_for_the_request_budget(self):
+        limiter = EngineLimiter(requests_per_minute=2)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(len(self.clock.slept), 1)
+        self.assertAlmostEqual(self.clock.slept[0], 30)
+
+    def test_reserves_the_estimate_and_corrects_it_after_the_call(self):
+        limiter = EngineLimiter(units_per_minute=1000)
+        reserved = limiter.acquire(800)
+        self.assertEqual(reserved, 800)
+        self.assertAlmostEqual(limiter.units.tokens(), 200)
+        limiter.consume({'tokens': 300}, reserved)
+        self.assertAlmostEqual(limiter.units.tokens(), 700)
+        self.assertEqual(self.clock.slept, [])
+
+    def test_a_call_larger_than_the_budget_waits_for_a_full_bucket(self):
+        limiter = EngineLimiter(units_per_minute=1000)
+        limiter.acquire(100)
+        self.assertEqual(limiter.acquire(5000), 1000)
+        self.assertAlmostEqual(self.clock.slept[0], 6)
+
+
+class EngineRateLimitTests(ClockTestMixin, EngineTestCase):
+    def test_engine_calls_wait_for_the_engine_budget(self):
+        translate = scripted(ok())
+        engine = self.engine(requests_per_minute=2)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            for text in ("One", "Two", "Three"):
+                engine.translate(text, "fr")
+        self.assertEqual(len(translate.calls), 3)
+        self.assertEqual(len(self.clock.slept), 1)
+        self.assertAlmostEqual(self.clock.slept[0], 30)
+
+    def test_engines_without_limits_have_no_limiter(self):
+        self.assertIsNone(limiters.get(self.engine()))
+
+    def test_the_limiter_is_shared_until_the_limits_change(self):
+        engine = self.engine(requests_per_minute=2)
+        limiter = limiters.get(engine)
+        self.assertIs(limiters.get(engine), limiter)
+        engine.requests_per_minute = 10
+        self.assertIsNot(limiters.get(engine), limiter)
+
+
+class RateLimitMigrationTests(TransactionTestCase):
+    """0032 replaced the `interval` slept after every call by requests_per_minute."""
+
+    before = [("translator", "0031_engine_max_concurrency")]
+    after = [("translator", "0032_engine_rate_limits")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_intervals_become_requests_per_minute(self):
+        apps = self.migrate(self.before)
+        DeepLX = apps.get_model("translator", "DeepLXTranslator")
+        for name, interval in (("slow", 3), ("slower", 120), ("unlimited", 0)):
+            DeepLX.objects.create(name=name, interval=interval)
+
+        apps = self.migrate(self.after)
+        DeepLX = apps.get_model("translator", "DeepLXTranslator")
+        self.assertEqual(dict(DeepLX.objects.values_list("name", "requests_per_minute")),
+                         {"slow": 20, "slower": 1, "unlimited": None})
+
+    def test_reverses_to_intervals(self):
+        apps = self.migrate(self.after)
+        apps.get_model("translator", "DeepLXTranslator").objects.create(name="limited", requests_per_minute=12)
+
+        apps = self.migrate(self.before)
+        self.assertEqual(apps.get_model("translator", "DeepLXTranslator").objects.get(name="limited").interval, 5)
+
+
+@override_settings(CACHES=CACHES)
+class CacheLimiterTests(ClockTestMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["rate"].clear()
+
+    def test_processes_share_the_request_budget(self):
+        first, second = (CacheLimiter("rate", "engine", requests_per_minute=2) for _ in range(2))
+        first.acquire()
+        second.acquire()
+        self.assertEqual(self.clock.slept, [])
+        first.acquire()
+        self.assertTrue(self.clock.slept)
+
+    def test_reservations_are_counted_before_the_call(self):
+        first, second = (CacheLimiter("rate", "engine", units_per_minute=1000) for _ in range(2))
+        reservations = [limiter.acquire(300) for limiter in (first, second, first)]
+        self.assertEqual(self.clock.slept, [])
+        key = reservations[0][0]
+        self.assertEqual(caches["rate"].get(key), 900)
+        second.acquire(300)
+        self.assertTrue(self.clock.slept)
+
+    def test_the_reservation_is_corrected_after_the_call(self):
+        limiter = CacheLimiter("rate", "engine", units_per_minute=1000)
+        key, reserved = limiter.acquire(300)
+        limiter.consume({'characters': 120}, (key, reserved))
+        self.assertEqual(caches["rate"].get(key), 120)
+        reservation = limiter.acquire(300)
+        limiter.consume({'text': '', 'characters': 0}, reservation)
+        self.assertEqual(caches["rate"].get(key), 120)
+
+    def test_falls_back_to_local_buckets_when_the_cache_fails(self):
+        limiter = CacheLimiter("rate", "engine", units_per_minute=1000)
+        broken = mock.Mock(**{"add.side_effect": ConnectionError("down")})
+        with mock.patch.object(ratelimit, "caches", {"rate": broken}), self.assertLogs(level="ERROR"):
+            reservation = limiter.acquire(300)
+            limiter.consume({'characters': 100}, reservation)
+        self.assertEqual(reservation, (None, 300))
+        self.assertAlmostEqual(limiter.local.units.tokens(), 900)
+
+
+class CacheLimiterRegistryTests(EngineTestCase):
+    @override_settings(CACHES=CACHES, TEXT_TRANSLATOR_RATE_LIMIT_CACHE="rate")
+    def test_engines_share_their_limits_through_the_cache(self):
+        limiter = limiters.get(self.engine(requests_per_minute=2))
+        self.assertIsInstance(limiter, CacheLimiter)
+        self.assertEqual(limiter.alias, "rate")
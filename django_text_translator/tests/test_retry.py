@@ -0,0 +1,220 @@
+import time
+from unittest import mock
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from .. import breaker, errors, retry
+from ..breaker import CacheCircuitBreaker, CircuitBreaker, breakers
+from ..models import TestTranslator
+from ..retry import SPEED_UP, RetryPolicy, Throttle, throttles
+from .utils import EngineTestCase, FakeClock, ascripted, failed, ok, scripted
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "breakers": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "breakers"},
+}
+
+
+class CircuitBreakerTests(EngineTestCase):
+    def test_open_breaker_fails_fast_behind_a_long_throttle_gap(self):
+        engine = self.engine(max_retries=0, retry_backoff=4, breaker_threshold=1)
+        translate = scripted(failed(errors.RATE_LIMITED, 429))
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("rate limited", "fr")
+            throttle = throttles.get(engine)
+            for _ in range(3):
+                throttle.record(failed(errors.RATE_LIMITED, 429)['error'])
+            self.assertEqual(throttle.gap, 32)
+            breakers.get(engine).record(failed(errors.SERVER_ERROR, 500)['error'])
+
+            started = time.monotonic()
+            results = [engine.translate(f"open {number}", "fr") for number in range(3)]
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual([result['error']['type'] for result in results], [errors.CIRCUIT_OPEN] * 3)
+        self.assertEqual(translate.calls, ["rate limited"])
+
+
+def rate_limited(retry_after: float = None) -> dict:
+    return failed(errors.RATE_LIMITED, 429, retry_after)
+
+
+class RetryPolicyTests(SimpleTestCase):
+    def test_retries_transient_failures_up_to_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertIsNotNone(policy.retry_delay(1, rate_limited()['error']))
+        self.assertIsNone(policy.retry_delay(2, rate_limited()['error']))
+
+    def test_deterministic_failures_are_not_retried(self):
+        self.assertIsNone(RetryPolicy().retry_delay(0, failed(errors.CONTENT_POLICY, 400)['error']))
+
+    def test_backoff_grows_up_to_the_cap(self):
+        policy = RetryPolicy(max_retries=10, backoff=1, backoff_max=4)
+        error = failed(errors.SERVER_ERROR, 500)['error']
+        self.assertTrue(all(0 <= policy.retry_delay(1, error) <= 2 for _ in range(100)))
+        self.assertTrue(all(0 <= policy.retry_delay(5, error) <= 4 for _ in range(100)))
+
+    def test_waits_at_least_retry_after(self):
+        policy = RetryPolicy(backoff=0.01)
+        self.assertGreaterEqual(policy.retry_delay(0, rate_limited(5)['error']), 5)
+
+    def test_gives_up_when_retry_after_is_beyond_the_max_backoff(self):
+        self.assertIsNone(RetryPolicy(backoff_max=60).retry_delay(0, rate_limited(120)['error']))
+
+
+class ClockTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        patcher = mock.patch.object(retry, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class ThrottleTests(ClockTestMixin, SimpleTestCase):
+    def test_rate_limits_double_the_gap_and_successes_shrink_it(self):
+        throttle = Throttle(initial_gap=1, max_gap=4)
+        gaps = []
+        for _ in range(4):
+            throttle.record(rate_limited()['error'])
+            gaps.append(throttle.gap)
+        self.assertEqual(gaps, [1, 2, 4, 4])
+        throttle.record(None)
+        self.assertAlmostEqual(throttle.gap, 4 * SPEED_UP)
+        for _ in range(100):
+            throttle.record(None)
+        self.assertEqual(throttle.gap, 0)
+
+    def test_requests_are_spaced_by_the_gap(self):
+        throttle = Throttle(initial_gap=1)
+        throttle.record(rate_limited()['error'])
+        self.assertEqual([throttle.delay() for _ in range(3)], [0, 1, 2])
+
+    def test_retry_after_holds_every_request(self):
+        throttle = Throttle(initial_gap=1)
+        throttle.record(rate_limited(10)['error'])
+        self.assertAlmostEqual(throttle.delay(), 10)
+
+
+class RateLimitedEngineTests(ClockTestMixin, EngineTestCase):
+    def test_retries_after_the_retry_after_of_a_429(self):
+        translate = scripted(rate_limited(5), ok())
+        engine = self.engine(retry_backoff=0.01)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            result = engine.translate("Hello", "fr")
+        self.assertEqual((result['text'], len(translate.calls)), ("translated", 2))
+        self.assertGreaterEqual(self.clock.slept[0], 5)
+
+    def test_gives_up_after_max_retries(self):
+        translate = scripted(rate_limited())
+        engine = self.engine(max_retries=2, retry_backoff=0.01, breaker_threshold=0)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            result = engine.translate("Hello", "fr")
+        self.assertEqual((result['error']['type'], len(translate.calls)), (errors.RATE_LIMITED, 3))
+
+    def test_a_retry_after_beyond_the_max_backoff_is_returned(self):
+        translate = scripted(rate_limited(600))
+        engine = self.engine(retry_backoff_max=60)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            result = engine.translate("Hello", "fr")
+        self.assertEqual((result['error']['retry_after'], len(translate.calls)), (600, 1))
+        self.assertEqual(self.clock.slept, [])
+
+    def test_later_calls_are_spaced_after_a_429(self):
+        translate = scripted(rate_limited(), ok())
+        engine = self.engine(max_retries=0, retry_backoff=1)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("One", "fr")
+            engine.translate("Two", "fr")
+            engine.translate("Three", "fr")
+        self.assertEqual(self.clock.slept, [1])
+
+    async def test_async_retries(self):
+        atranslate = ascripted(rate_limited(0.01), ok())
+        engine = TestTranslator(pk=1, name="test", retry_backoff=0.01)
+        with mock.patch.object(TestTranslator, "atranslate", atranslate):
+            result = await engine.atranslate("Hello", "fr")
+        self.assertEqual((result['text'], len(atranslate.calls)), ("translated", 2))
+
+
+def outage() -> dict:
+    return failed(errors.SERVER_ERROR, 500)
+
+
+class BreakerClockTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        patcher = mock.patch.object(breaker, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class CircuitBreakerStateTests(BreakerClockTestMixin, SimpleTestCase):
+    def test_opens_after_threshold_consecutive_outages(self):
+        circuit = CircuitBreaker(threshold=3, reset_timeout=30)
+        for error in (outage(), outage(), rate_limited(), outage(), outage()):
+            circuit.record(error['error'])
+        self.assertEqual(circuit.retry_after(), 0)
+        circuit.record(outage()['error'])
+        self.assertAlmostEqual(circuit.retry_after(), 30)
+
+    def test_lets_one_probe_through_after_the_timeout(self):
+        circuit = CircuitBreaker(threshold=1, reset_timeout=30)
+        circuit.record(outage()['error'])
+        self.clock.now += 30
+        self.assertEqual(circuit.retry_after(), 0)
+        self.assertAlmostEqual(circuit.retry_after(), 30)
+        circuit.record(None)
+        self.assertEqual((circuit.retry_after(), circuit.state), (0, breaker.CLOSED))
+
+    def test_a_failed_probe_opens_it_again(self):
+        circuit = CircuitBreaker(threshold=5, reset_timeout=30)
+        for _ in range(5):
+            circuit.record(outage()['error'])
+        self.clock.now += 30
+        circuit.retry_after()
+        circuit.record(outage()['error'])
+        self.assertAlmostEqual(circuit.retry_after(), 30)
+
+
+@override_settings(CACHES=CACHES)
+class CacheCircuitBreakerTests(BreakerClockTestMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["breakers"].clear()
+        self.first, self.second = (CacheCircuitBreaker("breakers", "engine", threshold=2, reset_timeout=30)
+                                   for _ in range(2))
+
+    def test_outages_of_all_processes_open_it_for_all(self):
+        self.first.record(outage()['error'])
+        self.second.record(outage()['error'])
+        self.assertAlmostEqual(self.first.retry_after(), 30)
+        self.assertAlmostEqual(self.second.retry_after(), 30)
+
+    def test_one_process_probes_and_its_success_closes_it(self):
+        self.first.record(outage()['error'])
+        self.second.record(outage()['error'])
+        caches["breakers"].delete(self.first.open_key)  # what expiry does after reset_timeout
+        self.assertEqual(self.first.retry_after(), 0)
+        self.assertEqual(self.second.retry_after(), 30)
+        self.first.record(None)
+        self.assertEqual((self.second.retry_after(), self.second.stats()['state']), (0, breaker.CLOSED))
+
+
+class BrokenEngineTests(BreakerClockTestMixin, EngineTestCase):
+    def test_calls_fail_fast_while_open_then_a_probe_closes_it(self):
+        translate = scripted(outage(), outage(), ok())
+        engine = self.engine(max_retries=0, breaker_threshold=2, breaker_reset_timeout=30)
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("One", "fr")
+            engine.translate("Two", "fr")
+            suspended = engine.translate("Three", "fr")
+            self.clock.now += 30
+            probe = engine.translate("Four", "fr")
+            closed = engine.translate("Five", "fr")
+        self.assertEqual(suspended['error']['type'], errors.CIRCUIT_OPEN)
+        self.assertAlmostEqual(suspended['error']['retry_after'], 30)
+        self.assertEqual((probe['text'], closed['text']), ("translated", "translated"))
+        self.assertEqual(translate.calls, ["One", "Two", "Four", "Five"])
+
+    def test_disabled_with_a_zero_threshold(self):
+        self.assertIsNone(breakers.get(self.engine(breaker_threshold=0)))
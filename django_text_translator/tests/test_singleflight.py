@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from .. import singleflight
+from ..models import TestTranslator
+from ..models.base import guarded
+from .utils import EngineTestCase, ok, scripted
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+    "flights": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "flights"},
+}
+
+
+class SingleFlightTests(SimpleTestCase):
+    def test_concurrent_calls_share_one_request(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def translate():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ok()
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(singleflight.do(b"key", translate)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(singleflight.do(b"key", translate)))
+                     for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        # Followers block on the leader's future, which nothing signals: give them time to get there.
+        time.sleep(0.2)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 4)
+
+
+@override_settings(CACHES=CACHES)
+class CacheLeaseTests(SimpleTestCase):
+    def setUp(self):
+        caches["flights"].clear()
+
+    def test_publishes_the_result_to_other_processes(self):
+        lease = singleflight.CacheLease("flights", timeout=5)
+        self.assertEqual(lease.do(b"key", ok)['text'], "translated")
+        self.assertEqual(caches["flights"].get(f"translator:flight:{b'key'.hex()}")['text'], "translated")
+
+    def test_expired_leader_keeps_the_lease_of_its_successor(self):
+        lease = singleflight.CacheLease("flights", timeout=5)
+        lease_key = f"translator:lease:{b'key'.hex()}"
+
+        def slow_translate():
+            # The lease expired during the call and another process took it over.
+            caches["flights"].set(lease_key, "successor", timeout=5)
+            return ok()
+
+        lease.do(b"key", slow_translate)
+        self.assertEqual(caches["flights"].get(lease_key), "successor")
+
+    def test_releases_its_own_lease(self):
+        lease = singleflight.CacheLease("flights", timeout=5)
+        lease.do(b"key", ok)
+        self.assertIsNone(caches["flights"].get(f"translator:lease:{b'key'.hex()}"))
+
+
+class GuardedSingleFlightTests(EngineTestCase):
+    def test_identical_engine_calls_send_one_request(self):
+        release = threading.Event()
+
+        def slow(text):
+            release.wait(5)
+            return ok()
+
+        translate = scripted(slow)
+        engine = self.engine()
+        results = []
+        with mock.patch.object(TestTranslator, "translate", translate):
+            threads = [threading.Thread(target=lambda: results.append(engine.translate("Hello", "fr")))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.2)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        self.assertEqual(translate.calls, ["Hello"])
+        self.assertEqual([result['text'] for result in results], ["translated"] * 4)
+
+    async def test_identical_async_calls_send_one_request(self):
+        async def slow(text):
+            await asyncio.sleep(0.1)
+            return ok()
+
+        calls = []
+
+        @guarded
+        async def atranslate(self, text, target_language):
+            calls.append(text)
+            return await slow(text)
+
+        engine = TestTranslator(pk=1, name="test")
+        with mock.patch.object(TestTranslator, "atranslate", atranslate):
+            results = await asyncio.gather(*[engine.atranslate("Hello", "fr") for _ in range(4)])
+        self.assertEqual(calls, ["Hello"])
+        self.assertEqual(len(results), 4)
+
+    @override_settings(TEXT_TRANSLATOR_SINGLE_FLIGHT=False)
+    def test_can_be_turned_off(self):
+        translate = scripted(ok())
+        engine = self.engine()
+        with mock.patch.object(TestTranslator, "translate", translate):
+            engine.translate("Hello", "fr")
+            engine.translate("Hello", "fr")
+        self.assertEqual(len(translate.calls), 2)
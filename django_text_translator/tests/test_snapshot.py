@@ -0,0 +1,69 @@
+import io
+import os
+import tempfile
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from .. import cache, snapshot
+from ..models import Translated_Content
+
+ROWS = [
+    (Translated_Content.make_hash(f"Text {i}", "fr"), f"Text {i}", "fr", f"Texte {i}", i, 6, "")
+    for i in range(50)
+]
+
+
+class SnapshotFileTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "translations.snap")
+
+    def test_record_round_trip(self):
+        row = (b"\x01" * 8, "Grüße", "de", "Salutations", 3, 5, "OpenAITranslator")
+        decoded, offset = snapshot.decode_record(snapshot.encode_record(*row))
+        self.assertEqual(decoded, row)
+        self.assertEqual(offset, len(snapshot.encode_record(*row)))
+
+    def test_stream_round_trip(self):
+        self.assertEqual(snapshot.write_stream(self.path, ROWS), 50)
+        self.assertEqual(list(snapshot.read_rows(self.path)), ROWS)
+
+    def test_indexed_round_trip(self):
+        self.assertEqual(snapshot.write_indexed(self.path, ROWS), 50)
+        self.assertEqual(list(snapshot.read_rows(self.path)), ROWS)
+
+    def test_store_finds_keys_in_the_index(self):
+        snapshot.write_indexed(self.path, reversed(ROWS))
+        store = snapshot.SnapshotStore(self.path)
+        self.addCleanup(store.close)
+        for key, original, language, translated, tokens, characters, namespace in ROWS:
+            self.assertEqual(store.get(key), {'text': translated, 'tokens': tokens, 'characters': characters})
+        self.assertIsNone(store.get(Translated_Content.make_hash("Missing", "fr")))
+        self.assertEqual((store.hits, store.misses), (50, 1))
+
+    def test_other_files_are_rejected(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot")
+        with self.assertRaises(ValueError):
+            list(snapshot.read_rows(self.path))
+        with self.assertRaises(ValueError):
+            snapshot.SnapshotStore(self.path)
+
+
+@override_settings(TEXT_TRANSLATOR_TRACK_HITS=False)
+class SnapshotStoreLookupTests(TestCase):
+    def test_lookups_fall_back_to_the_indexed_snapshot(self):
+        Translated_Content.bulk_store([("Hello", "fr", "Bonjour", 3, 5)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "translations.idx")
+            call_command("dump_translations", path, indexed=True, stdout=io.StringIO())
+            Translated_Content.objects.all().delete()
+            lru = cache.get_lru()
+            if lru is not None:
+                lru.clear()
+
+            with override_settings(TEXT_TRANSLATOR_SNAPSHOT_PATH=path):
+                self.addCleanup(snapshot.get_snapshot_store().close)
+                with self.assertNumQueries(0):
+                    hits, misses = Translated_Content.lookup_many(["Hello"], "fr")
+        self.assertEqual((hits["Hello"]['text'], misses), ("Bonjour", []))
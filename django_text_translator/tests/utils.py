@@ -0,0 +1,102 @@
+from django.test import TestCase
+from .. import cache, errors
+from ..breaker import breakers
+from ..clients import registry as client_registry
+from ..endpoints import pools
+from ..hedging import hedgers
+from ..models import TestTranslator
+from ..models.base import guarded
+from ..ratelimit import limiters
+from ..retry import throttles
+
+
+def ok(text: str = "translated") -> dict:
+    return {'text': text, 'tokens': 0, 'characters': len(text), 'error': None}
+
+
+def failed(kind: str, status: int = None, retry_after: float = None) -> dict:
+    return {'text': '', 'tokens': 0, 'characters': 0,
+            'error': errors.make_error(kind, f"{kind} from the test engine", status, retry_after)}
+
+
+def _answer(results: list, text: str) -> dict:
+    result = results.pop(0) if len(results) > 1 else results[0]
+    return dict(result(text) if callable(result) else result)
+
+
+def echo(text: str) -> dict:
+    return ok(f"<{text}>")
+
+
+def scripted(*results):
+    """
+    A guarded translate() for TestTranslator answering with `results` in turn (the last one repeats),
+    each a result dict or a function of the text returning one; the texts it was called with are kept in its `calls`.
+    """
+    results = list(results)
+    calls = []
+
+    @guarded
+    def translate(self, text, target_language):
+        calls.append(text)
+        return _answer(results, text)
+
+    translate.calls = calls
+    return translate
+
+
+def ascripted(*results):
+    """scripted() for atranslate()."""
+    results = list(results)
+    calls = []
+
+    @guarded
+    async def atranslate(self, text, target_language):
+        calls.append(text)
+        return _answer(results, text)
+
+    atranslate.calls = calls
+    return atranslate
+
+
+class FakeClock:
+    """Stands in for the `time` module of the module under test: sleeping moves the clock instead of waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class EngineTestCase(TestCase):
+    """
+    Test case for engine calls. The process-wide registries are keyed by engine pk, which the test
+    database reuses between tests, so they are emptied before and after every test.
+    """
+
+    def setUp(self):
+        self._reset()
+        self.addCleanup(self._reset)
+
+    @staticmethod
+    def _reset():
+        for registry, attribute in ((breakers, "_breakers"), (throttles, "_throttles"), (limiters, "_limiters"),
+                                    (hedgers, "_hedgers"), (pools, "_pools")):
+            setattr(registry, attribute, {})
+        client_registry.clear()
+        negative = cache.get_negative_cache()
+        if negative is not None:
+            negative.clear()
+
+    def engine(self, **fields):
+        fields.setdefault("name", "test")
+        return TestTranslator.objects.create(**fields)